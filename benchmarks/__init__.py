@@ -0,0 +1,11 @@
+"""
+성능 측정용 스크립트 모음. (배포 exe 에는 포함되지 않음)
+
+프로젝트 루트에서 모듈로 실행한다:
+    python -m benchmarks.bench_visual_len
+    python -m benchmarks.bench_pipeline --orders 10,1000,10000
+    python -m benchmarks.fake_api --orders 500 --latency 200   (쿠팡/고도몰 API 로컬 대역 서버)
+    python -m benchmarks.bench_import --budget-ms 150          (앱 모듈 import 시간 / 무거운 모듈 확인)
+
+synthetic.py 는 가짜 쿠팡/고도몰 응답 생성기 (벤치마크와 fake_api 서버에서 같이 쓴다).
+"""
@@ -0,0 +1,118 @@
+"""
+시작 시간(import 시간) 벤치마크.
+
+`python -X importtime` 으로 새 프로세스에서 앱 모듈을 import 해 보고
+- 전체 import 시간 (여러 번 중 최소값)
+- 누적 시간이 큰 모듈 상위 N개
+- import 만 했는데 올라오면 안 되는 무거운 모듈(openpyxl, requests ...)
+- import 중 바탕화면 폴더 생성 같은 부수 효과
+를 확인한다. 실행 파일(exe) 시작이 느려지지 않게 하려는 용도.
+
+    python -m benchmarks.bench_import [--repeat 5] [--top 15] [--budget-ms 150]
+
+--budget-ms 를 넘거나 무거운 모듈이 올라오면 종료 코드 1.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+TARGET = "src.halfetgetorder.app"
+
+# 앱 모듈 import 만으로는 올라오면 안 되는 모듈 (실제로 쓰는 단계에서만 import)
+HEAVY_MODULES = [
+    "openpyxl",
+    "requests",
+    "urllib3",
+    "dotenv",
+    "xmltodict",
+    "concurrent.futures.process",
+    "src.halfetgetorder.io_excel",
+    "src.halfetgetorder.client",
+]
+
+
+def _run_importtime(module: str, env: dict) -> list[tuple[int, int, str]]:
+    """(self_us, cumulative_us, 모듈명) 목록."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cum_us), name.rstrip()))
+    return rows
+
+
+def _loaded_modules(module: str, env: dict) -> set[str]:
+    code = f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return set(json.loads(proc.stdout))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="import 시간 벤치마크")
+    parser.add_argument("--module", default=TARGET)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None, help="전체 import 시간 상한 (ms)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    failed = False
+    with tempfile.TemporaryDirectory(prefix="bench_import_") as home:
+        # 가짜 HOME 에서 실행해서 import 중 바탕화면 폴더를 만드는지 확인
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+
+        runs = [_run_importtime(args.module, env) for _ in range(max(1, args.repeat))]
+        totals = []
+        for rows in runs:
+            target = [cum for _, cum, name in rows if name.strip() == args.module]
+            totals.append(target[-1] if target else 0)
+        best = min(range(len(runs)), key=lambda i: totals[i])
+
+        heavy = sorted(m for m in HEAVY_MODULES if m in _loaded_modules(args.module, env))
+        side_effects = sorted(os.listdir(home))
+
+    top = sorted(runs[best], key=lambda r: r[1], reverse=True)[: args.top]
+    total_ms = totals[best] / 1000
+
+    print(f"[INFO] {args.module} import: 최소 {total_ms:.1f}ms "
+          f"(중앙값 {sorted(totals)[len(totals) // 2] / 1000:.1f}ms, {len(totals)}회)")
+    print(f"  {'누적 ms':>8} {'자체 ms':>8}  모듈")
+    for self_us, cum_us, name in top:
+        print(f"  {cum_us / 1000:>8.1f} {self_us / 1000:>8.1f}  {name}")
+
+    if heavy:
+        failed = True
+        print("⚠️ import 만으로 무거운 모듈이 올라옵니다:", ", ".join(heavy))
+    if side_effects:
+        failed = True
+        print("⚠️ import 중에 HOME 아래 파일/폴더가 생겼습니다:", ", ".join(side_effects))
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failed = True
+        print(f"⚠️ import 시간 {total_ms:.1f}ms 가 기준 {args.budget_ms:.0f}ms 를 넘었습니다.")
+    if not failed:
+        print("✅ 무거운 모듈 / 부수 효과 없음")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "module": args.module,
+                "total_ms": total_ms,
+                "runs_ms": [t / 1000 for t in totals],
+                "top": [{"module": n.strip(), "cumulative_ms": c / 1000, "self_ms": s / 1000} for s, c, n in top],
+                "heavy_modules": heavy,
+                "side_effects": side_effects,
+            }, f, ensure_ascii=False, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+주문 → 엑셀 파이프라인 단계별 벤치마크.
+
+benchmarks.synthetic 으로 만든 가짜 쿠팡 발주서(JSON) / 고도몰 Order_Search(XML) 로
+API 호출 없이 각 단계의 소요 시간과 tracemalloc 최대 메모리를 잰다.
+
+    python -m benchmarks.bench_pipeline [--orders 10,1000,10000] [--output report.json]
+
+- 시간은 tracemalloc 없이 한 번, 메모리는 tracemalloc 을 켜고 한 번 더 돌려서 잰다.
+  (tracemalloc 을 켜면 시간이 몇 배로 늘어나므로 --no-memory 로 끌 수 있다)
+- 라벨 엑셀은 godo_base_specs 를 직접 넘겨서 고도몰 API / 사양 캐시를 건드리지 않는다.
+- 결과는 JSON 보고서로 저장해 커밋 간 비교에 쓴다.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import openpyxl
+
+from src.halfetgetorder import coupang, godo, godo_xml, io_excel, waybill
+from benchmarks import synthetic
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def _measure(fn, memory: bool) -> dict:
+    """fn() 한 번 실행: 시간(초), memory=True 면 tracemalloc 최대 메모리(MB)도."""
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    out = {"seconds": round(elapsed, 4)}
+    if memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        out["peak_mb"] = round(peak / 1024 / 1024, 2)
+    return out, result
+
+
+def _stages(cp_pages, godo_pages, base_specs, out_dir):
+    """
+    (단계 이름, 함수) 를 순서대로 yield.
+    각 함수는 앞 단계 결과를 state 에서 꺼내 쓰고 자기 결과를 state 에 넣는다.
+    """
+    state = {}
+
+    def parse_coupang():
+        orders = []
+        for page in cp_pages:
+            orders.extend(json.loads(page)["data"])
+        state["cp"] = orders
+        return len(orders)
+
+    def normalize():
+        return len(coupang.normalize_coupang_orders(state["cp"]))
+
+    def parse_godo():
+        state["godo_pages"] = [list(godo_xml.iter_order_page(p)) for p in godo_pages]
+        return sum(len(p) for p in state["godo_pages"])
+
+    def group():
+        state["gd"] = list(godo.iter_grouped_orders(state["godo_pages"]))
+        return len(state["gd"])
+
+    def orders_build():
+        state["orders_wb"], _ = io_excel.create_orders_workbook(state["cp"], state["gd"])
+
+    def orders_save():
+        state.pop("orders_wb").save(os.path.join(out_dir, "orders.xlsx"))
+
+    def orders_stream():
+        return io_excel.save_orders_workbook(os.path.join(out_dir, "orders_stream.xlsx"), state["cp"], state["gd"])
+
+    def label_build():
+        state["label_wb"], _ = io_excel.create_label_workbook(
+            state["cp"], state["gd"], godo_base_specs=base_specs,
+        )
+
+    def label_save():
+        state.pop("label_wb").save(os.path.join(out_dir, "label.xlsx"))
+
+    def waybill_build():
+        state["waybill_wb"], _ = io_excel.create_waybill_workbook(state["cp"])
+
+    def waybill_save():
+        state.pop("waybill_wb").save(os.path.join(out_dir, "waybill.xlsx"))
+
+    def waybill_lite():
+        return waybill.write_waybill_xlsx(os.path.join(out_dir, "waybill_lite.xlsx"), state["cp"])
+
+    yield "coupang.parse_json", parse_coupang
+    yield "coupang.normalize_coupang_orders", normalize
+    yield "godo_xml.iter_order_page", parse_godo
+    yield "godo.iter_grouped_orders", group
+    yield "io_excel.create_orders_workbook", orders_build
+    yield "orders wb.save", orders_save
+    yield "io_excel.save_orders_workbook", orders_stream
+    yield "io_excel.create_label_workbook", label_build
+    yield "label wb.save", label_save
+    yield "io_excel.create_waybill_workbook", waybill_build
+    yield "waybill wb.save", waybill_save
+    yield "waybill.write_waybill_xlsx", waybill_lite
+
+
+def run_scale(n: int, args, memory: bool) -> dict:
+    catalog = synthetic.goods_catalog(seed=args.seed)
+    cp_orders = synthetic.coupang_orders(
+        n, seed=args.seed, max_items=args.max_items, option_density=args.option_density,
+    )
+    gd_orders = synthetic.godo_orders(
+        n, seed=args.seed + 1, catalog=catalog, max_goods=args.max_items,
+        option_density=args.option_density, add_goods_density=args.add_goods_density,
+    )
+    cp_pages = list(synthetic.coupang_pages(cp_orders))
+    godo_pages = [
+        synthetic.godo_order_search_xml(gd_orders, page=p, size=100)
+        for p in range(1, max(1, -(-n // 100)) + 1)
+    ]
+    base_specs = synthetic.base_specs_map(catalog)
+    del cp_orders, gd_orders
+
+    stages = {}
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as out_dir:
+        for name, fn in _stages(cp_pages, godo_pages, base_specs, out_dir):
+            stats, result = _measure(fn, memory=False)
+            if isinstance(result, int):
+                stats["count"] = result
+            stages[name] = stats
+        if memory:
+            for name, fn in _stages(cp_pages, godo_pages, base_specs, out_dir):
+                stats, _ = _measure(fn, memory=True)
+                stages[name]["peak_mb"] = stats["peak_mb"]
+    return {
+        "orders": n,
+        "input_bytes": {
+            "coupang_json": sum(len(p.encode("utf-8")) for p in cp_pages),
+            "godo_xml": sum(len(p.encode("utf-8")) for p in godo_pages),
+        },
+        "stages": stages,
+    }
+
+
+def _print_table(result: dict) -> None:
+    print(f"\n[{result['orders']:,}건]")
+    print(f"  {'단계':<36}{'초':>10}{'최대 MB':>10}")
+    for name, s in result["stages"].items():
+        peak = s.get("peak_mb")
+        print(f"  {name:<36}{s['seconds']:>10.3f}{(f'{peak:.1f}' if peak is not None else '-'):>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주문 → 엑셀 파이프라인 벤치마크")
+    parser.add_argument("--orders", default="10,1000,10000",
+                        help="채널별 주문 수 (쉼표로 여러 개, 예: 10,1000,10000,100000)")
+    parser.add_argument("--max-items", type=int, default=3, help="주문당 최대 상품 수")
+    parser.add_argument("--option-density", type=float, default=0.7, help="옵션이 붙는 상품 비율")
+    parser.add_argument("--add-goods-density", type=float, default=0.5, help="고도몰 추가상품이 붙는 비율")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략")
+    parser.add_argument("--output", default=None,
+                        help="JSON 보고서 경로 (기본: bench_pipeline_YYYYMMDD_HHMMSS.json)")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.orders.split(",") if s.strip()]
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "openpyxl": openpyxl.__version__,
+        "params": {
+            "max_items": args.max_items,
+            "option_density": args.option_density,
+            "add_goods_density": args.add_goods_density,
+            "seed": args.seed,
+            "memory": not args.no_memory,
+        },
+        "results": [],
+    }
+    for n in scales:
+        result = run_scale(n, args, memory=not args.no_memory)
+        report["results"].append(result)
+        _print_table(result)
+
+    output = args.output or datetime.now().strftime("bench_pipeline_%Y%m%d_%H%M%S.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 보고서 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+utils.visual_len 마이크로 벤치마크.
+
+실제 주문내역 시트에 들어가는 값(상품명 + 옵션, 수취인, 금액, 배송메세지)과 비슷한
+문자열로 예전 구현(글자마다 unicodedata.east_asian_width)과 지금 구현을 비교한다.
+
+    python -m benchmarks.bench_visual_len [--rows 5000] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+import unicodedata
+
+from src.halfetgetorder import utils
+
+MODELS = [
+    "DeLL Latitude 5501", "LG 그램 17 17Z90N", "레노버 씽크패드 T480s",
+    "HP 엘리트북 840 G5", "삼성 갤럭시북 프로 NT950XDB", "Latitude 5520",
+]
+CPUS = ["Intel® Core™ i5-8350U", "Intel® Core™ i7-9850H", "i5 8세대", "i7 11세대"]
+OPTIONS = [
+    "등급: S급\n색상: 블랙", "램 16G 교체", "SSD 512G 업그레이드",
+    "+ 메모리 8G→16G로 UP↑", "+ 윈도우 복구 프로그램", "키스킨 포함",
+]
+MEMOS = ["문 앞에 놔주세요", "부재시 경비실에 맡겨주세요", "", "배송 전 연락 바랍니다"]
+NAMES = ["홍길동", "김철수", "이영희", "박민수", "최지우"]
+
+
+def legacy_visual_len(s):
+    """예전 구현 (비교용)."""
+    if s is None:
+        return 0
+    total = 0
+    for ch in str(s):
+        ea = unicodedata.east_asian_width(ch)
+        total += 2 if ea in ('W', 'F', 'A') else 1
+    return total
+
+
+def sample_values(rows: int, seed: int = 1) -> list:
+    """주문내역 시트 rows 행 분량의 셀 값 (같은 상품명이 자주 반복됨)."""
+    rnd = random.Random(seed)
+    values = []
+    for i in range(rows):
+        model = rnd.choice(MODELS)
+        values += [
+            "쿠팡" if i % 3 else "고도몰",
+            f"2026.10.{rnd.randint(1, 28):02d} {rnd.randint(0, 23):02d}:{rnd.randint(0, 59):02d}",
+            f"{rnd.randint(20, 200) * 10000:,}원",
+            "",
+            rnd.choice(NAMES) + str(rnd.randint(1, 99)),
+            f"{model} / {rnd.choice(CPUS)} / {rnd.choice(OPTIONS)}",
+            rnd.randint(1, 3),
+            model,
+            rnd.choice(MEMOS),
+        ]
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="visual_len 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    values = sample_values(args.rows)
+    assert [legacy_visual_len(v) for v in values] == [utils.visual_len(v) for v in values]
+
+    def run(fn):
+        return lambda: [fn(v) for v in values]
+
+    def cold():
+        utils._visual_len_str.cache_clear()
+        for v in values:
+            utils.visual_len(v)
+
+    utils.visual_len("가")   # 글자 폭 표 미리 생성
+    results = {
+        "legacy": min(timeit.repeat(run(legacy_visual_len), number=1, repeat=args.repeat)),
+        "new (캐시 없음)": min(timeit.repeat(cold, number=1, repeat=args.repeat)),
+        "new (캐시 사용)": min(timeit.repeat(run(utils.visual_len), number=1, repeat=args.repeat)),
+    }
+
+    base = results["legacy"]
+    print(f"셀 값 {len(values):,}개 ({args.rows:,}행), 최소 {args.repeat}회 기준")
+    for name, sec in results.items():
+        pad = " " * (18 - utils.visual_len(name))
+        print(f"  {name}{pad}{sec * 1000:8.2f} ms   x{base / sec:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
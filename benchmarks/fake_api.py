@@ -0,0 +1,266 @@
+"""
+쿠팡 / 고도몰 API 로컬 대역 서버.
+
+실제 키나 네트워크 없이 coupang.fetch_orders / godo.fetch_orders /
+godo.fetch_goods_base_specs 를 돌려볼 수 있게 같은 경로로 응답을 흉내 낸다.
+
+- 쿠팡   : GET  /v2/providers/openapi/apis/api/v4/vendors/<vendorId>/ordersheets  (nextToken 페이지)
+- 고도몰 : POST /godomall5/order/Order_Search.php  (page/size, header.max_page)
+           GET  /godomall5/goods/Goods_Search.php  (goodsNo)
+
+응답 데이터는 benchmarks.synthetic 으로 만들거나 녹화해 둔 응답 파일을 그대로 쓴다.
+지연(latency/jitter), 오류율(5xx), 응답 인코딩(utf-8/cp949), 엔드포인트별 초당 한도(429)를 바꿔서
+동시 호출 / 캐시 / 재시도 / 속도 제한 동작을 오프라인으로 부하 테스트할 수 있다.
+
+    python -m benchmarks.fake_api --port 8765 --orders 500 --latency 200 --error-rate 0.05
+
+앱은 .env(또는 환경변수)에 아래처럼 주소만 바꿔서 실행한다:
+    COUPANG_BASE_URL=http://127.0.0.1:8765
+    GODO_BASE_URL=http://127.0.0.1:8765
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks import synthetic
+
+COUPANG_PATH = re.compile(r"^/v2/providers/openapi/apis/api/v4/vendors/[^/]+/ordersheets$")
+ORDER_SEARCH_PATH = "/godomall5/order/Order_Search.php"
+GOODS_SEARCH_PATH = "/godomall5/goods/Goods_Search.php"
+
+
+class FakeApi:
+    """서버가 내려줄 데이터와 지연/오류 설정."""
+
+    def __init__(
+        self,
+        coupang_orders: list[dict],
+        godo_orders: list[dict],
+        catalog: list[dict],
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        encoding: str = "utf-8",
+        rate_limit: float = 0,
+        seed: int | None = None,
+    ):
+        self.coupang_orders = coupang_orders
+        self.godo_orders = godo_orders
+        self.goods = {g["goodsNo"]: g for g in catalog}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.encoding = encoding
+        self.rate_limit = rate_limit    # 엔드포인트별 초당 허용 요청 수 (0 이면 무제한)
+        self._recent: dict[str, deque] = {}
+        self.stats: Counter = Counter()
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            jitter = self._rnd.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._rnd.random() < self.error_rate
+
+    def over_quota(self, name: str) -> bool:
+        """최근 1초 동안 name 요청이 rate_limit 개를 넘었는지 (넘은 요청은 세지 않음)."""
+        if self.rate_limit <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent.setdefault(name, deque())
+            while recent and now - recent[0] >= 1.0:
+                recent.popleft()
+            if len(recent) >= self.rate_limit:
+                return True
+            recent.append(now)
+            return False
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    # ─── 응답 본문 ───
+    def ordersheets(self, query: dict) -> str:
+        size = int(query.get("maxPerPage", ["50"])[0])
+        start = int(query.get("nextToken", ["0"])[0] or 0)
+        page = self.coupang_orders[start:start + size]
+        next_start = start + size
+        return json.dumps({
+            "code": 200,
+            "message": "OK",
+            "data": page,
+            "nextToken": str(next_start) if next_start < len(self.coupang_orders) else "",
+        }, ensure_ascii=False)
+
+    def order_search(self, query: dict) -> str:
+        page = int(query.get("page", ["1"])[0])
+        size = int(query.get("size", ["100"])[0])
+        return synthetic.godo_order_search_xml(self.godo_orders, page=page, size=size)
+
+    def goods_search(self, query: dict) -> str:
+        goods_no = query.get("goodsNo", [""])[0]
+        return synthetic.godo_goods_search_xml(self.goods.get(goods_no))
+
+
+def _handler(api: FakeApi):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive (client 세션 재사용 확인용)
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, status: int, body: str, content_type: str, headers: dict | None = None) -> None:
+            data = body.encode(api.encoding)
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Type", f"{content_type}; charset={api.encoding}")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _route(self):
+            parts = urllib.parse.urlsplit(self.path)
+            query = urllib.parse.parse_qs(parts.query)
+            if self.command == "POST":
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    query.update(urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8")))
+
+            if COUPANG_PATH.match(parts.path):
+                return "ordersheets", lambda: (api.ordersheets(query), "application/json")
+            if parts.path == ORDER_SEARCH_PATH:
+                return "Order_Search", lambda: (api.order_search(query), "text/xml")
+            if parts.path == GOODS_SEARCH_PATH:
+                return "Goods_Search", lambda: (api.goods_search(query), "text/xml")
+            return None, None
+
+        def _handle(self):
+            name, build = self._route()
+            if name is None:
+                self._send(404, "not found", "text/plain")
+                return
+
+            if api.over_quota(name):
+                api.count(f"{name} 429")
+                self._send(429, "too many requests", "text/plain", {"Retry-After": "1"})
+                return
+
+            time.sleep(api.delay())
+            if api.should_fail():
+                api.count(f"{name} {api.error_status}")
+                self._send(api.error_status, "injected error", "text/plain")
+                return
+
+            api.count(name)
+            body, content_type = build()
+            self._send(200, body, content_type)
+
+        do_GET = _handle
+        do_POST = _handle
+
+    return Handler
+
+
+def start_server(api: FakeApi, host: str = "127.0.0.1", port: int = 0):
+    """
+    백그라운드 스레드에서 서버를 띄운다. (port=0 이면 빈 포트 자동 선택)
+    반환: (server, base_url) — 다 쓰면 server.shutdown()
+    """
+    server = ThreadingHTTPServer((host, port), _handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-api", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def _load_coupang(path: str) -> list[dict]:
+    """녹화해 둔 ordersheets 응답(JSON, data 또는 content 배열)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("data") or data.get("content") or []
+
+
+def _load_godo(path: str) -> list[dict]:
+    """녹화해 둔 Order_Search 응답(XML)."""
+    from src.halfetgetorder import godo_xml
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.decode("cp949")
+    return list(godo_xml.iter_order_page(text))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿠팡/고도몰 API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--orders", type=int, default=100, help="채널별 가짜 주문 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--coupang-json", help="녹화한 ordersheets 응답 파일 (없으면 가짜 주문)")
+    parser.add_argument("--godo-xml", help="녹화한 Order_Search 응답 파일 (없으면 가짜 주문)")
+    parser.add_argument("--latency", type=float, default=0, help="응답마다 기본 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="추가 지연 0~jitter(ms) 무작위")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--encoding", default="utf-8", choices=["utf-8", "cp949"])
+    parser.add_argument("--rate-limit", type=float, default=0, help="엔드포인트별 초당 허용 요청 수 (넘으면 429, 0 이면 무제한)")
+    args = parser.parse_args(argv)
+
+    catalog = synthetic.goods_catalog(seed=args.seed)
+    api = FakeApi(
+        coupang_orders=(
+            _load_coupang(args.coupang_json) if args.coupang_json
+            else synthetic.coupang_orders(args.orders, seed=args.seed)
+        ),
+        godo_orders=(
+            _load_godo(args.godo_xml) if args.godo_xml
+            else synthetic.godo_orders(args.orders, seed=args.seed + 1, catalog=catalog)
+        ),
+        catalog=catalog,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        encoding=args.encoding,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+
+    server = ThreadingHTTPServer((args.host, args.port), _handler(api))
+    server.daemon_threads = True
+    base_url = f"http://{args.host}:{server.server_address[1]}"
+    print(f"✅ 가짜 API 서버 실행 중: {base_url}")
+    print(f"   쿠팡 {len(api.coupang_orders)}건 / 고도몰 {len(api.godo_orders)}건 / 상품 {len(api.goods)}개")
+    print(f"   COUPANG_BASE_URL={base_url}")
+    print(f"   GODO_BASE_URL={base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n[요청 수]")
+        for key, n in sorted(api.stats.items()):
+            print(f"  {key:<24}{n:>8}")
+
+
+if __name__ == "__main__":
+    main()
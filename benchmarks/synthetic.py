@@ -0,0 +1,276 @@
+"""
+벤치마크 / 로컬 테스트용 가짜 주문 데이터 생성기.
+
+- 쿠팡 ordersheets 응답(JSON)  : coupang_orders(), coupang_pages()
+- 고도몰 Order_Search 응답(XML) : godo_orders(), godo_order_search_xml()
+- 고도몰 Goods_Search 응답(XML) : godo_goods_search_xml()
+
+실제 응답과 같은 필드 이름/모양을 쓰고, 같은 seed 면 항상 같은 데이터를 만든다.
+주문당 상품 수, 옵션 비율, 추가상품 비율을 바꿔서 여러 모양의 하루치 주문을 흉내 낸다.
+"""
+import json
+import random
+from datetime import datetime, timedelta
+
+MODELS = [
+    ("DeLL Latitude 5501", "Intel® Core™ i7-9850H", "NVIDIA GeForce MX150"),
+    ("DeLL Latitude 5520", "Intel® Core™ i5-1145G7", "Intel Iris Xe"),
+    ("LG 그램 17 17Z90N", "Intel® Core™ i5-1035G7", "Intel Iris Plus"),
+    ("레노버 씽크패드 T480s", "Intel® Core™ i5-8350U", "Intel UHD 620"),
+    ("HP 엘리트북 840 G5", "Intel® Core™ i7-8650U", "Intel UHD 620"),
+    ("삼성 갤럭시북 프로 NT950XDB", "Intel® Core™ i7-1165G7", "Intel Iris Xe"),
+]
+SSDS = ["NVMe SSD 256G", "NVMe SSD 512G", "SSD 1TB"]
+RAMS = ["DDR4 8G", "DDR4 16G", "DDR4 32G"]
+GRADES = ["S급", "A급", "B급"]
+COLORS = ["블랙", "실버", "그레이"]
+ADD_GOODS = [
+    ("+ 메모리 8G→16G로 UP↑", 50000),
+    ("+ SSD 512G 업그레이드", 60000),
+    ("+ 윈도우 복구 프로그램", 10000),
+    ("키보드 키스킨", 5000),
+    ("무선 마우스", 8000),
+]
+LAST_NAMES = "김이박최정강조윤장임"
+FIRST_NAMES = ["민수", "지우", "서연", "도윤", "하은", "준호", "영희", "철수"]
+MEMOS = ["", "문 앞에 놔주세요", "부재시 경비실에 맡겨주세요", "배송 전 연락 바랍니다",
+         "파손 주의 부탁드립니다. 노트북이라 조심히 다뤄주세요."]
+CITIES = ["서울특별시 강남구 테헤란로", "경기도 성남시 분당구 판교역로", "부산광역시 해운대구 센텀중앙로",
+          "대구광역시 수성구 달구벌대로", "인천광역시 연수구 송도과학로"]
+
+BASE_GOODS_NO = 1000000100
+
+
+def goods_catalog(size: int = 40, seed: int = 7) -> list[dict]:
+    """고도몰 상품 목록 (goodsNo, goodsCd, goodsNm, shortDescription)."""
+    rnd = random.Random(seed)
+    catalog = []
+    for i in range(size):
+        model, cpu, gpu = MODELS[i % len(MODELS)]
+        ssd, ram = rnd.choice(SSDS), rnd.choice(RAMS)
+        catalog.append({
+            "goodsNo": str(BASE_GOODS_NO + i),
+            "goodsCd": model.split(" ", 1)[-1],
+            "goodsNm": f"[중고] {model} {ram.split()[-1]} {ssd.split()[-1]}",
+            "goodsPrice": rnd.randrange(250_000, 900_000, 10_000),
+            # 기본 사양: '/' 로 나눈 3번째 = SSD, 4번째 = RAM
+            "shortDescription": f"{model} / {cpu} / {gpu} / {ssd} / {ram} / FHD 1920×1080 해상도 (15.6인치) / 윈도우11",
+            "ram": ram,
+            "ssd": ssd,
+        })
+    return catalog
+
+
+def base_specs_map(catalog: list[dict]) -> dict[str, tuple[str, str]]:
+    """create_label_workbook(godo_base_specs=...) 에 넘길 {goodsNo: (ram, ssd)}."""
+    return {g["goodsNo"]: (g["ram"], g["ssd"]) for g in catalog}
+
+
+def _person(rnd):
+    return rnd.choice(LAST_NAMES) + rnd.choice(FIRST_NAMES)
+
+
+def _phone(rnd, prefix="010"):
+    return f"{prefix}-{rnd.randint(1000, 9999)}-{rnd.randint(1000, 9999)}"
+
+
+def _ordered_at(rnd, day: datetime):
+    return day - timedelta(minutes=rnd.randint(0, 7 * 24 * 60))
+
+
+# ─────────────────────────────────────────────────────────
+# 쿠팡
+# ─────────────────────────────────────────────────────────
+def coupang_orders(
+    n: int,
+    seed: int = 1,
+    max_items: int = 3,
+    option_density: float = 0.7,
+    rental_ratio: float = 0.02,
+    now: datetime | None = None,
+) -> list[dict]:
+    """
+    쿠팡 발주서(ordersheets data[]) n건.
+    - max_items: 주문당 상품 수 1~max_items
+    - option_density: 상품에 옵션명(sellerProductItemName)이 붙는 비율
+    - rental_ratio: 렌탈 상품 주문 비율 (app 에서 걸러지는 주문)
+    """
+    rnd = random.Random(seed)
+    now = now or datetime(2026, 10, 17, 18, 0, 0)
+    orders = []
+    for i in range(n):
+        rental = rnd.random() < rental_ratio
+        items = []
+        for j in range(rnd.randint(1, max_items)):
+            model, cpu, _ = rnd.choice(MODELS)
+            name = f"[리퍼] {model} 노트북" + (" 렌탈" if rental else "")
+            option = (
+                f"{cpu.split('™')[-1].strip()} / {rnd.choice(RAMS)} / {rnd.choice(SSDS)} / 윈도우11"
+                if rnd.random() < option_density else ""
+            )
+            items.append({
+                "vendorItemId": 7000000000 + i * 10 + j,
+                "vendorItemName": f"{name}, {option}" if option else name,
+                "sellerProductName": name,
+                "sellerProductItemName": option,
+                "shippingCount": rnd.choice([1, 1, 1, 2]),
+                "orderPrice": rnd.randrange(300_000, 1_200_000, 1000),
+            })
+        orders.append({
+            "shipmentBoxId": 600000000000 + i,
+            "orderId": 2000000000000 + i,
+            "orderedAt": _ordered_at(rnd, now).strftime("%Y-%m-%dT%H:%M:%S"),
+            "status": "ACCEPT",
+            "orderer": {"name": _person(rnd), "email": "", "safeNumber": _phone(rnd, "0503")},
+            "receiver": {
+                "name": _person(rnd),
+                "safeNumber": _phone(rnd, "0504"),
+                "addr1": rnd.choice(CITIES),
+                "addr2": f"{rnd.randint(1, 300)}동 {rnd.randint(101, 2504)}호",
+                "zipCode": f"{rnd.randint(1000, 63999):05d}",
+            },
+            "shippingAddress": None,
+            "orderItems": items,
+            "parcelPrintMessage": rnd.choice(MEMOS),
+        })
+        # 실제 응답처럼 수령인 정보가 shippingAddress 에 오는 경우도 섞는다
+        if i % 2 == 0:
+            r = orders[-1]["receiver"]
+            orders[-1]["shippingAddress"] = {
+                "name": r["name"], "safeNumber": r["safeNumber"],
+                "address1": r["addr1"], "address2": r["addr2"], "zipcode": r["zipCode"],
+            }
+    return orders
+
+
+def coupang_pages(orders: list[dict], max_per_page: int = 50):
+    """
+    ordersheets 응답 JSON 문자열을 페이지 단위로 yield (nextToken 으로 이어짐).
+    """
+    for start in range(0, max(len(orders), 1), max_per_page):
+        page = orders[start:start + max_per_page]
+        next_start = start + max_per_page
+        yield json.dumps({
+            "code": 200,
+            "message": "OK",
+            "data": page,
+            "nextToken": str(next_start) if next_start < len(orders) else "",
+        }, ensure_ascii=False)
+
+
+# ─────────────────────────────────────────────────────────
+# 고도몰
+# ─────────────────────────────────────────────────────────
+def godo_orders(
+    n: int,
+    seed: int = 2,
+    catalog: list[dict] | None = None,
+    max_goods: int = 2,
+    option_density: float = 0.8,
+    add_goods_density: float = 0.5,
+    safe_number_ratio: float = 0.3,
+    now: datetime | None = None,
+) -> list[dict]:
+    """
+    고도몰 Order_Search order_data n건 (xmltodict/godo_xml 결과와 같은 dict 모양).
+    - max_goods: 주문당 본상품 수 1~max_goods
+    - option_density: 본상품에 optionInfo 가 있는 비율
+    - add_goods_density: 본상품마다 추가상품(addGoodsData)이 붙을 확률 (붙으면 1~3개)
+    """
+    rnd = random.Random(seed)
+    catalog = catalog or goods_catalog()
+    now = now or datetime(2026, 10, 17, 18, 0, 0)
+    orders = []
+    for i in range(n):
+        parents, adds = [], []
+        for _ in range(rnd.randint(1, max_goods)):
+            goods = rnd.choice(catalog)
+            parent = {
+                "goodsNo": goods["goodsNo"],
+                "goodsCd": goods["goodsCd"],
+                "goodsNm": goods["goodsNm"],
+                "goodsCnt": str(rnd.choice([1, 1, 1, 2])),
+                "goodsPrice": f"{goods['goodsPrice']:.2f}",
+                "optionInfo": None,
+            }
+            if rnd.random() < option_density:
+                parent["optionInfo"] = json.dumps(
+                    [["등급", rnd.choice(GRADES), None, "0.00"],
+                     ["색상", rnd.choice(COLORS), None, "0.00"]],
+                    ensure_ascii=False,
+                )
+            parents.append(parent)
+
+            if rnd.random() < add_goods_density:
+                for name, price in rnd.sample(ADD_GOODS, rnd.randint(1, 3)):
+                    adds.append({
+                        "parentGoodsNo": goods["goodsNo"],
+                        "goodsNm": name,
+                        "goodsCnt": "1",
+                        "goodsPrice": f"{price:.2f}",
+                    })
+
+        safe = rnd.random() < safe_number_ratio
+        orders.append({
+            "orderNo": str(2610170000000 + i),
+            "orderDate": _ordered_at(rnd, now).strftime("%Y-%m-%d %H:%M:%S"),
+            "orderStatus": "p1",
+            "orderInfoData": {
+                "receiverName": _person(rnd),
+                "receiverPhone": _phone(rnd, "02"),
+                "receiverCellPhone": _phone(rnd),
+                "receiverUseSafeNumberFl": "y" if safe else "n",
+                "receiverSafeNumber": _phone(rnd, "0505") if safe else None,
+                "receiverZonecode": f"{rnd.randint(1000, 63999):05d}",
+                "receiverAddress": rnd.choice(CITIES),
+                "receiverAddressSub": f"{rnd.randint(1, 300)}동 {rnd.randint(101, 2504)}호",
+                "orderMemo": rnd.choice(MEMOS),
+            },
+            "orderGoodsData": parents,
+            "addGoodsData": adds,
+        })
+    return orders
+
+
+def _xml_value(tag: str, value) -> str:
+    if value is None or value == "":
+        return f"<{tag}></{tag}>"
+    if isinstance(value, dict):
+        return f"<{tag}>" + "".join(_xml_value(k, v) for k, v in value.items()) + f"</{tag}>"
+    if isinstance(value, list):
+        return "".join(_xml_value(tag, v) for v in value)
+    # 고도몰 응답은 문자열 값을 CDATA 로 감싼다
+    return f"<{tag}><![CDATA[{value}]]></{tag}>"
+
+
+def godo_order_search_xml(orders: list[dict], page: int = 1, size: int = 100) -> str:
+    """Order_Search 응답 XML 한 페이지 (header 의 max_page/now_page 포함)."""
+    total = len(orders)
+    max_page = max(1, -(-total // size))
+    chunk = orders[(page - 1) * size:page * size]
+    header = {"code": "000", "msg": "", "total": str(total),
+              "max_page": str(max_page), "now_page": str(page)}
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<data>'
+        + _xml_value("header", header)
+        + "<return>"
+        + "".join(_xml_value("order_data", od) for od in chunk)
+        + "</return></data>"
+    )
+
+
+def godo_goods_search_xml(goods: dict | None) -> str:
+    """Goods_Search 응답 XML (상품 하나, 없으면 빈 결과)."""
+    body = ""
+    if goods is not None:
+        body = _xml_value("goods_data", {
+            "goodsNo": goods["goodsNo"],
+            "goodsCd": goods["goodsCd"],
+            "goodsNm": goods["goodsNm"],
+            "shortDescription": goods["shortDescription"],
+        })
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<data>'
+        + _xml_value("header", {"code": "000", "msg": ""})
+        + f"<return>{body}</return></data>"
+    )
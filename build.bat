@@ -116,8 +116,8 @@ IF NOT EXIST "%ICON_PATH%" (
     goto MENU
 )
 
-REM PyInstaller 빌드
-%PYINSTALLER_CMD% --onefile --name "%INTERNAL_NAME%" --icon="%ICON_PATH%" entry.py
+REM PyInstaller 빌드 (resources: 엑셀 서식 템플릿 등 → config.resource_path)
+%PYINSTALLER_CMD% --onefile --name "%INTERNAL_NAME%" --icon="%ICON_PATH%" --add-data "src\halfetgetorder\resources;halfetgetorder\resources" entry.py
 
 IF ERRORLEVEL 1 (
     echo.
@@ -1,5 +1,9 @@
 # entry.py
+import multiprocessing
+
 from src.halfetgetorder.app import main
 
 if __name__ == "__main__":
+    # exe(PyInstaller)에서 엑셀 생성용 워커 프로세스를 띄울 때 필요
+    multiprocessing.freeze_support()
     main()
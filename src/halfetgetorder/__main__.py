@@ -1,4 +1,8 @@
+import multiprocessing
+
 from .app import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # exe(PyInstaller)에서 엑셀 생성용 워커 프로세스를 띄울 때 필요
+    multiprocessing.freeze_support()
+    main()
@@ -1,14 +1,13 @@
-import os, json
+import os, json, argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from .config import DATA_DIR
-from . import godo, coupang
-from .io_excel import (
-    create_orders_workbook,   # ✅ 주문수집 엑셀 한 번에 만드는 헬퍼
-    create_waybill_workbook,
-    create_label_workbook,
-)
+from . import config, godo, coupang, sync, order_store, render, metrics
+from .run_report import RunReport
 
-today = date.today().strftime("%Y%m%d")
+
+def _today():
+    """파일 이름에 붙는 날짜 (--watch 로 자정을 넘겨도 새 날짜로 저장되도록 쓸 때마다 계산)."""
+    return date.today().strftime("%Y%m%d")
 
 
 def _is_rental_order(od):
@@ -36,12 +35,278 @@ def _is_rental_order(od):
     return False
 
 
-def main():
+def _save_to_store(channel, orders):
+    """조회 결과를 로컬 주문 저장소에 upsert (실패해도 이번 실행은 계속)."""
+    try:
+        order_store.save_orders(channel, orders)
+    except Exception as e:
+        print(f"⚠️ {channel} 주문 저장소 저장 실패:", e)
+
+
+def _fetch_coupang_orders(report, status=None):
+    """
+    쿠팡 주문을 페이지 단위로 받으면서 렌탈/대여/임대 주문을 바로 걸러낸다.
+    (마지막 페이지를 기다리지 않고 받은 페이지부터 필터링)
+
+    증분 모드면 지난 동기화 이후 주문만 받아서 이전 결과에 합친다.
+    status(dict)를 넘기면 마지막 페이지까지 다 받았을 때 status["complete"] = True
+    """
+    started_at = datetime.now()
+    created_from, created_to, full = sync.plan_window("coupang", started_at)
+    status = {} if status is None else status
+
+    filtered_orders = []
+    for page in coupang.iter_order_pages(created_from, created_to, status=status):
+        with report.stage("쿠팡 렌탈 제외"):
+            kept = [od for od in page if not _is_rental_order(od)]
+        report.count("쿠팡 수신", len(page))
+        report.count("렌탈 제외", len(page) - len(kept))
+        filtered_orders.extend(kept)
+
+    # 끝까지 받지 못했으면 이번에 오지 않은 주문을 '목록에서 빠짐'으로 보지 않는다
+    dropped_from = created_from if status.get("complete") else None
+    filtered_orders = sync.merge_orders("coupang", filtered_orders, full, started_at, dropped_from)
+    # 일부 페이지만 받았으면 저장소의 마지막 정상 결과(--from-store 복구용)를 덮어쓰지 않는다
+    if status.get("complete"):
+        _save_to_store("coupang", filtered_orders)
+        sync.mark_synced("coupang", started_at, full)
+    return filtered_orders
+
+
+def _fetch_godo_orders(report, status=None):
+    """
+    고도몰 주문을 페이지 단위로 받으면서 바로 세트 구조(group_sets 형태)로 묶는다.
+
+    증분 모드면 지난 동기화 이후 주문만 받아서 이전 결과에 합친다.
+    status(dict)를 넘기면 마지막 페이지까지 다 받았을 때 status["complete"] = True
+    """
+    started_at = datetime.now()
+    created_from, created_to, full = sync.plan_window("godo", started_at)
+    status = {} if status is None else status
+
+    grouped = []
+    for page in godo.iter_order_pages(created_from, created_to, status=status):
+        with report.stage("고도몰 세트 묶기"):
+            grouped.extend(godo.iter_grouped_orders([page]))
+        report.count("고도몰 수신", len(page))
+
+    # 끝까지 받지 못했으면 이번에 오지 않은 주문을 '목록에서 빠짐'으로 보지 않는다
+    dropped_from = created_from if status.get("complete") else None
+    grouped = sync.merge_orders("godo", grouped, full, started_at, dropped_from)
+    # 일부 페이지만 받았으면 저장소의 마지막 정상 결과(--from-store 복구용)를 덮어쓰지 않는다
+    if status.get("complete"):
+        _save_to_store("godo", grouped)
+        sync.mark_synced("godo", started_at, full)
+    return grouped
+
+
+def _timed_fetch(report, name, fetch, status):
+    """채널 조회 한 번 (걸린 시간은 report 에 '<name> 조회' 로 기록)."""
+    with report.stage(f"{name} 조회"):
+        return fetch(report, status)
+
+
+def _fetch_all_channels(report, complete=None):
+    """
+    쿠팡 / 고도몰 주문을 동시에 조회한다.
+
+    - 두 채널 API 를 각각 별도 스레드에서 호출하고 둘 다 끝날 때까지 기다린다.
+      (전체 소요 시간 = 두 API 중 느린 쪽)
+    - 한 채널에서 예외가 나도 다른 채널 결과는 그대로 사용한다.
+
+    반환: (filtered_orders, grouped, godo_ok)
+      - filtered_orders: 렌탈 주문을 제외한 쿠팡 주문 리스트
+      - grouped: 고도몰 주문 세트 구조 리스트
+
+    complete(dict)를 넘기면 채널별로 오류 없이 마지막 페이지까지 받았는지를
+    complete["coupang"], complete["godo"] 에 남긴다. (--watch 는 둘 다 True 일 때만 엑셀을 바꾼다)
+    """
+    cp_status, godo_status = {}, {}
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch") as pool:
+        cp_future = pool.submit(_timed_fetch, report, "쿠팡", _fetch_coupang_orders, cp_status)
+        godo_future = pool.submit(_timed_fetch, report, "고도몰", _fetch_godo_orders, godo_status)
+
+    try:
+        filtered_orders = cp_future.result()
+        coupang_ok = True
+    except Exception as e:
+        print("❌ 쿠팡 주문 조회 중 오류:", repr(e))
+        filtered_orders = []
+        coupang_ok = False
+
+    try:
+        grouped = godo_future.result()
+        godo_ok = True
+    except Exception as e:
+        print("❌ 고도몰 주문 조회 중 오류:", repr(e))
+        grouped = []
+        godo_ok = False
+
+    if complete is not None:
+        complete["coupang"] = coupang_ok and bool(cp_status.get("complete"))
+        complete["godo"] = godo_ok and bool(godo_status.get("complete"))
+    return filtered_orders, grouped, godo_ok
+
+
+def _prefetch_base_specs(report, grouped, **kwargs):
+    """라벨용 고도몰 기본 RAM/SSD 미리 조회 (prefetch 스레드에서 실행)."""
+    with report.stage("기본 사양 조회"):
+        return godo.prefetch_goods_base_specs(grouped, **kwargs)
+
+
+def _start_prefetch(report, grouped, pool=None, **kwargs):
+    """
+    기본 사양 조회를 시작하고 Future 를 반환한다.
+    pool 을 주면 그 스레드 풀에서 돌리고 닫지 않는다 (--watch 에서 재사용).
+    """
+    if pool is not None:
+        return pool.submit(_prefetch_base_specs, report, grouped, **kwargs)
+    spec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+    future = spec_pool.submit(_prefetch_base_specs, report, grouped, **kwargs)
+    spec_pool.shutdown(wait=False)
+    return future
+
+
+def _render_outputs(report, filtered_orders, grouped, base_specs_future, profile=False, pool=None):
+    """
+    주문수집 / 대한통운 송장등록 / 라벨출력 엑셀을 만든다. (render.render_outputs 참고)
+
+    - filtered_orders: 렌탈 제외된 쿠팡 주문 리스트
+    - grouped: 고도몰 세트 구조 리스트
+    - base_specs_future: 고도몰 기본 RAM/SSD 미리 조회 결과(Future)
+    - profile: 프로파일링 중이면 워커 프로세스 없이 이 프로세스에서 만든다
+    - pool: 재사용할 엑셀 생성용 프로세스 풀 (render.open_pool, --watch 용)
+    """
+    report.count("쿠팡 주문", len(filtered_orders))
+    report.count("고도몰 주문", len(grouped))
+    report.count("고도몰 상품 줄", sum(
+        1 + len(s.get("children") or [])
+        for grp in grouped for s in grp.get("sets", [])
+    ))
+
+    with report.stage("엑셀 생성"):
+        results = render.render_outputs(
+            filtered_orders, grouped, base_specs_future, _today(),
+            max_workers=1 if profile else None, pool=pool,
+        )
+    for name, result in results.items():
+        report.add_output(name, result)
+    return results
+
+
+def _checkpoint(profile, label):
+    """프로파일링 중일 때만 메모리 스냅샷 (profiling 모듈은 이때만 import)."""
+    if profile:
+        from . import profiling
+        profiling.checkpoint(label)
+
+
+def _finish(report):
+    """실행 보고서 마무리: 이번 실행의 API 호출 지표 기록, 요약 출력, JSON 저장."""
+    api = metrics.take()
+    report.set_api(api)
+    metrics.append_history(api, report.started_at)
+    report.print_summary()
+    path = report.save()
+    if path:
+        print(f"ℹ️ 실행 보고서: {path}")
+
+
+def _last_run_path():
+    return os.path.join(config.data_dir(), "godo_last_run.json")
+
+
+def _save_last_run(now):
+    """고도몰 API 까지 정상 호출되었을 때 마지막 실행 시각 저장 (실행 간격 제한용)."""
+    try:
+        with open(_last_run_path(), "w", encoding="utf-8") as f:
+            json.dump({"ts": now.isoformat()}, f)
+    except Exception as e:
+        print("⚠️ 마지막 실행 시각 저장 실패:", e)
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="halfetgetorder", description="하프전자 주문수집기")
+    parser.add_argument(
+        "--from-store",
+        action="store_true",
+        help="API 를 호출하지 않고 로컬 주문 저장소(orders.db)의 마지막 조회 결과로 엑셀만 다시 만든다",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        default=None,
+        help="창을 띄워 둔 채 주기적으로 주문을 다시 조회하고, 주문이 바뀌었을 때만 엑셀을 다시 만든다 (.env 의 WATCH=1 과 같음)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=None,
+        help="--watch 조회 간격(초, 앞뒤로 약간의 무작위 간격이 더해짐). 기본은 .env 의 WATCH_INTERVAL 또는 50초",
+    )
+    parser.add_argument(
+        "--max-cycles",
+        type=int,
+        default=None,
+        help="--watch 를 N번 조회한 뒤 끝낸다 (측정/테스트용)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=None,
+        help="cProfile + tracemalloc 으로 실행 전체를 기록해 바탕화면 폴더의 profiles 에 저장 (.env 의 PROFILE=1 과 같음)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=30,
+        help="프로파일 요약에 적을 상위 항목 수 (기본 30)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.profile is None:
+        args.profile = config.PROFILE
+    if args.watch is None:
+        args.watch = config.WATCH and not args.from_store
+    if args.watch and args.from_store:
+        print("⚠️ --watch 와 --from-store 는 함께 쓸 수 없습니다.")
+        return
+    if args.profile:
+        from . import profiling
+        return profiling.run(_run, args, top=args.profile_top)
+    return _run(args)
+
+
+def _run(args):
+    metrics.take()   # 이전 실행에서 남은 지표는 버린다
+
+    if args.watch:
+        from . import watch
+        return watch.run(args.interval or config.WATCH_INTERVAL, max_cycles=args.max_cycles, profile=args.profile)
+
+    if args.from_store:
+        # API 호출 없이 저장소의 마지막 조회 결과로 다시 만든다 (재출력 / 실행 중단 복구용)
+        report = RunReport(mode="from-store")
+        with report.stage("저장소 불러오기"):
+            filtered_orders = order_store.load_orders("coupang")
+            grouped = order_store.load_orders("godo")
+        print(f"[INFO] 로컬 주문 저장소에서 쿠팡 {len(filtered_orders)}건, 고도몰 {len(grouped)}건을 불러왔습니다.")
+
+        _checkpoint(args.profile, "주문 불러온 후")
+
+        base_specs_future = _start_prefetch(report, grouped, offline=True)
+        _render_outputs(report, filtered_orders, grouped, base_specs_future, args.profile)
+        _finish(report)
+        return
+
     # ─────────────────────────────────────────────
     # 1. 실행 간격 제한 (예: 2분)
     # ─────────────────────────────────────────────
     MIN_INTERVAL_MINUTES = 2  # 여기 숫자만 바꿔서 1분, 5분 등으로 조정 가능
-    last_run_path = os.path.join(DATA_DIR, "godo_last_run.json")
+    last_run_path = _last_run_path()
     now = datetime.now()
 
     try:
@@ -64,103 +329,22 @@ def main():
         # 방어용: 여기서 문제가 나도 프로그램 전체는 계속 돌도록
         print("⚠️ 실행 간격 확인 중 오류가 발생했지만, 프로그램은 계속 진행합니다:", e)
 
-    # 1) 주문 데이터 조회 (API 직접 호출)
-    cp_body = coupang.fetch_orders()
-    godo_json = godo.fetch_orders()
-    grouped = godo.group_sets(godo_json)
-
-    # 고도몰 API까지 정상 호출되었다고 보고, 마지막 실행 시각 저장
-    try:
-        with open(last_run_path, "w", encoding="utf-8") as f:
-            json.dump({"ts": now.isoformat()}, f)
-    except Exception as e:
-        print("⚠️ 마지막 실행 시각 저장 실패:", e)
+    report = RunReport(mode="api")
 
-    # 2) 쿠팡 주문 파싱 및 렌탈 주문 제외
-    resp_json = {}
-    filtered_orders = []
-    filtered_cp_body = ""
+    # 1) 주문 데이터 조회 (API 직접 호출, 쿠팡/고도몰 동시 호출)
+    with report.stage("주문 조회(전체)"):
+        filtered_orders, grouped, godo_ok = _fetch_all_channels(report)
+    _checkpoint(args.profile, "주문 조회 후")
 
-    try:
-        resp_json = json.loads(cp_body) if cp_body else {}
-        orders = resp_json.get("data") or resp_json.get("content", []) or []
-
-        # 🔽 렌탈/대여/임대 주문 제외
-        filtered_orders = [od for od in orders if not _is_rental_order(od)]
-        # 🔼 필터링된 주문만 엑셀/송장/라벨에 사용
-
-        # 필터링된 주문만 포함하는 JSON 문자열을 만들어서
-        # 대한통운 송장용 normalize_coupang_orders 에도 동일하게 적용
-        if "data" in resp_json:
-            resp_json_filtered = dict(resp_json)
-            resp_json_filtered["data"] = filtered_orders
-        elif "content" in resp_json:
-            resp_json_filtered = dict(resp_json)
-            resp_json_filtered["content"] = filtered_orders
-        else:
-            resp_json_filtered = resp_json
-
-        filtered_cp_body = json.dumps(resp_json_filtered, ensure_ascii=False)
-
-    except Exception as e:
-        print("⚠️ 쿠팡 JSON 파싱 또는 필터링 오류:", e)
-        # 오류가 나도 이후 로직이 돌아가도록, cp_body 그대로 사용
-        filtered_cp_body = cp_body or ""
-
-    # 2-1) 주문수집 엑셀 생성 (쿠팡 + 고도몰)
-    try:
-        # 👉 여기서 네가 말해준 create_orders_workbook 사용
-        wb_orders, ws_orders = create_orders_workbook(
-            coupang_orders=filtered_orders,
-            godo_grouped_orders=grouped,
-        )
-        order_xlsx = os.path.join(DATA_DIR, f"주문수집_{today}.xlsx")
-        wb_orders.save(order_xlsx)
-        print(f"✅ 엑셀 저장 완료: {order_xlsx}")
-    except Exception as e:
-        print("⚠️ 주문수집 엑셀 생성 중 오류:", e)
-
-    # 3) 대한통운 송장등록 엑셀 생성 (쿠팡 주문만, 렌탈 제외된 상태)
-    try:
-        # 쿠팡 송장용 정규화도 필터된 cp_body 기준으로 수행
-        norm_cp_orders = (
-            coupang.normalize_coupang_orders(filtered_cp_body)
-            if filtered_cp_body
-            else []
-        )
-    except Exception as e:
-        print("⚠️ 쿠팡 송장용 정규화 오류:", e)
-        norm_cp_orders = []
-
-    if norm_cp_orders:
-        wb1, ws1 = create_waybill_workbook(norm_cp_orders)
-        waybill_xlsx = os.path.join(DATA_DIR, f"대한통운 송장등록_{today}.xlsx")
-        wb1.save(waybill_xlsx)
-        print(f"✅ 엑셀 저장 완료: {waybill_xlsx}")
-    else:
-        print("ℹ️ 쿠팡 주문이 없어 대한통운 송장등록 파일은 생성하지 않습니다.")
-
-        
-    print("=================================================================")
-    print("[INFO] 라벨출력 엑셀파일을 생성하는 중입니다...")
-    print("[INFO] 약 10~30초 정도 소요되니, 반응이 없다면 Enter키를 한번 눌러주세요.")
-
-    # 4) 라벨 워크북 생성
-    label_wb, _ = create_label_workbook(
-        coupang_orders=filtered_orders,      # 쿠팡 주문 리스트(렌탈 제외)
-        godo_grouped_orders=grouped,         # 고도몰 grouped_orders 리스트
-        godo_add_goods_map_path=os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),  # 프로젝트 루트
-            "godo_add_goods_all.json",
-        ),
-    )
+    # 라벨용 고도몰 기본 RAM/SSD 는 엑셀 작성과 동시에 미리 조회해 둔다
+    base_specs_future = _start_prefetch(report, grouped)
 
-    # 5) 라벨 엑셀 저장 경로: C:\Users\UserK\Desktop\data\라벨출력_YYYYMMDD.xlsx
-    os.makedirs(DATA_DIR, exist_ok=True)
-    label_path = os.path.join(DATA_DIR, f"라벨출력_{today}.xlsx")
-    label_wb.save(label_path)
+    # 고도몰 API까지 정상 호출되었을 때만 마지막 실행 시각 저장
+    if godo_ok:
+        _save_last_run(now)
 
-    print(f"✅ 라벨 엑셀 저장 완료: {label_path}")
+    _render_outputs(report, filtered_orders, grouped, base_specs_future, args.profile)
+    _finish(report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,260 @@
+"""
+쿠팡 / 고도몰 API 공용 HTTP 클라이언트.
+
+- requests.Session 하나를 프로세스 전체에서 재사용 (keep-alive 커넥션 풀)
+  → Goods_Search 를 여러 번 불러도 TLS 핸드셰이크는 호스트당 한 번
+- 모든 요청에 Accept-Encoding: gzip
+- SSL 컨텍스트는 처음 한 번만 만들어서 재사용
+- 5xx 응답 / 연결 실패는 지터를 섞은 지수 백오프로 재시도.
+  요청이 서버에 닿았을 수 있는 오류(읽기 타임아웃, 응답 중 연결 끊김)는 GET 같은 멱등 요청만,
+  읽기 타임아웃은 READ_TIMEOUT_RETRIES 번까지만 다시 보낸다
+  (POST Order_Search 를 중복으로 보내지 않고, 타임아웃 × 재시도로 몇 분씩 멈추지 않도록)
+- 매 시도 전에 엔드포인트별 토큰 버킷(ratelimit)을 거친다 (여러 프로세스 공용).
+  429 응답이면 Retry-After 만큼 버킷을 비우고 다시 시도
+- 호출마다 엔드포인트 / 상태코드 / 소요 시간 / 송수신 바이트 / 재시도 횟수 /
+  속도 제한 대기 시간을 metrics 에 기록
+"""
+import random
+import ssl
+import threading
+import time
+import urllib.parse
+
+import certifi
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from . import metrics, ratelimit
+
+POOL_SIZE = 16          # 호스트당 유지할 커넥션 수 (prefetch 워커 수보다 크게)
+MAX_RETRIES = 3         # 첫 시도 이후 재시도 횟수
+READ_TIMEOUT_RETRIES = 1    # 읽기 타임아웃 재시도 상한 (멱등 요청만)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+BACKOFF_BASE = 0.5      # 초 단위, 0.5 → 1 → 2 ... (최대 BACKOFF_MAX)
+BACKOFF_MAX = 8.0
+RETRY_STATUSES = frozenset(range(500, 600))
+TOO_MANY_REQUESTS = 429
+RETRY_AFTER_MAX = 60.0  # Retry-After 를 이보다 길게 주면 이만큼만 기다린다
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_insecure_prefixes: set[str] = set()
+_verified_ctx: ssl.SSLContext | None = None
+_insecure_ctx: ssl.SSLContext | None = None
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """미리 만들어 둔 SSLContext 를 커넥션 풀에 넘겨주는 어댑터."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs["ssl_context"] = self._ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def _verified_context() -> ssl.SSLContext:
+    global _verified_ctx
+    if _verified_ctx is None:
+        _verified_ctx = ssl.create_default_context(cafile=certifi.where())
+    return _verified_ctx
+
+
+def _insecure_context() -> ssl.SSLContext:
+    """인증서 검증을 끈 컨텍스트 (기존 쿠팡 호출과 동일한 설정)."""
+    global _insecure_ctx
+    if _insecure_ctx is None:
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        _insecure_ctx = ctx
+    return _insecure_ctx
+
+
+def _adapter(ssl_context: ssl.SSLContext) -> HTTPAdapter:
+    return _SSLContextAdapter(
+        ssl_context,
+        pool_connections=4,
+        pool_maxsize=POOL_SIZE,
+    )
+
+
+def get_session() -> requests.Session:
+    """공용 세션 (처음 호출할 때 생성)."""
+    global _session
+    with _lock:
+        if _session is None:
+            s = requests.Session()
+            s.headers["Accept-Encoding"] = "gzip, deflate"
+            s.mount("https://", _adapter(_verified_context()))
+            s.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE))
+            _session = s
+        return _session
+
+
+def _mount_insecure(url: str) -> None:
+    """verify=False 로 부르는 호스트에는 검증을 끈 SSL 컨텍스트 어댑터를 붙인다."""
+    parts = urllib.parse.urlsplit(url)
+    prefix = f"{parts.scheme}://{parts.netloc}/"
+    session = get_session()
+    with _lock:
+        if prefix in _insecure_prefixes:
+            return
+        if not _insecure_prefixes:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        session.mount(prefix, _adapter(_insecure_context()))
+        _insecure_prefixes.add(prefix)
+
+
+def _endpoint(url: str) -> str:
+    """집계용 엔드포인트 이름 (경로 마지막 부분, 예: ordersheets / Goods_Search.php)."""
+    parts = urllib.parse.urlsplit(url)
+    return parts.path.rstrip("/").rsplit("/", 1)[-1] or parts.netloc
+
+
+def _bytes_out(prepared) -> int:
+    """보낸 크기: 요청 URL(쿼리 포함) + 본문."""
+    body = prepared.body
+    if body is None:
+        size = 0
+    elif isinstance(body, (bytes, bytearray)):
+        size = len(body)
+    elif isinstance(body, str):
+        size = len(body.encode("utf-8"))
+    else:
+        size = 0    # 스트리밍 업로드는 크기를 알 수 없음
+    return len(prepared.url or "") + size
+
+
+def _bytes_in(resp) -> int:
+    """받은 크기: 실제로 읽은 본문 바이트 (gzip 이면 압축된 크기)."""
+    try:
+        return int(resp.raw.tell())
+    except Exception:
+        return len(resp.content) if resp._content_consumed else 0
+
+
+def _track(resp, endpoint: str, started: float, retries: int, stream: bool, throttled: float) -> None:
+    """
+    응답 지표를 기록한다.
+    stream=True 면 본문을 다 읽고 닫을 때(with resp: 끝날 때) 기록해서 본문 읽는 시간까지 포함한다.
+    """
+    def done():
+        metrics.record(
+            endpoint, resp.status_code, time.perf_counter() - started,
+            bytes_out=_bytes_out(resp.request), bytes_in=_bytes_in(resp), retries=retries,
+            throttled=throttled,
+        )
+
+    if not stream:
+        done()
+        return
+
+    close = resp.close
+
+    def close_and_record():
+        if not getattr(resp, "_metrics_recorded", False):
+            resp._metrics_recorded = True
+            done()
+        close()
+
+    resp.close = close_and_record
+
+
+def _backoff(attempt: int) -> float:
+    """attempt 번째 재시도 전 대기 시간 (full jitter)."""
+    cap = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+def _retry_after(resp) -> float | None:
+    """Retry-After 헤더(초 단위만 지원). 없거나 읽을 수 없으면 None."""
+    try:
+        return min(RETRY_AFTER_MAX, max(0.0, float(resp.headers["Retry-After"])))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_connect_error(exc: requests.RequestException) -> bool:
+    """연결을 맺지 못한 오류인지 (요청이 서버에 닿지 않았으니 어떤 메서드든 다시 보내도 됨)."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError))
+
+
+def _error_retries(method: str, exc: requests.RequestException, retries: int) -> int:
+    """타임아웃/연결 오류 exc 에 대해 허용할 재시도 횟수."""
+    if _is_connect_error(exc):
+        return retries
+    if method.upper() not in IDEMPOTENT_METHODS:
+        return 0
+    if isinstance(exc, requests.ReadTimeout):
+        return min(retries, READ_TIMEOUT_RETRIES)
+    return retries
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    retries: int = MAX_RETRIES,
+    verify: bool = True,
+    **kwargs,
+) -> requests.Response:
+    """
+    공용 세션으로 요청을 보낸다. (requests.request 와 같은 인자)
+
+    - 보내기 전에 ratelimit.acquire 로 엔드포인트 한도를 지킨다 (재시도도 한 번으로 센다).
+    - 5xx / 429 응답과 연결 실패는 최대 retries 번까지 다시 시도한다.
+      429 는 Retry-After(없으면 백오프) 동안 다른 스레드/프로세스도 같이 기다리게 한다.
+    - 읽기 타임아웃 / 응답 중 연결 끊김은 멱등 메서드만 다시 시도한다
+      (읽기 타임아웃은 READ_TIMEOUT_RETRIES 번까지).
+    - 재시도를 다 써도 5xx / 429 면 마지막 응답을 그대로 반환하고,
+      타임아웃/연결 오류면 마지막 예외를 그대로 올린다.
+    - 지표(metrics)는 논리적인 호출 한 번에 한 건: 소요 시간은 마지막 시도 기준,
+      앞선 실패 시도는 재시도 횟수로 남는다.
+    """
+    if not verify:
+        _mount_insecure(url)
+    session = get_session()
+    endpoint = _endpoint(url)
+
+    attempt = 0
+    throttled = 0.0
+    while True:
+        throttled += ratelimit.acquire(endpoint)
+        started = time.perf_counter()
+        try:
+            resp = session.request(method, url, verify=verify, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= _error_retries(method, e, retries):
+                metrics.record(endpoint, None, time.perf_counter() - started, retries=attempt, throttled=throttled)
+                raise
+        except requests.RequestException:
+            metrics.record(endpoint, None, time.perf_counter() - started, retries=attempt, throttled=throttled)
+            raise
+        else:
+            if resp.status_code == TOO_MANY_REQUESTS and attempt < retries:
+                delay = _retry_after(resp)
+                delay = _backoff(attempt) if delay is None else delay
+                resp.close()
+                # 버킷에 반영되면 다음 acquire 에서 기다리고, 제한 없는 엔드포인트면 여기서 기다린다
+                if not ratelimit.penalize(endpoint, delay):
+                    time.sleep(delay)
+                attempt += 1
+                continue
+            if resp.status_code not in RETRY_STATUSES or attempt >= retries:
+                _track(resp, endpoint, started, attempt, kwargs.get("stream", False), throttled)
+                return resp
+            resp.close()
+
+        time.sleep(_backoff(attempt))
+        attempt += 1
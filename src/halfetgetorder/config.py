@@ -1,36 +1,67 @@
+"""
+설정값 (.env / 환경변수 / keys.py).
 
+import 할 때는 아무것도 하지 않고, 설정값을 처음 읽을 때 .env 를 불러와서 계산한다.
+(exe 시작 시간 단축: dotenv 로드, 키 파일 import, 바탕화면 폴더 생성이 import 시점에 일어나지 않음)
+
+    from . import config
+    config.GODO_KEY          # 처음 접근할 때 계산하고 이후엔 그대로 재사용
+    config.data_dir()        # 저장 폴더 경로 (없으면 이때 만든다)
+
+`from .config import DATA_DIR` 처럼 쓰면 import 하는 순간 값이 계산되므로
+모듈 최상단에서는 config 모듈만 import 하고 값은 쓰는 시점에 읽는다.
+"""
 import os, sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 def _project_root() -> Path:
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         return Path(sys.executable).parent
     return Path(__file__).resolve().parents[2]
 
+_env_loaded = False
+
 def _load_env():
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    from dotenv import load_dotenv
+
     root = _project_root()
     env = root / ".env"
     if env.exists():
         load_dotenv(env)
     else:
         load_dotenv()
-_load_env()
-
-PARTNER_KEY = os.getenv("PARTNER_KEY", "")
-GODO_KEY    = os.getenv("GODO_KEY", "")
-CP_ACCESS   = os.getenv("CP_ACCESSKEY", "")
-CP_SECRET   = os.getenv("CP_SECRETKEY", "")
-
-try:
-    if not (PARTNER_KEY and GODO_KEY and CP_ACCESS and CP_SECRET):
-        from .keys import partner_key as _pk, godo_key as _gk, cp_accesskey as _ak, cp_secretkey as _sk
-        PARTNER_KEY = PARTNER_KEY or _pk
-        GODO_KEY    = GODO_KEY or _gk
-        CP_ACCESS   = CP_ACCESS   or _ak
-        CP_SECRET   = CP_SECRET   or _sk
-except Exception:
-    pass
+
+def _env(name: str, default: str = "") -> str:
+    _load_env()
+    return os.getenv(name, default)
+
+def _flag(name: str) -> bool:
+    return _env(name).strip().lower() in ("1", "y", "yes", "true")
+
+def _keys() -> tuple[str, str, str, str]:
+    """(PARTNER_KEY, GODO_KEY, CP_ACCESS, CP_SECRET) — .env 에 없으면 keys.py 값으로 채운다."""
+    partner, godo = _env("PARTNER_KEY"), _env("GODO_KEY")
+    access, secret = _env("CP_ACCESSKEY"), _env("CP_SECRETKEY")
+    try:
+        if not (partner and godo and access and secret):
+            from .keys import partner_key as _pk, godo_key as _gk, cp_accesskey as _ak, cp_secretkey as _sk
+            partner = partner or _pk
+            godo    = godo or _gk
+            access  = access or _ak
+            secret  = secret or _sk
+    except Exception:
+        pass
+    return partner, godo, access, secret
+
+def _int(name: str, default: int, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(_env(name, str(default))))
+    except ValueError:
+        return default
 
 def resource_path(rel: str) -> str:
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -44,7 +75,60 @@ def app_data_dir() -> str:
     desktop = home / "Desktop"
     # 바탕화면에 이름 변경하려면 밑줄 수정하기
     data = desktop / "하프전자 주문수집기"
-    data.mkdir(parents=True, exist_ok=True)
     return str(data)
 
-DATA_DIR = app_data_dir()
+_data_dir_ready = False
+
+def data_dir() -> str:
+    """저장 폴더(DATA_DIR) 경로. 파일을 쓰기 직전에 부르면 폴더가 없을 때 처음 한 번 만든다."""
+    global _data_dir_ready
+    path = sys.modules[__name__].DATA_DIR
+    if not _data_dir_ready:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _data_dir_ready = True
+    return path
+
+_SETTINGS = {
+    "PARTNER_KEY": lambda: _keys()[0],
+    "GODO_KEY":    lambda: _keys()[1],
+    "CP_ACCESS":   lambda: _keys()[2],
+    "CP_SECRET":   lambda: _keys()[3],
+
+    # .env 에 GODO_SPECS_REFRESH=1 이면 기본 사양 캐시를 무시하고 API 를 다시 조회
+    "GODO_SPECS_REFRESH": lambda: _flag("GODO_SPECS_REFRESH"),
+
+    # .env 에 INCREMENTAL_SYNC=1 이면 지난 동기화 이후 주문만 받아서 이전 결과에 합친다
+    "INCREMENTAL_SYNC": lambda: _flag("INCREMENTAL_SYNC"),
+
+    # .env 에 WAYBILL_CSV=1 이면 대한통운 송장등록 파일을 csv 로도 함께 저장
+    "WAYBILL_CSV": lambda: _flag("WAYBILL_CSV"),
+
+    # .env 에 PROFILE=1 이면 --profile 과 같이 실행 전체를 프로파일링 (결과는 DATA_DIR/profiles)
+    "PROFILE": lambda: _flag("PROFILE"),
+
+    # 엑셀 3종(주문수집/송장등록/라벨)을 동시에 만들 프로세스 수 (.env 의 RENDER_WORKERS, 1 이면 차례대로)
+    "RENDER_WORKERS": lambda: _int("RENDER_WORKERS", 3),
+
+    # .env 에 WATCH=1 이면 --watch 와 같이 창을 띄워 둔 채 WATCH_INTERVAL 초(기본 50초)마다 주문을 다시 조회
+    "WATCH": lambda: _flag("WATCH"),
+    "WATCH_INTERVAL": lambda: _int("WATCH_INTERVAL", 50),
+
+    # 엔드포인트별 호출 속도 제한 (기본은 제한 없음, ratelimit 모듈 참고. 예: Goods_Search.php=10/20,ordersheets=5)
+    "RATE_LIMITS": lambda: _env("RATE_LIMITS").strip(),
+
+    # API 주소 (.env 의 COUPANG_BASE_URL / GODO_BASE_URL 로 바꾸면 로컬 테스트 서버로 보낼 수 있다)
+    "COUPANG_BASE_URL": lambda: _env("COUPANG_BASE_URL").strip().rstrip("/") or "https://api-gateway.coupang.com",
+    "GODO_BASE_URL":    lambda: _env("GODO_BASE_URL").strip().rstrip("/") or "https://openhub.godo.co.kr",
+
+    # 결과 파일 저장 폴더 (바탕화면/하프전자 주문수집기). 파일을 쓸 때는 data_dir() 로 폴더까지 만든다
+    "DATA_DIR": app_data_dir,
+}
+
+def __getattr__(name: str):
+    """설정값은 처음 읽을 때 계산해서 모듈 전역에 넣어 둔다 (두 번째부터는 일반 속성 조회)."""
+    getter = _SETTINGS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getter()
+    globals()[name] = value
+    return value
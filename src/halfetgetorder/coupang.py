@@ -1,102 +1,166 @@
 
-import hmac, hashlib, urllib.parse, urllib.request, urllib.error, ssl, json, time, os
+import hmac, hashlib, urllib.parse, json, time
 from datetime import date, datetime, timedelta
-from .config import CP_ACCESS, CP_SECRET
+from . import config
 
-os.environ['TZ'] = 'GMT+0'
 CONTENT_TYPE = "application/json;charset=UTF-8"
 METHOD = "GET"
-DOMAIN = "https://api-gateway.coupang.com"
+DOMAIN = None   # None 이면 config.COUPANG_BASE_URL (.env 의 COUPANG_BASE_URL)
 VENDOR_ID = "A01093941"
 
-def fetch_orders(created_from=None, created_to=None):
-    if created_from is None: created_from = str(date.today() - timedelta(days=7))
-    if created_to   is None: created_to   = str(date.today())
+DEFAULT_TIMEOUT = 90
+MAX_PER_PAGE = 50  # 쿠팡 ordersheets 한 페이지 최대 건수
+
 
-    datetime_signed = time.strftime('%y%m%d') + 'T' + time.strftime('%H%M%S') + 'Z'
+def _request_ordersheets(created_from, created_to, max_per_page=MAX_PER_PAGE, next_token=None):
+    """
+    ordersheets 한 페이지를 호출해서 응답 JSON(dict)을 반환.
+    오류가 나면 내용을 출력하고 None 을 반환한다.
+    """
+    # requests 는 실제로 호출할 때만 import (exe 시작 시간 단축)
+    import requests
+    from . import client
+
+    # 서명 시각은 UTC (예전처럼 TZ 환경변수를 바꾸지 않고 gmtime 사용)
+    datetime_signed = time.strftime('%y%m%dT%H%M%SZ', time.gmtime())
     cp_path = f"/v2/providers/openapi/apis/api/v4/vendors/{VENDOR_ID}/ordersheets"
-    cp_query = urllib.parse.urlencode({
+    query = {
         "createdAtFrom": created_from,
         "createdAtTo": created_to,
-        "status": "INSTRUCT"
-    })
+        "status": "INSTRUCT",
+        "maxPerPage": max_per_page,
+    }
+    if next_token:
+        query["nextToken"] = next_token
+    cp_query = urllib.parse.urlencode(query)
     message = datetime_signed + METHOD + cp_path + cp_query
-    signature = hmac.new(CP_SECRET.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
+    signature = hmac.new(config.CP_SECRET.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
     authorization = (
-        f"CEA algorithm=HmacSHA256, access-key={CP_ACCESS}, signed-date={datetime_signed}, signature={signature}"
+        f"CEA algorithm=HmacSHA256, access-key={config.CP_ACCESS}, signed-date={datetime_signed}, signature={signature}"
     )
-    cp_url = f"{DOMAIN}{cp_path}?{cp_query}"
-    req = urllib.request.Request(cp_url)
-    req.add_header("Content-type", CONTENT_TYPE)
-    req.add_header("Authorization", authorization)
-
-    # ✅ 쿠팡 권장 헤더 추가
-    req.add_header("X-Requested-By", VENDOR_ID)
-    req.add_header("X-EXTENDED-TIMEOUT", "90000")  # 10,000ms = 10초
+    cp_url = f"{DOMAIN or config.COUPANG_BASE_URL}{cp_path}?{cp_query}"
+    headers = {
+        "Content-type": CONTENT_TYPE,
+        "Authorization": authorization,
+        # ✅ 쿠팡 권장 헤더 추가
+        "X-Requested-By": VENDOR_ID,
+        "X-EXTENDED-TIMEOUT": "90000",  # 90,000ms = 90초
+    }
 
-    req.get_method = lambda: METHOD
-
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-
-    # print("CP_ACCESS = " + CP_ACCESS)
-    # print("CP_SECRET = " + CP_SECRET)
+    try:
+        # 기존 호출과 동일하게 인증서 검증은 하지 않는다 (공용 세션의 검증 해제 컨텍스트 사용)
+        resp = client.request(METHOD, cp_url, headers=headers, timeout=DEFAULT_TIMEOUT, verify=False)
+    except requests.RequestException as e:
+        print("❌ 쿠팡 API 네트워크 오류:", repr(e))
+        return None
 
-    # print("created_from = " + created_from)
-    # print("created_to = " + created_to)
-    # print("signature = " + signature)
-    # print("authorization = " + authorization)
-    # print("message = " + message)
-    # print("cp_url = " + cp_url)
+    except Exception as e:
+        print("❌ 쿠팡 API 일반 오류:", repr(e))
+        return None
 
-    DEFAULT_TIMEOUT = 90
-    try:
-        resp = urllib.request.urlopen(req, context=ctx, timeout=DEFAULT_TIMEOUT)
-        return resp.read().decode(resp.headers.get_content_charset() or "utf-8")
-    except urllib.error.HTTPError as e:
+    if resp.status_code >= 400:
         # 쿠팡이 내려주는 에러 본문까지 같이 출력
         try:
-            err_body = e.read().decode("utf-8", errors="replace")
+            err_body = resp.content.decode("utf-8", errors="replace")
         except Exception:
             err_body = "<본문 읽기 실패>"
         print("❌ 쿠팡 API HTTP 오류:")
-        print("   - 상태코드:", e.code)
-        print("   - 사유:", e.reason)
+        print("   - 상태코드:", resp.status_code)
+        print("   - 사유:", resp.reason)
         print("   - 응답본문:", err_body)
-        return ""
+        return None
 
-    except urllib.error.URLError as e:
-        print("❌ 쿠팡 API 네트워크 오류:", e.reason)
-        return ""
+    body = resp.content.decode(resp.encoding or "utf-8")
 
+    try:
+        return json.loads(body) if body else {}
     except Exception as e:
-        print("❌ 쿠팡 API 일반 오류:", repr(e))
+        print("❌ 쿠팡 API 응답 JSON 파싱 오류:", repr(e))
+        return None
+
+
+def iter_order_pages(created_from=None, created_to=None, max_per_page=MAX_PER_PAGE, status=None):
+    """
+    쿠팡 발주서(ordersheets)를 nextToken 을 따라가며 페이지 단위로 yield 한다.
+
+    - 한 번에 한 페이지(최대 max_per_page 건)만 메모리에 올리므로
+      호출하는 쪽에서 필터링/정규화를 마지막 페이지를 기다리지 않고 바로 시작할 수 있다.
+    - 1페이지 호출 오류는 RuntimeError 로 올리고 (고도몰 iter_order_pages 와 같이 '0건'과 구분),
+      이후 페이지에서 오류가 나면 그때까지 받은 페이지만 넘기고 멈춘다.
+    - status(dict)를 넘기면 마지막 페이지까지 다 받았을 때 status["complete"] = True
+    """
+    if status is not None:
+        status["complete"] = False
+    if created_from is None: created_from = str(date.today() - timedelta(days=7))
+    if created_to   is None: created_to   = str(date.today())
+
+    next_token = None
+    page_no = 0
+    while True:
+        resp_json = _request_ordersheets(created_from, created_to, max_per_page, next_token)
+        if resp_json is None:
+            if not page_no:
+                raise RuntimeError("쿠팡 주문 1페이지 조회 실패")
+            print(f"⚠️ 쿠팡 주문 {page_no}페이지까지만 수집되었습니다.")
+            return
+
+        page_no += 1
+        yield resp_json.get("data") or resp_json.get("content") or []
+
+        next_token = resp_json.get("nextToken")
+        if not next_token:
+            if status is not None:
+                status["complete"] = True
+            return
+
+
+def fetch_orders(created_from=None, created_to=None, max_per_page=MAX_PER_PAGE):
+    """
+    모든 페이지를 모아 기존과 같은 형태의 응답 본문(JSON 문자열)로 반환.
+    하나도 못 받았으면 빈 문자열.
+    """
+    orders = []
+    try:
+        for page in iter_order_pages(created_from, created_to, max_per_page):
+            orders.extend(page)
+    except RuntimeError:
         return ""
 
+    return json.dumps({"data": orders}, ensure_ascii=False)
+
     
 
-def normalize_coupang_orders(coupang_body):
-    try:
-        data = json.loads(coupang_body)
-    except Exception:
-        return []
-    orders = data.get('data') or data.get('content') or []
-    norm = []
-    for od in orders:
-        ship = od.get('shippingAddress') or {}
-        recv = od.get('receiver') or {}
-        orderer = od.get('orderer', {}) or {}
-        name = ship.get('name') or recv.get('name') or orderer.get('name') or ""
-        phone = ship.get('safeNumber') or recv.get('safeNumber') or ship.get('phone') or ship.get('phoneNo') or recv.get('receiverPhone') or orderer.get('phone') or ""
-        addr1 = ship.get('address1') or recv.get('addr1') or ""
-        addr2 = ship.get('address2') or recv.get('addr2') or ""
-        zipcode = ship.get('zipcode') or recv.get('zipCode') or ""
-        items_raw = od.get('orderItems', []) or []
-        items = [{"quantity": int(str(it.get('shippingCount') or it.get('quantity') or 1))} for it in items_raw]
-        norm.append({
-            "channel": "coupang",
-            "name": name, "phone": phone, "addr1": addr1, "addr2": addr2,
-            "zipcode": zipcode, "items": items, "raw": od
-        })
-    return norm
+def normalize_coupang_orders(orders):
+    """
+    쿠팡 발주서를 대한통운 송장용 형태로 정규화한다.
+
+    - orders: 이미 파싱된 발주서(dict)의 리스트 또는 이터레이터
+      (iter_order_pages() 페이지를 필터링하면서 바로 넘겨도 된다)
+    - 예전처럼 응답 본문(JSON 문자열)을 넘겨도 동작한다.
+    """
+    if isinstance(orders, (str, bytes)):
+        try:
+            data = json.loads(orders)
+        except Exception:
+            return []
+        orders = data.get('data') or data.get('content') or []
+    return [normalize_coupang_order(od) for od in orders or []]
+
+
+def normalize_coupang_order(od):
+    """발주서 한 건 정규화."""
+    ship = od.get('shippingAddress') or {}
+    recv = od.get('receiver') or {}
+    orderer = od.get('orderer', {}) or {}
+    name = ship.get('name') or recv.get('name') or orderer.get('name') or ""
+    phone = ship.get('safeNumber') or recv.get('safeNumber') or ship.get('phone') or ship.get('phoneNo') or recv.get('receiverPhone') or orderer.get('phone') or ""
+    addr1 = ship.get('address1') or recv.get('addr1') or ""
+    addr2 = ship.get('address2') or recv.get('addr2') or ""
+    zipcode = ship.get('zipcode') or recv.get('zipCode') or ""
+    items_raw = od.get('orderItems', []) or []
+    items = [{"quantity": int(str(it.get('shippingCount') or it.get('quantity') or 1))} for it in items_raw]
+    return {
+        "channel": "coupang",
+        "name": name, "phone": phone, "addr1": addr1, "addr2": addr2,
+        "zipcode": zipcode, "items": items, "raw": od
+    }
@@ -1,7 +1,9 @@
-import requests, xmltodict, json
+import itertools, json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from .config import PARTNER_KEY, GODO_KEY
 from .utils import _as_list, _to_int, _to_float
+from . import config, godo_xml, spec_cache
 
 
 def fetch_add_goods_map(refresh=False):
@@ -9,27 +11,119 @@ def fetch_add_goods_map(refresh=False):
     return {}
 
 
-def fetch_orders(created_from=None, created_to=None):
-    if created_from is None:
-        created_from = str(date.today() - timedelta(days=7))
-    if created_to is None:
-        created_to = str(date.today())
+def _api_root() -> str:
+    return f"{config.GODO_BASE_URL}/godomall5"
+
+
+ORDER_PAGE_SIZE = 100     # Order_Search 한 페이지 건수
+ORDER_PAGE_WORKERS = 2    # 2페이지 이후 동시에 받아둘 페이지 수
+
+
+def _iter_text(resp, chunk_size=64 * 1024):
+    """응답 본문을 인코딩(cp949/utf-8) 처리한 문자열 조각으로 읽는다."""
+    ctype = (resp.headers.get('Content-Type') or '').lower()
+    if 'euc-kr' in ctype or 'cp949' in ctype:
+        resp.encoding = 'cp949'
+    elif not resp.encoding:
+        resp.encoding = 'utf-8'
+    return resp.iter_content(chunk_size=chunk_size, decode_unicode=True)
+
+
+def _request_order_page(created_from, created_to, page=1, size=ORDER_PAGE_SIZE):
+    """
+    Order_Search 한 페이지를 호출해서 (header, order_data 리스트) 를 반환.
+    응답은 받는 대로 godo_xml 스트리밍 파서로 필요한 필드만 읽는다.
+    """
+    from . import client   # requests 는 실제로 호출할 때만 import
 
     url = (
-        "https://openhub.godo.co.kr/godomall5/order/Order_Search.php"
-        f"?partner_key={PARTNER_KEY}&key={GODO_KEY}"
+        f"{_api_root()}/order/Order_Search.php"
+        f"?partner_key={config.PARTNER_KEY}&key={config.GODO_KEY}"
         f"&startDate={created_from}&endDate={created_to}"
         "&dateType=order&orderStatus=g1"
+        f"&page={page}&size={size}"
     )
-    r = requests.post(url, timeout=30)
+    header: dict = {}
+    with client.request("POST", url, timeout=30, stream=True) as r:
+        orders = list(godo_xml.iter_order_page(_iter_text(r), header))
+    return header, orders
 
-    ctype = (r.headers.get('Content-Type') or '').lower()
-    if 'euc-kr' in ctype or 'cp949' in ctype:
-        r.encoding = 'cp949'
-    elif not r.encoding:
-        r.encoding = 'utf-8'
 
-    return xmltodict.parse(r.text)
+def _page_orders(page_json):
+    root = page_json.get('data', {}) if isinstance(page_json, dict) else {}
+    ret = (root or {}).get('return', {}) or {}
+    return _as_list(ret.get('order_data'))
+
+
+def iter_order_pages(
+    created_from=None,
+    created_to=None,
+    size=ORDER_PAGE_SIZE,
+    max_workers=ORDER_PAGE_WORKERS,
+    status=None,
+):
+    """
+    Order_Search 결과를 페이지 단위로 돌면서 각 페이지의 order_data 리스트를 yield 한다.
+
+    - 1페이지 응답의 header.max_page 로 전체 페이지 수를 알아낸 뒤
+      나머지 페이지는 최대 max_workers 개까지 미리 받아 두면서 순서대로 넘긴다.
+    - 1페이지 호출 오류는 그대로 예외로 올리고,
+      이후 페이지에서 오류가 나면 그때까지 받은 페이지만 넘기고 멈춘다.
+    - status(dict)를 넘기면 마지막 페이지까지 다 받았을 때 status["complete"] = True
+    """
+    if status is not None:
+        status["complete"] = False
+    if created_from is None:
+        created_from = str(date.today() - timedelta(days=7))
+    if created_to is None:
+        created_to = str(date.today())
+
+    header, first = _request_order_page(created_from, created_to, 1, size)
+    max_page = _to_int(header.get('max_page'), 1)
+
+    yield first
+    del first
+
+    if max_page <= 1:
+        if status is not None:
+            status["complete"] = True
+        return
+
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="godo-page") as pool:
+        pending = deque()
+        next_page = 2
+        while pending or next_page <= max_page:
+            # 최대 workers 개 페이지만 앞서서 요청해 둔다
+            while next_page <= max_page and len(pending) < workers:
+                pending.append(
+                    (next_page, pool.submit(_request_order_page, created_from, created_to, next_page, size))
+                )
+                next_page += 1
+
+            page, fut = pending.popleft()
+            try:
+                _, orders = fut.result()
+            except Exception as e:
+                print(f"⚠️ 고도몰 주문 {page}페이지 조회 실패, {page - 1}페이지까지만 수집합니다: {e}")
+                for _, rest in pending:
+                    rest.cancel()
+                return
+
+            yield orders
+
+    if status is not None:
+        status["complete"] = True
+
+
+def fetch_orders(created_from=None, created_to=None):
+    """
+    모든 페이지를 모아 기존과 같은 형태({'data': {'return': {'order_data': [...]}}})로 반환.
+    """
+    orders = []
+    for page in iter_order_pages(created_from, created_to):
+        orders.extend(page)
+    return {"data": {"return": {"order_data": orders}}}
 
 
 def _extract_option_info(raw):
@@ -64,150 +158,205 @@ def group_sets(godo_json):
     각 parent 상품의 optionInfo를 '(필수선택) 등급: S급' 형태로 정리하여
     io_excel에서 사용 가능하도록 데이터 구조 정리.
     """
-    root = godo_json.get('data', {}) if isinstance(godo_json, dict) else {}
-    ret = root.get('return', {}) or {}
-    orders = _as_list(ret.get('order_data'))
+    return list(iter_grouped_orders([_page_orders(godo_json)]))
+
+
+def iter_grouped_orders(pages):
+    """
+    iter_order_pages() 의 페이지들을 받아 주문 단위로 세트 구조를 yield 한다.
+    페이지 하나를 다 쓰면 바로 버리므로 전체 응답 트리를 한 번에 들고 있지 않는다.
+    """
+    for orders in pages:
+        for od in orders:
+            yield _group_order(od)
 
-    results = []
 
-    for od in orders:
-        info = od.get("orderInfoData") or {}
+def _group_order(od):
+    """주문(order_data) 한 건을 세트 구조로 묶는다."""
+    info = od.get("orderInfoData") or {}
 
-        # 수령인 이름
-        name = (info.get("receiverName") or "").strip()
+    # 수령인 이름
+    name = (info.get("receiverName") or "").strip()
 
-        # 안심번호 처리
-        safe_fl = str(info.get("receiverUseSafeNumberFl") or "").strip().lower() == "y"
-        safe_no = (info.get("receiverSafeNumber") or "").strip()
-        phone = safe_no if (safe_fl and safe_no) else (
-            (info.get("receiverPhone") or info.get("receiverCellPhone") or "").strip()
-        )
+    # 안심번호 처리
+    safe_fl = str(info.get("receiverUseSafeNumberFl") or "").strip().lower() == "y"
+    safe_no = (info.get("receiverSafeNumber") or "").strip()
+    phone = safe_no if (safe_fl and safe_no) else (
+        (info.get("receiverPhone") or info.get("receiverCellPhone") or "").strip()
+    )
 
-        # 주문일시
-        ordered_at = (od.get("orderDate") or "").strip()
+    # 주문일시
+    ordered_at = (od.get("orderDate") or "").strip()
+
+    # 배송메세지
+    order_memo = (info.get("orderMemo") or "").strip()
+
+    # 본상품, 추가옵션
+    parents = _as_list(od.get("orderGoodsData"))
+    adds = _as_list(od.get("addGoodsData") or od.get("orderAddGoodsData"))
+
+    # goodsNo → parent index 매핑
+    idx_by_goodsno = {}
+    for i, p in enumerate(parents):
+        gno = str(p.get("goodsNo") or "").strip()
+        if gno:
+            idx_by_goodsno[gno] = i
+
+    # 세트 구조 기본 생성
+    group = [{"parent": p, "children": []} for p in parents]
+
+    # addGoods 를 parent 밑에 붙이기
+    for add in adds:
+        pno = str(add.get("parentGoodsNo") or "").strip()
+        if pno and pno in idx_by_goodsno:
+            group[idx_by_goodsno[pno]]["children"].append(add)
+
+    # ★ 여기서 부모 상품 optionInfo 정리까지 포함시켜도 되지만
+    # io_excel에서 읽을 때 parent에서 직접 읽도록 두는 편이 좋음.
+
+    return {
+        "orderNo": str(od.get("orderNo") or "").strip(),
+        "orderedAt": ordered_at,
+        "receiver": {"name": name, "phone": phone},
+        "sets": group,
+        "orderMemo": order_memo,
+    }
 
-        # 배송메세지
-        order_memo = (info.get("orderMemo") or "").strip()
 
-        # 본상품, 추가옵션
-        parents = _as_list(od.get("orderGoodsData"))
-        adds = _as_list(od.get("addGoodsData") or od.get("orderAddGoodsData"))
+def fetch_goods_base_specs(
+    goods_no: str,
+    refresh: bool | None = None,
+    offline: bool = False,
+) -> tuple[str, str]:
+    """
+    goodsNo 한 건의 기본 RAM/SSD 를 (ram, ssd) 로 반환한다.
 
-        # goodsNo → parent index 매핑
-        idx_by_goodsno = {}
-        for i, p in enumerate(parents):
-            gno = str(p.get("goodsNo") or "").strip()
-            if gno:
-                idx_by_goodsno[gno] = i
+    - 먼저 DATA_DIR 의 기본 사양 캐시(spec_cache)를 보고,
+      없거나 TTL 이 지났을 때만 Goods_Search API 를 호출한다.
+    - refresh=True (또는 .env 의 GODO_SPECS_REFRESH=1) 이면 캐시를 무시하고 다시 조회.
+    - offline=True 면 API 는 부르지 않고, TTL 이 지난 캐시라도 있으면 그대로 쓴다.
+    - 네트워크/파싱 오류는 캐시에 남기지 않는다.
+    """
+    goods_no = str(goods_no or "").strip()
+    if not goods_no:
+        return "", ""
 
-        # 세트 구조 기본 생성
-        group = [{"parent": p, "children": []} for p in parents]
+    if offline:
+        return spec_cache.get(goods_no, allow_stale=True) or ("", "")
 
-        # addGoods 를 parent 밑에 붙이기
-        for add in adds:
-            pno = str(add.get("parentGoodsNo") or "").strip()
-            if pno and pno in idx_by_goodsno:
-                group[idx_by_goodsno[pno]]["children"].append(add)
+    if refresh is None:
+        refresh = config.GODO_SPECS_REFRESH
 
-        # ★ 여기서 부모 상품 optionInfo 정리까지 포함시켜도 되지만
-        # io_excel에서 읽을 때 parent에서 직접 읽도록 두는 편이 좋음.
+    if not refresh:
+        cached = spec_cache.get(goods_no)
+        if cached is not None:
+            return cached
 
-        results.append({
-            "orderedAt": ordered_at,
-            "receiver": {"name": name, "phone": phone},
-            "sets": group,
-            "orderMemo": order_memo,
-        })
+    specs = _request_goods_base_specs(goods_no)
+    if specs is None:
+        return "", ""
 
-    return results
+    spec_cache.put(goods_no, *specs)
+    return specs
 
 
-def fetch_goods_base_specs(goods_no: str) -> tuple[str, str]:
+def _request_goods_base_specs(goods_no: str) -> tuple[str, str] | None:
     """
     Goods_Search API를 직접 호출해서 기본 RAM/SSD를 가져온다.
 
-    json 캐시(godo_goods_all.json, godo_base_specs.json)를 전혀 사용하지 않고
-    goodsNo 한 건당 API 한 번만 호출해서 (ram, ssd)를 반환한다.
+    - 정상 응답이면 (ram, ssd) — shortDescription 이 없으면 ("", "")
+    - 호출/파싱 오류면 None
     """
-    goods_no = str(goods_no or "").strip()
-    if not goods_no:
-        return "", ""
+    from . import client
 
-    url = "https://openhub.godo.co.kr/godomall5/goods/Goods_Search.php"
+    url = f"{_api_root()}/goods/Goods_Search.php"
     params = {
-        "partner_key": PARTNER_KEY,
-        "key": GODO_KEY,
+        "partner_key": config.PARTNER_KEY,
+        "key": config.GODO_KEY,
         "goodsNo": goods_no,
         "page": 1,
         "size": 1,
     }
 
     try:
-        resp = requests.get(url, params=params, timeout=30)
+        resp = client.request("GET", url, params=params, timeout=30, stream=True)
     except Exception as e:
         print(f"⚠️ Goods_Search 호출 실패(goodsNo={goods_no}): {e}")
+        return None
+
+    with resp:
+        chunks = _iter_text(resp)
+        try:
+            head = ""
+            for head in chunks:
+                if head.strip():
+                    break
+            if not head.lstrip().startswith("<"):
+                print("⚠️ Goods_Search 응답이 XML 형식이 아닙니다 (앞 200자):")
+                print(head.strip()[:200])
+                return None
+
+            # goodsNo 가 일치하는 상품을 찾으면 나머지 응답은 읽지 않는다
+            found, short_desc = godo_xml.find_short_description(
+                itertools.chain([head], chunks), goods_no
+            )
+        except Exception as e:
+            print(f"⚠️ Goods_Search XML 파싱 오류(goodsNo={goods_no}): {e}")
+            return None
+
+    if not found:
         return "", ""
 
-    # 인코딩 처리 (기존 build_godo_goods_all.py 와 동일 패턴)
-    ctype = (resp.headers.get("Content-Type") or "").lower()
-    if "euc-kr" in ctype or "cp949" in ctype:
-        resp.encoding = "cp949"
-    elif not resp.encoding:
-        resp.encoding = "utf-8"
-
-    text = (resp.text or "").strip()
-    if not text.startswith("<"):
-        print("⚠️ Goods_Search 응답이 XML 형식이 아닙니다 (앞 200자):")
-        print(text[:200])
+    if not short_desc:
         return "", ""
 
-    try:
-        data = xmltodict.parse(text)
-    except Exception as e:
-        print(f"⚠️ Goods_Search XML 파싱 오류(goodsNo={goods_no}): {e}")
+    parts = [p.strip() for p in short_desc.split("/")]
+    if len(parts) <= 4:
         return "", ""
 
-    # data 전체 구조에서 goodsNo 가진 dict들만 모으기
-    items: list[dict] = []
+    ssd_part = parts[3].strip()
+    ram_part = parts[4].strip()
+    return ram_part, ssd_part
 
-    def _walk(node):
-        if isinstance(node, dict):
-            if "goodsNo" in node:
-                items.append(node)
-            for v in node.values():
-                _walk(v)
-        elif isinstance(node, list):
-            for it in node:
-                _walk(it)
 
-    _walk(data)
 
-    if not items:
-        return "", ""
+def prefetch_goods_base_specs(
+    grouped_orders,
+    max_workers=8,
+    refresh: bool | None = None,
+    offline: bool = False,
+    executor=None,
+) -> dict[str, tuple[str, str]]:
+    """
+    group_sets() 결과에서 본상품 goodsNo 를 중복 없이 모아
+    Goods_Search 를 병렬(최대 max_workers 개)로 조회한다.
 
-    # goodsNo 일치하는 애 우선
-    target = None
-    for it in items:
-        gno = str(it.get("goodsNo") or "").strip()
-        if gno == goods_no:
-            target = it
-            break
-    if target is None:
-        target = items[0]
-
-    short_desc = (
-        target.get("shortDescription")
-        or target.get("short_desc")
-        or ""
-    ).strip()
+    같은 상품이 여러 주문에 들어 있어도 goodsNo 당 한 번만 조회하고
+    (캐시에 있으면 API 호출 없음), 라벨 작성 단계에는 {goodsNo: (ram, ssd)} 맵만 넘겨준다.
 
-    if not short_desc:
-        return "", ""
+    executor 를 주면 매번 스레드를 새로 만들지 않고 그 풀에서 조회한다
+    (--watch 처럼 계속 도는 경우 스레드별 캐시 DB 연결도 그대로 재사용).
+    """
+    goods_nos: list[str] = []
+    seen: set[str] = set()
+    for grp in grouped_orders or []:
+        for s in grp.get("sets", []):
+            gno = str((s.get("parent") or {}).get("goodsNo") or "").strip()
+            if gno and gno not in seen:
+                seen.add(gno)
+                goods_nos.append(gno)
 
-    parts = [p.strip() for p in short_desc.split("/")]
-    if len(parts) <= 4:
-        return "", ""
+    if not goods_nos:
+        return {}
 
-    ssd_part = parts[3].strip()
-    ram_part = parts[4].strip()
-    return ram_part, ssd_part
+    def fetch(g):
+        return fetch_goods_base_specs(g, refresh=refresh, offline=offline)
+
+    if executor is not None:
+        return dict(zip(goods_nos, executor.map(fetch, goods_nos)))
+
+    workers = max(1, min(max_workers, len(goods_nos)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="goods") as pool:
+        specs = list(pool.map(fetch, goods_nos))
+
+    return dict(zip(goods_nos, specs))
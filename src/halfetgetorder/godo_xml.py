@@ -0,0 +1,148 @@
+"""
+고도몰 API 응답용 스트리밍 XML 파서.
+
+xmltodict 로 응답 전체를 OrderedDict 트리로 만들지 않고
+xml.etree.ElementTree.XMLPullParser 로 읽으면서 실제로 쓰는 필드만 dict 로 뽑는다.
+
+- Order_Search : header + order_data (주문 단위 스칼라 필드,
+                 orderInfoData / orderGoodsData / addGoodsData)
+- Goods_Search : return/goods_data 중 goodsNo 가 일치하는 상품의 shortDescription (찾으면 바로 중단)
+
+읽은 element 는 바로 지워서 큰 응답도 메모리를 거의 쓰지 않는다.
+입력은 문자열 또는 문자열 조각(iterable, 예: resp.iter_content(decode_unicode=True)).
+"""
+import xml.etree.ElementTree as ET
+
+# order_data 아래에서 통째로 dict 로 만들 하위 요소
+ORDER_INFO_TAG = "orderInfoData"
+ORDER_LIST_TAGS = ("orderGoodsData", "addGoodsData", "orderAddGoodsData")
+
+# Goods_Search 상품 레코드 태그 (return 바로 아래)
+GOODS_TAGS = ("goods_data", "goodsData")
+
+
+def _chunks(source):
+    if isinstance(source, (str, bytes)):
+        yield source
+    else:
+        yield from source
+
+
+def _text(elem) -> str | None:
+    """요소 텍스트. xmltodict 기본값과 같이 앞뒤 공백을 지우고, 비었으면 None."""
+    return (elem.text or "").strip() or None
+
+
+def _element_to_dict(elem) -> dict:
+    """
+    하위 요소들을 xmltodict 와 같은 모양의 dict 로 변환.
+    (텍스트만 있는 요소 → 앞뒤 공백을 지운 문자열/None, 같은 태그가 여러 번 → 리스트, 속성은 버림)
+    """
+    out: dict = {}
+    for child in elem:
+        if len(child):
+            value = _element_to_dict(child)
+        else:
+            value = _text(child)
+
+        if child.tag in out:
+            prev = out[child.tag]
+            if isinstance(prev, list):
+                prev.append(value)
+            else:
+                out[child.tag] = [prev, value]
+        else:
+            out[child.tag] = value
+    return out
+
+
+def iter_order_page(source, header: dict | None = None):
+    """
+    Order_Search 응답 한 페이지에서 order_data 를 한 건씩 dict 로 yield 한다.
+
+    - header(dict)를 넘기면 응답의 header 값(max_page, now_page, total ...)을 채워 준다.
+    - 주문 dict 모양은 기존 xmltodict 결과와 같다
+      (단, orderGoodsData / addGoodsData 는 항상 리스트).
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list = []
+    order: dict | None = None
+
+    for chunk in _chunks(source):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == "order_data":
+                    order = {}
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            parent_tag = parent.tag if parent is not None else None
+
+            if elem.tag == "order_data":
+                if order is not None:
+                    yield order
+                order = None
+                if parent is not None:
+                    parent.remove(elem)
+                continue
+
+            if parent_tag == "order_data" and order is not None:
+                if elem.tag == ORDER_INFO_TAG:
+                    order[ORDER_INFO_TAG] = _element_to_dict(elem)
+                elif elem.tag in ORDER_LIST_TAGS:
+                    order.setdefault(elem.tag, []).append(_element_to_dict(elem))
+                elif not len(elem):
+                    order[elem.tag] = _text(elem)
+                parent.remove(elem)
+            elif parent_tag == "header" and header is not None and not len(elem):
+                header[elem.tag] = _text(elem)
+
+    parser.close()
+
+
+def find_short_description(source, goods_no: str) -> tuple[bool, str]:
+    """
+    Goods_Search 응답에서 goodsNo 가 일치하는 상품의 shortDescription 을 찾는다.
+
+    - 상품 레코드는 return 바로 아래의 goods_data 만 본다
+      (옵션 데이터처럼 안쪽에 goodsNo 를 가진 요소가 부모보다 먼저 끝나도 잘못 고르지 않도록)
+    - 일치하는 상품을 찾으면 나머지 응답은 읽지 않고 바로 반환
+    - 일치하는 상품이 없으면 첫 번째 상품 것을 사용 (기존 동작과 동일)
+
+    반환: (상품 존재 여부, shortDescription)
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list = []
+    first: str | None = None
+
+    for chunk in _chunks(source):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if elem.tag not in GOODS_TAGS or parent is None or parent.tag != "return":
+                continue
+
+            short_desc = (
+                elem.findtext("shortDescription")
+                or elem.findtext("short_desc")
+                or ""
+            ).strip()
+
+            if (elem.findtext("goodsNo") or "").strip() == goods_no:
+                return True, short_desc
+            if first is None:
+                first = short_desc
+            parent.remove(elem)
+
+    parser.close()
+    if first is None:
+        return False, ""
+    return True, first
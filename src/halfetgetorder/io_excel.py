@@ -1,23 +1,94 @@
 import os
 import sys
 import json
+import weakref
+from copy import copy
 import openpyxl
-from .godo import fetch_goods_base_specs
-from datetime import date
+from .godo import prefetch_goods_base_specs
+from . import templates
 from openpyxl.styles import PatternFill, Alignment, Font, Border, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.cell.text import InlineFont
+from openpyxl.formatting.formatting import ConditionalFormattingList
 from openpyxl.formatting.rule import FormulaRule
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .utils import visual_len, _to_int, _to_float
-from .utils import _fmt_dt, get_box_count_from_items
+from .utils import _fmt_dt
+from .waybill import SHEET_TITLE, WAYBILL_HEADER, waybill_rows, column_widths
 
+# ─────────────────────────────────────────────────────────
+# 공용 스타일
+#   셀마다 Font/Border/Alignment/PatternFill 을 새로 만들지 않고
+#   아래에 미리 만들어 둔 객체를 그대로 참조해서 쓴다.
+# ─────────────────────────────────────────────────────────
 header_fill = PatternFill(start_color="D8E4BC", end_color="D8E4BC", fill_type="solid")
 center = Alignment(horizontal='center', vertical='center', wrap_text=False)
 thin = Side(style="thin", color="000000")
 thick = Side(style="thick", color="000000")
 
+ALIGN_CENTER = Alignment(horizontal="center", vertical="center")
+ALIGN_CENTER_WRAP = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+FONT_BOLD = Font(bold=True)
+FONT_BODY = Font(name="Calibri", family=2, scheme="minor", size=12)   # 주문내역 기본 (크기만 12)
+FONT_PARENT = Font(bold=True, size=12)                                # 주문내역 부모행 상품명
+FONT_CHILD = Font(italic=True, size=12)                               # 주문내역 추가옵션 행
+
+FILL_PARENT = PatternFill(start_color="FFF7F7F7", end_color="FFF7F7F7", fill_type="solid")
+
+BORDER_BOX = Border(left=thin, right=thin, top=thin, bottom=thin)
+BORDER_BOX_BOTTOM = Border(left=thin, right=thin, top=thin, bottom=thick)   # 블록 마지막 행
+BORDER_MERGED = Border(left=thin, right=thin)                               # 병합된 수취인 칸
+BORDER_MERGED_BOTTOM = Border(left=thin, right=thin, bottom=thick)
+
+_style_arrays: "weakref.WeakKeyDictionary[openpyxl.Workbook, tuple[dict, dict]]" = weakref.WeakKeyDictionary()
+
+
+def _apply_style(cell, font=None, fill=None, border=None, alignment=None, number_format=None):
+    """
+    새 셀에 공용 스타일 조합을 적용한다.
+
+    같은 조합은 워크북마다 처음 한 번만 openpyxl 에 등록하고,
+    이후 셀에는 등록된 스타일 인덱스만 복사한다.
+    - 등록 키는 스타일 객체 자체 (값이 같으면 같은 스타일)
+    - 같은 객체를 다시 넘기는 경우가 대부분이라 id 로 먼저 찾는다. openpyxl 스타일 해시는
+      매번 모든 속성을 다시 계산해서 느리기 때문 (객체 키로만 찾으면 3000건 주문수집 저장이 약 1.5배).
+      찾은 항목이 같은 객체를 붙잡고 있어서, 버려진 객체의 id 가 재사용돼 엉뚱한 서식이 나오지 않는다.
+    """
+    wb = cell.parent.parent
+    caches = _style_arrays.get(wb)
+    if caches is None:
+        caches = _style_arrays[wb] = ({}, {})
+    by_id, by_value = caches
+
+    ids = (id(font), id(fill), id(border), id(alignment), number_format)
+    hit = by_id.get(ids)
+    if hit is not None:
+        f, fl, b, al, arr = hit
+        if f is font and fl is fill and b is border and al is alignment:
+            cell._style = copy(arr)
+            return
+
+    key = (font, fill, border, alignment, number_format)
+    arr = by_value.get(key)
+    if arr is None:
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if border is not None:
+            cell.border = border
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        arr = by_value[key] = copy(cell._style)
+    else:
+        cell._style = copy(arr)
+    by_id[ids] = (font, fill, border, alignment, arr)
+
 
 def get_project_root() -> str:
     """
@@ -52,28 +123,80 @@ except ImportError:
 # ─────────────────────────────────────────────────────────
 # 주문수집 엑셀 (주문내역)
 # ─────────────────────────────────────────────────────────
-def create_orders_sheet():
+ORDERS_HEADERS = [
+    '플랫폼',           # A
+    '주문일시',         # B
+    '총 상품결제금액',   # C
+    '체크',             # D
+    '수취인 이름',      # E
+    '상품명 + 옵션명',  # F
+    '수량',             # G
+    '등록옵션명',       # H (기존 I)
+    '배송메세지',       # I (기존 J)
+]
+
+ORDERS_MIN_WIDTHS = {
+    '플랫폼': 8,
+    '주문일시': 16,
+    '총 상품결제금액': 14,
+    '체크': 6,
+    '수취인 이름': 15,       # E열 15
+    '상품명 + 옵션명': 65,   # F열 65
+    '수량': 5,               # G열 5
+    '등록옵션명': 25,        # H열 25
+    '배송메세지': 35         # I열 35
+}
+
+# 체크 열(D열에 값이 있고, F열이 '+ '로 시작하지 않는 = 부모행만 색상 변경)
+ORDERS_CHECK_FORMULA = 'AND(LEN($D2)>0, LEFT($F2,2)<>" + ")'
+ORDERS_CHECK_FILL = "FFE6FFCC"
+
+
+def create_orders_sheet(use_template=True):
+    """
+    주문내역 시트 (헤더 행까지) 생성.
+
+    DATA_DIR/templates 에 주문수집 서식 템플릿이 있으면 그 파일의
+    헤더 행 / 확대 비율 / 조건부 서식 / 2~4행(기본·부모행·추가옵션 행) 글꼴과 배경색을 쓴다.
+    """
+    if use_template:
+        wb = templates.open_template(templates.ORDERS_TEMPLATE)
+        if wb is not None:
+            return wb, _orders_sheet_from_template(wb.active)
+
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "주문내역"
     # C열(총 상품결제금액)과 D열(체크) 사이에 '체크' 열 추가
-    headers = [
-        '플랫폼',           # A
-        '주문일시',         # B
-        '총 상품결제금액',   # C
-        '체크',             # D
-        '수취인 이름',      # E
-        '상품명 + 옵션명',  # F
-        '수량',             # G
-        '등록옵션명',       # H (기존 I)
-        '배송메세지',       # I (기존 J)
-    ]
-    ws.append(headers)
-    for c in ws[1]:
-        c.fill = header_fill
+    ws.append(ORDERS_HEADERS)
+    _orders_layout(ws).style_row(ws, 1, ORDERS_HEADERS, kind="header")
     return wb, ws
 
 
+def _orders_sheet_from_template(ws):
+    """템플릿 시트에서 서식 예시 행을 읽어 두고 헤더 행만 남긴다."""
+    layout = _orders_layout(ws)
+    layout.template = True
+    layout.palette = {
+        "body": copy(ws.cell(row=2, column=6).font),
+        "parent_font": copy(ws.cell(row=3, column=6).font),
+        "parent_fill": copy(ws.cell(row=3, column=6).fill),
+        "child_font": copy(ws.cell(row=4, column=6).font),
+    }
+    layout.check_rules = [rule for cf in ws.conditional_formatting for rule in cf.rules]
+
+    # 예시 행 / 병합 / 행 높이 / 조건부 서식은 데이터 행 기준으로 다시 만든다
+    for mcr in list(ws.merged_cells.ranges):
+        if mcr.min_row >= 2:
+            ws.merged_cells.remove(mcr)
+    if ws.max_row >= 2:
+        ws.delete_rows(2, ws.max_row - 1)
+    for r in [r for r in ws.row_dimensions if r >= 2]:
+        del ws.row_dimensions[r]
+    ws.conditional_formatting = ConditionalFormattingList()
+    return ws
+
+
 def create_orders_workbook(
     coupang_orders: list[dict],
     godo_grouped_orders: list[dict],
@@ -100,26 +223,25 @@ def create_orders_workbook(
 def apply_border_block(ws, start_row, end_row, start_col=1, end_col=9):
     for r in range(start_row, end_row + 1):
         for c in range(start_col, end_col + 1):
-            ws.cell(row=r, column=c).border = Border(
-                left=thin, right=thin, top=thin, bottom=thin
-            )
+            ws.cell(row=r, column=c).border = BORDER_BOX
 
 
 def apply_thick_bottom(ws, block_start, block_end, start_col=1, end_col=9):
     for c in range(start_col, end_col + 1):
         cell = ws.cell(row=block_end, column=c)
-        cell.border = Border(
-            left=cell.border.left or thin,
-            right=cell.border.right or thin,
-            top=cell.border.top or thin,
-            bottom=thick
-        )
+        cell.border = _with_thick_bottom(cell.border)
     # 굵은 테두리 시작 기준 컬럼도 수취인 이름(E열=5번)로 변경
     top_left = ws.cell(row=block_start, column=5)
-    top_left.border = Border(
-        left=top_left.border.left or thin,
-        right=top_left.border.right or thin,
-        top=top_left.border.top or thin,
+    top_left.border = _with_thick_bottom(top_left.border)
+
+
+def _with_thick_bottom(border) -> Border:
+    if border == BORDER_BOX:
+        return BORDER_BOX_BOTTOM
+    return Border(
+        left=border.left or thin,
+        right=border.right or thin,
+        top=border.top or thin,
         bottom=thick
     )
 
@@ -127,373 +249,277 @@ def apply_thick_bottom(ws, block_start, block_end, start_col=1, end_col=9):
 def merge_receiver_name(ws, start_row, end_row):
     # 수취인 이름이 이제 5열(E)이므로 5번 컬럼 기준으로 병합
     if end_row > start_row:
+        # (정렬은 행을 추가할 때 이미 가운데로 지정됨)
         ws.merge_cells(start_row=start_row, start_column=5, end_row=end_row, end_column=5)
-        ws.cell(row=start_row, column=5).alignment = Alignment(
-            horizontal='center',
-            vertical='center'
-        )
 
 
-def finalize_orders_sheet(ws):
-    ws.sheet_view.zoomScale = 75
-    min_widths = {
-        '플랫폼': 8,
-        '주문일시': 16,
-        '총 상품결제금액': 14,
-        '체크': 6,
-        '수취인 이름': 15,       # E열 15
-        '상품명 + 옵션명': 65,   # F열 65
-        '수량': 5,               # G열 5
-        '등록옵션명': 25,        # H열 25
-        '배송메세지': 35         # I열 35
-    }
-    headers = [cell.value for cell in ws[1]]
-
-    for col in ws.columns:
-        col_idx = col[0].column
-        col_letter = get_column_letter(col_idx)
-        header = headers[col_idx - 1] if col_idx - 1 < len(headers) else ''
-
-        max_len = visual_len(header)
-        for cell in col:
-            vlen = visual_len(cell.value)
-            if vlen > max_len:
-                max_len = vlen
-
-            # 줄바꿈 설정
-            if header in ('등록옵션명', '배송메세지'):
-                cell.alignment = Alignment(
-                    horizontal='center',
-                    vertical='center',
-                    wrap_text=True
-                )
-            elif header == '상품명 + 옵션명' and vlen > 50:
-                cell.alignment = Alignment(
-                    horizontal='center',
-                    vertical='center',
-                    wrap_text=True
-                )
-            else:
-                cell.alignment = Alignment(
-                    horizontal='center',
-                    vertical='center',
-                    wrap_text=False
-                )
-
-            if header == '등록옵션명':
-                cell.number_format = '@'
-
-        # ── 여기부터 열 너비 계산 로직 정리 ──
-        auto_width = int(max_len * 0.5)
-        if header == '등록옵션명':
-            auto_width = int(max_len * 0.5) + 4
-
-        if header == '상품명 + 옵션명':
-            # 항상 65 고정
-            target_width = 65
-        elif header == '배송메세지':
-            # 항상 35 고정
-            target_width = 35
-        else:
-            target_width = max(auto_width, min_widths.get(header, 12))
-
-        ws.column_dimensions[col_letter].width = target_width
-
+def _orders_alignment(header, vlen) -> Alignment:
+    """주문내역 셀 정렬 (등록옵션명/배송메세지, 긴 상품명만 줄바꿈)."""
+    if header in ('등록옵션명', '배송메세지') or (header == '상품명 + 옵션명' and vlen > 50):
+        return ALIGN_CENTER_WRAP
+    return center
 
 
+# 주문내역 데이터 행 글꼴/배경색 (템플릿이 있으면 템플릿 예시 행 것으로 바뀜)
+ORDERS_PALETTE = {
+    "body": FONT_BODY,
+    "parent_font": FONT_PARENT,
+    "parent_fill": FILL_PARENT,
+    "child_font": FONT_CHILD,
+}
 
-        # 상품명+옵션명 열(F), 배송메세지 열(I) 기준으로 행 높이 조정
-    for r in range(2, ws.max_row + 1):
-        prod_cell = ws.cell(row=r, column=6)  # F열
-        memo_cell = ws.cell(row=r, column=9)  # I열 (기존 10 → 9)
 
-        pclen = visual_len(prod_cell.value)
-        mlen = visual_len(memo_cell.value)
-
-        base_len = max(pclen, mlen)
-        rd = ws.row_dimensions[r]
+def _orders_row_styles(vlens, kind="body", block_first=True, block_last=True, palette=None):
+    """
+    주문내역 한 행의 셀별 스타일 (font, fill, border, alignment, number_format) 리스트.
 
-        # 이미 다른 데서 높이를 지정한 행(예: 부모행 height=65)은 건드리지 않는다
-        if rd.height is not None:
+    - kind: "header" / "body"(쿠팡) / "parent"(고도몰 본상품) / "parent_rich" / "child"(추가옵션)
+    - block_first / block_last: 주문 블록의 첫 행 / 마지막 행 여부 (테두리, 수취인 병합)
+    - palette: 글꼴/배경색 (기본 ORDERS_PALETTE)
+    """
+    palette = palette or ORDERS_PALETTE
+    styles = []
+    for i, header in enumerate(ORDERS_HEADERS):
+        alignment = _orders_alignment(header, vlens[i])
+        number_format = '@' if header == '등록옵션명' else None
+
+        if kind == "header":
+            styles.append((FONT_BODY, header_fill, None, alignment, number_format))
             continue
 
-        if base_len > 40:
-            rd.height = 34
-        else:
-            rd.height = 24
-
-
-    # 체크 열(D열에 값이 있고, F열이 '+ '로 시작하지 않는 = 부모행만 색상 변경)
-    last_row = ws.max_row
-    if last_row >= 2:
-        fill_checked = PatternFill(
-            start_color="FFE6FFCC",
-            end_color="FFE6FFCC",
-            fill_type="solid"
-        )
-
-        rule = FormulaRule(
-            formula=['AND(LEN($D2)>0, LEFT($F2,2)<>" + ")'],
-            fill=fill_checked
-        )
-
-        # A2 ~ I{마지막 행}까지 적용
-        ws.conditional_formatting.add(f"A2:I{last_row}", rule)
-
-    # 전체 글꼴 크기를 12로 통일 (기존 bold/italic, 색상 등은 유지)
-    for row in ws.iter_rows():
-        for cell in row:
-            font = cell.font or Font()
-            if font.size == 12:
-                continue
-            cell.font = font.copy(size=12)
+        border = BORDER_BOX_BOTTOM if block_last else BORDER_BOX
+        if i == 4:
+            # 수취인 이름(E열): 블록 첫 행은 굵은 밑줄, 나머지는 병합되는 칸
+            if block_first:
+                border = BORDER_BOX_BOTTOM
+            else:
+                border = BORDER_MERGED_BOTTOM if block_last else BORDER_MERGED
 
+        font, fill = palette["body"], None
+        if i == 5 and kind == "parent":
+            font, fill = palette["parent_font"], palette["parent_fill"]
+        elif i == 5 and kind == "parent_rich":
+            fill = palette["parent_fill"]
+        elif i == 5 and kind == "child":
+            font = palette["child_font"]
 
+        styles.append((font, fill, border, alignment, number_format))
+    return styles
 
 
-def append_coupang_block(ws, coupang_orders):
-    current_row = ws.max_row + 1
-    for od in coupang_orders:
-        block_start = current_row
-        ordered_at = _fmt_dt(od.get('orderedAt') or od.get('orderDate', ''))
+def _orders_column_width(header, max_len) -> int:
+    """주문내역 열 너비 (max_len: 헤더 포함 열에서 가장 긴 visual_len)."""
+    if header == '상품명 + 옵션명':
+        # 항상 65 고정
+        return 65
+    if header == '배송메세지':
+        # 항상 35 고정
+        return 35
 
-        total_price = 0.0
-        for item in od.get('orderItems', []):
-            price = _to_float(item.get('orderPrice', item.get('price', 0)))
-            qty = _to_int(item.get('shippingCount', 1), 1)
-            total_price += price * qty
-        total_price_str = f"{int(total_price):,}원"
+    auto_width = int(max_len * 0.5)
+    if header == '등록옵션명':
+        auto_width = int(max_len * 0.5) + 4
+    return max(auto_width, ORDERS_MIN_WIDTHS.get(header, 12))
 
-        receiver_name = (
-            (od.get('shippingAddress') or {}).get('name', '') or
-            (od.get('receiver') or {}).get('name', '')
-        )
-
-        item_names = []
-        total_qty = 0
-        for item in od.get('orderItems', []):
-            name = (
-                item.get('sellerProductName')
-                or item.get('vendorItemName')
-                or item.get('productName')
-                or ""
-            )
-            option = (
-                item.get('sellerProductItemName')
-                or item.get('vendorItemName')
-                or ""
-            )
-            qty = _to_int(item.get('shippingCount', 1), 1)
-            total_qty += qty
-            if name and option and option != name:
-                item_names.append(f"{name} / {option}")
-            else:
-                item_names.append(name or option)
-        product_info = " / ".join([x for x in item_names if x])
-        total_qty = total_qty or 1
-
-        # 등록옵션명 (쿠팡 기준: 상품명 사용)
-        reg_option_name = ""
-        items = od.get('orderItems') or []
-        if items:
-            first_item = items[0] or {}
-            reg_option_name = (
-                first_item.get('sellerProductName')
-                or first_item.get('vendorItemName')
-                or first_item.get('productName')
-                or ""
-            )
-
-        # 쿠팡 배송메세지: parcelPrintMessage
-        coupang_memo = od.get('parcelPrintMessage', '') or ''
-
-        # A:플랫폼, B:주문일시, C:총금액, D:체크, E:수취인, F:상품+옵션, G:수량,
-        # H:등록옵션명, I:배송메세지
-        ws.append([
-            "쿠팡",
-            ordered_at,
-            total_price_str,
-            "",                # 체크 열
-            receiver_name,
-            product_info,
-            total_qty,
-            reg_option_name,
-            coupang_memo,
-        ])
-        current_row += 1
-
-        apply_border_block(ws, block_start, current_row - 1, 1, 9)
-        merge_receiver_name(ws, block_start, current_row - 1)
-        apply_thick_bottom(ws, block_start, current_row - 1, 1, 9)
 
+def _orders_row_height(kind, vlens):
+    """
+    주문내역 행 높이. 헤더는 지정 안 함(None), 고도몰 부모행은 65,
+    나머지는 상품명+옵션명 열(F), 배송메세지 열(I) 길이 기준.
+    """
+    if kind == "header":
+        return None
+    if kind in ("parent", "parent_rich"):
+        return 65
+    return 34 if max(vlens[5], vlens[8]) > 40 else 24
+
+
+def _orders_check_rule() -> FormulaRule:
+    fill_checked = PatternFill(
+        start_color=ORDERS_CHECK_FILL,
+        end_color=ORDERS_CHECK_FILL,
+        fill_type="solid"
+    )
+    return FormulaRule(formula=[ORDERS_CHECK_FORMULA], fill=fill_checked)
 
 
-# ─────────────────────────────────────────────────────────
-# 고도몰 상품 기본 사양 / 옵션 관련
-# ─────────────────────────────────────────────────────────
-def _parse_short_desc_to_specs(short_desc: str) -> tuple[str, str]:
+class _OrdersLayout:
     """
-    shortDescription 예시:
-      'DeLL Latitude 5501 / Intel® Core™ i7-9850H / NVIDIA GeForce MX150 /
-       NVMe SSD 512G / DDR4 32G / FHD ... / 윈도우11'
+    주문내역 시트 레이아웃을 행을 추가할 때마다 같이 계산해 두는 객체.
 
-    '/' 로 나눈 뒤:
-      index 3 → SSD 파트 (예: 'NVMe SSD 512G')
-      index 4 → RAM 파트 (예: 'DDR4 32G')
+    - 열마다 가장 긴 visual_len (→ finalize 에서 열 너비)
+    - 셀 정렬/줄바꿈, 등록옵션명 '@' 서식, 글꼴 크기 12, 행 높이는 행을 추가할 때 바로 지정
     """
-    if not short_desc:
-        return "", ""
 
-    parts = [p.strip() for p in str(short_desc).split("/") if p.strip()]
+    def __init__(self):
+        self.max_lens = [0] * len(ORDERS_HEADERS)
+        self.last_row = 1
+        self.template = False       # 템플릿 시트면 확대 비율/조건부 서식은 템플릿 것을 사용
+        self.palette = None
+        self.check_rules = None
 
-    ssd = parts[3].strip() if len(parts) > 3 else ""
-    ram = parts[4].strip() if len(parts) > 4 else ""
+    def style_row(self, ws, row_no, values, kind="body", block_first=True, block_last=True):
+        """
+        방금 추가한 행(row_no)에 최종 스타일과 행 높이를 지정하고 열 길이를 갱신한다.
+        (kind / block_first / block_last 는 _orders_row_styles 참고)
+        """
+        vlens = [visual_len(v) for v in values]
+        for i, vlen in enumerate(vlens):
+            if vlen > self.max_lens[i]:
+                self.max_lens[i] = vlen
 
-    # (RAM, SSD) 순서로 반환
-    return ram, ssd
+        styles = _orders_row_styles(vlens, kind, block_first, block_last, self.palette)
+        for c, style in enumerate(styles, start=1):
+            _apply_style(ws.cell(row=row_no, column=c), *style)
 
+        height = _orders_row_height(kind, vlens)
+        if height is not None:
+            ws.row_dimensions[row_no].height = height
+            self.last_row = max(self.last_row, row_no)
 
-def _build_base_specs_from_raw(raw) -> dict:
-    """
-    raw 를 {상품번호: {ram, ssd}} 형태로 정규화.
-
-    지원 형태:
-      1) 딕셔너리:
-         {
-           "1000001": { "ram": "16G", "ssd": "512G" }
-           "1000002": { "shortDescription": "..." }
-           "1000003": "DeLL Latitude 5501 / ... / NVMe SSD 512G / DDR4 32G / ..."
-         }
-
-      2) 리스트:
-         [
-           { "goodsNo": "1000001", "ram": "16G", "ssd": "512G" },
-           { "goodsNo": "1000002", "shortDescription": "..." },
-           { "goodsNo": "1000003", "shortDescription": "..." },
-         ]
-    """
-    base_specs: dict[str, dict[str, str]] = {}
-
-    # case 1: dict
-    if isinstance(raw, dict):
-        for key, val in raw.items():
-            goods_key = str(key).strip()
-            if not goods_key:
-                continue
-
-            ram = ""
-            ssd = ""
-
-            if isinstance(val, dict):
-                ram = str(val.get("ram", "")).strip()
-                ssd = str(val.get("ssd", "")).strip()
-                short_desc = str(val.get("shortDescription", "")).strip()
-
-                # ram/ssd 없으면 shortDescription에서 뽑기
-                if short_desc and (not ram or not ssd):
-                    ram2, ssd2 = _parse_short_desc_to_specs(short_desc)
-                    ram = ram or ram2
-                    ssd = ssd or ssd2
-            else:
-                # 값이 그냥 shortDescription 문자열인 경우
-                short_desc = str(val).strip()
-                if short_desc:
-                    ram, ssd = _parse_short_desc_to_specs(short_desc)
 
-            base_specs[goods_key] = {"ram": ram, "ssd": ssd}
+_layouts: "weakref.WeakKeyDictionary[Worksheet, _OrdersLayout]" = weakref.WeakKeyDictionary()
 
-    # case 2: list
-    elif isinstance(raw, list):
-        for row in raw:
-            if not isinstance(row, dict):
-                continue
 
-            goods_key = str(
-                row.get("goodsNo") or row.get("goodsCd") or ""
-            ).strip()
-            if not goods_key:
-                continue
+def _orders_layout(ws) -> _OrdersLayout:
+    layout = _layouts.get(ws)
+    if layout is None:
+        layout = _layouts[ws] = _OrdersLayout()
+    return layout
 
-            ram = str(row.get("ram", "")).strip()
-            ssd = str(row.get("ssd", "")).strip()
-            short_desc = str(row.get("shortDescription", "")).strip()
 
-            if short_desc and (not ram or not ssd):
-                ram2, ssd2 = _parse_short_desc_to_specs(short_desc)
-                ram = ram or ram2
-                ssd = ssd or ssd2
+def finalize_orders_sheet(ws):
+    """
+    append_coupang_block / append_godo_sets 에서 모아 둔 값으로
+    열 너비, 확대 비율, 체크 열 조건부 서식만 쓴다. (셀을 다시 훑지 않음)
+    """
+    layout = _orders_layout(ws)
+    if not layout.template:
+        ws.sheet_view.zoomScale = 75
 
-            base_specs[goods_key] = {"ram": ram, "ssd": ssd}
+    for c, header in enumerate(ORDERS_HEADERS, start=1):
+        max_len = max(visual_len(header), layout.max_lens[c - 1])
+        ws.column_dimensions[get_column_letter(c)].width = _orders_column_width(header, max_len)
 
-    return base_specs
+    if layout.last_row >= 2:
+        # A2 ~ I{마지막 행}까지 적용
+        rules = layout.check_rules if layout.template else [_orders_check_rule()]
+        for rule in rules:
+            ws.conditional_formatting.add(f"A2:I{layout.last_row}", rule)
 
 
-def load_godo_base_specs_map(path: str | None = None) -> dict:
+def _coupang_order_row(od) -> list:
     """
-    고도몰 상품 기본 RAM/SSD 사양 로드.
-
-    우선순위:
-      1) 인자로 받은 path
-      2) 프로젝트 루트의 godo_base_specs.json
-
-    예전에는 godo_goods_all.json(상품 전체 캐시)을 함께 사용했지만,
-    이제는 대용량 JSON 파일을 만들지 않고
-    필요한 경우 Goods_Search API를 직접 호출하는 방식으로 변경했다.
+    쿠팡 주문 한 건 → 주문내역 시트 한 행의 값
+    (A:플랫폼, B:주문일시, C:총금액, D:체크, E:수취인, F:상품+옵션, G:수량,
+     H:등록옵션명, I:배송메세지)
     """
-    project_root = get_project_root()
-
-    candidates: list[str] = []
-    if path:
-        candidates.append(path)
-    candidates.append(os.path.join(project_root, "godo_base_specs.json"))
-
-    for p in candidates:
-        if not p:
-            continue
-        if not os.path.exists(p):
-            continue
+    ordered_at = _fmt_dt(od.get('orderedAt') or od.get('orderDate', ''))
+
+    total_price = 0.0
+    for item in od.get('orderItems', []):
+        price = _to_float(item.get('orderPrice', item.get('price', 0)))
+        qty = _to_int(item.get('shippingCount', 1), 1)
+        total_price += price * qty
+    total_price_str = f"{int(total_price):,}원"
+
+    receiver_name = (
+        (od.get('shippingAddress') or {}).get('name', '') or
+        (od.get('receiver') or {}).get('name', '')
+    )
 
-        try:
-            with open(p, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            specs = _build_base_specs_from_raw(raw)
-        except Exception as e:
-            print(f"⚠️ 기본 사양 파일({p})을 읽는 중 오류: {e}")
-            continue
+    item_names = []
+    total_qty = 0
+    for item in od.get('orderItems', []):
+        name = (
+            item.get('sellerProductName')
+            or item.get('vendorItemName')
+            or item.get('productName')
+            or ""
+        )
+        option = (
+            item.get('sellerProductItemName')
+            or item.get('vendorItemName')
+            or ""
+        )
+        qty = _to_int(item.get('shippingCount', 1), 1)
+        total_qty += qty
+        if name and option and option != name:
+            item_names.append(f"{name} / {option}")
+        else:
+            item_names.append(name or option)
+    product_info = " / ".join([x for x in item_names if x])
+    total_qty = total_qty or 1
+
+    # 등록옵션명 (쿠팡 기준: 상품명 사용)
+    reg_option_name = ""
+    items = od.get('orderItems') or []
+    if items:
+        first_item = items[0] or {}
+        reg_option_name = (
+            first_item.get('sellerProductName')
+            or first_item.get('vendorItemName')
+            or first_item.get('productName')
+            or ""
+        )
 
-        if specs:
-            print(f"[라벨] 고도몰 기본 RAM/SSD 사양 {len(specs)}건 로드 ({p})")
-            return specs
+    # 쿠팡 배송메세지: parcelPrintMessage
+    coupang_memo = od.get('parcelPrintMessage', '') or ''
+
+    return [
+        "쿠팡",
+        ordered_at,
+        total_price_str,
+        "",                # 체크 열
+        receiver_name,
+        product_info,
+        total_qty,
+        reg_option_name,
+        coupang_memo,
+    ]
 
-    print("ℹ️ godo_base_specs.json 을 찾지 못했습니다. 고도몰 기본 RAM/SSD는 API에서 보완 조회합니다.")
-    return {}
 
+def _coupang_blocks(coupang_orders):
+    """쿠팡 주문 → 주문내역 블록 (주문 한 건 = 한 행)."""
+    for od in coupang_orders or []:
+        yield [("body", _coupang_order_row(od), None, None)]
 
 
-def get_godo_base_ram_ssd(parent: dict, base_specs_map: dict) -> tuple[str, str]:
+def _append_order_blocks(ws, blocks):
     """
-    고도몰 parent(본상품) 한 건에 대해 기본 RAM/SSD 를 조회.
-    - 우선 goodsNo 로 찾고
-    - 없으면 goodsCd 로도 한 번 더 찾아본다.
+    블록(주문 한 건 = 테두리/병합 단위)을 시트 끝에 추가한다.
+    행마다 _orders_row_styles 의 최종 스타일을 한 번에 적용하고, 수취인 칸을 병합한다.
     """
-    goods_no = str(parent.get("goodsNo") or "").strip()
-    goods_cd = str(parent.get("goodsCd") or "").strip()
+    layout = _orders_layout(ws)
+    current_row = ws.max_row + 1
 
-    spec = None
-    if goods_no:
-        spec = base_specs_map.get(goods_no)
-    if spec is None and goods_cd:
-        spec = base_specs_map.get(goods_cd)
+    for block in blocks:
+        block_start = current_row
+        block_end = current_row + len(block) - 1
+
+        for kind, values, product_name, option_info in block:
+            ws.append(values)
+            layout.style_row(
+                ws, current_row, values, kind,
+                block_first=current_row == block_start,
+                block_last=current_row == block_end,
+            )
+            if kind == "parent_rich":
+                ws.cell(row=current_row, column=6).value = _godo_parent_rich_text(
+                    product_name, option_info
+                )
+            current_row += 1
 
-    if not spec:
-        return "", ""
+        merge_receiver_name(ws, block_start, block_end)
 
-    ram = str(spec.get("ram", "")).strip()
-    ssd = str(spec.get("ssd", "")).strip()
-    return ram, ssd
 
+def append_coupang_block(ws, coupang_orders):
+    _append_order_blocks(ws, _coupang_blocks(coupang_orders))
 
 
+# ─────────────────────────────────────────────────────────
+# 고도몰 상품 기본 사양 / 옵션 관련
+# ─────────────────────────────────────────────────────────
 ### 이제 사용하지 않는 함수
 def load_godo_goods_map(path: str | None = None) -> dict:
     """
@@ -635,6 +661,117 @@ def extract_specs_from_coupang_item(
     return ram, ssd, option_str
 
 
+def _godo_parent_option_info(p) -> str:
+    """부모 상품 옵션 문자열 (orderoptionInfo 우선, 없으면 optionInfo JSON 파싱)."""
+    # 1) orderoptionInfo / orderOptionInfo 우선
+    option_info = (
+        (p.get('orderoptionInfo') or '').strip()
+        or (p.get('orderOptionInfo') or '').strip()
+    )
+
+    # 2) 없으면 optionInfo(JSON 문자열) 파싱
+    if not option_info:
+        raw_opt = (p.get('optionInfo') or '').strip()
+        if raw_opt:
+            try:
+                opt_list = json.loads(raw_opt)  # [[옵션명, 옵션값, ...], ...]
+                parts = []
+                for opt in opt_list:
+                    if isinstance(opt, (list, tuple)) and len(opt) >= 2:
+                        name = str(opt[0]).strip()
+                        val = str(opt[1]).strip()
+                        if name and val:
+                            parts.append(f"{name}: {val}")
+                option_info = "\n".join(parts)
+            except Exception:
+                option_info = ""
+    return option_info
+
+
+def _godo_order_rows(grp):
+    """
+    고도몰 주문 한 건 → 주문내역 시트 행들을 순서대로 yield.
+
+    - ("parent", 값 리스트, 상품명, 옵션문자열)
+      (옵션이 있고 Rich Text 를 쓸 수 있으면 "parent_rich": 상품명 셀을 Rich Text 로 표시)
+    - ("child", 값 리스트, None, None)
+    """
+    first_parent = True
+    for s in grp["sets"]:
+        p = s["parent"]
+        goodsCd = (p.get('goodsCd') or '').strip()
+        goodsNm = (p.get('goodsNm') or p.get('goodsNmStandard') or '').strip()
+        qty = _to_int(p.get('goodsCnt', 1), 1)
+        price = _to_float(p.get('goodsPrice', 0.0), 0.0)
+
+        # 상품명
+        product_name = goodsNm or goodsCd
+        option_info = _godo_parent_option_info(p)
+
+        if option_info:
+            product_info_parent = f"{product_name}\n{option_info}"
+        else:
+            product_info_parent = product_name
+
+        reg_option_value = goodsCd
+
+        # 세트 총 금액
+        set_total = price * (qty or 1)
+        for add in s["children"]:
+            add_qty = _to_int(add.get('goodsCnt', 1), 1)
+            add_price = _to_float(add.get('goodsPrice', 0.0), 0.0)
+            set_total += add_price * add_qty
+        total_price_str = f"{int(set_total):,}원"
+
+        order_memo = (
+            grp.get("orderMemo", "")
+            or grp.get("orderInfo", {}).get("orderMemo", "")
+        )
+
+        kind = "parent_rich" if option_info and RICH_TEXT_AVAILABLE else "parent"
+        yield kind, [
+            "고도몰",
+            grp["orderedAt"] if first_parent else "",
+            total_price_str,
+            "",   # 체크 열
+            grp["receiver"]["name"] if first_parent else "",
+            product_info_parent,
+            (qty or 1),
+            reg_option_value,
+            order_memo if first_parent else ""
+        ], product_name, option_info
+        first_parent = False
+
+        # 자식(추가옵션) 행
+        for add in s["children"]:
+            add_name = (add.get('goodsNm') or add.get('goodsNmStandard') or '').strip()
+            add_qty = _to_int(add.get('goodsCnt', 1), 1)
+            yield "child", ["", "", "", "", "", f"+ {add_name}", add_qty, "", ""], None, None
+
+
+def _godo_parent_rich_text(product_name, option_info):
+    """부모행 상품명 셀: 상품명(굵게) + 줄바꿈 + 옵션(기울임)."""
+    return CellRichText(
+        TextBlock(
+            text=product_name,
+            font=InlineFont(b=True)
+        ),
+        TextBlock(
+            text="\n" + option_info,
+            font=InlineFont(
+                i=True,
+                
+            )
+        ),
+    )
+
+
+def _godo_blocks(grouped_orders):
+    """고도몰 주문 → 주문내역 블록. 자사몰 주문은 역순(최근 주문이 아래로)."""
+    for grp in reversed(grouped_orders or []):
+        yield list(_godo_order_rows(grp))
+
+
 def append_godo_sets(ws, grouped_orders):
     """
     고도몰 주문을 엑셀 주문내역 시트에 추가.
@@ -644,134 +781,90 @@ def append_godo_sets(ws, grouped_orders):
         optionInfo(옵션명: 값 ...)
       이렇게 줄바꿈해서 표시.
     """
-    current_row = ws.max_row + 1
+    _append_order_blocks(ws, _godo_blocks(grouped_orders))
 
-    # 자사몰 주문은 역순(최근 주문이 아래로)
-    for grp in reversed(grouped_orders):
-        block_start = current_row
-        first_parent = True
 
-        for s in grp["sets"]:
-            p = s["parent"]
-            goodsCd = (p.get('goodsCd') or '').strip()
-            goodsNm = (p.get('goodsNm') or p.get('goodsNmStandard') or '').strip()
-            qty = _to_int(p.get('goodsCnt', 1), 1)
-            price = _to_float(p.get('goodsPrice', 0.0), 0.0)
 
-            # 상품명
-            product_name = goodsNm or goodsCd
+# ─────────────────────────────────────────────────────────
+# 주문수집 엑셀 (write-only 스트리밍)
+# ─────────────────────────────────────────────────────────
+def _iter_order_blocks(coupang_orders, godo_grouped_orders):
+    """주문내역 시트의 블록을 순서대로 yield (쿠팡 → 고도몰)."""
+    yield from _coupang_blocks(coupang_orders)
+    yield from _godo_blocks(godo_grouped_orders)
 
-            # 1) orderoptionInfo / orderOptionInfo 우선
-            option_info = (
-                (p.get('orderoptionInfo') or '').strip()
-                or (p.get('orderOptionInfo') or '').strip()
-            )
 
-            # 2) 없으면 optionInfo(JSON 문자열) 파싱
-            if not option_info:
-                raw_opt = (p.get('optionInfo') or '').strip()
-                if raw_opt:
-                    try:
-                        opt_list = json.loads(raw_opt)  # [[옵션명, 옵션값, ...], ...]
-                        parts = []
-                        for opt in opt_list:
-                            if isinstance(opt, (list, tuple)) and len(opt) >= 2:
-                                name = str(opt[0]).strip()
-                                val = str(opt[1]).strip()
-                                if name and val:
-                                    parts.append(f"{name}: {val}")
-                        option_info = "\n".join(parts)
-                    except Exception:
-                        option_info = ""
+def save_orders_workbook(
+    path: str,
+    coupang_orders: list[dict],
+    godo_grouped_orders: list[dict],
+) -> int:
+    """
+    주문수집(주문내역) 엑셀을 openpyxl write_only 모드로 바로 파일에 쓴다.
 
-            if option_info:
-                product_info_parent = f"{product_name}\n{option_info}"
-            else:
-                product_info_parent = product_name
+    create_orders_workbook + finalize_orders_sheet 결과와 같은 모양이지만
+    셀을 메모리에 쌓아 두고 다시 훑지 않고, 행마다 스타일까지 다 정해서 한 번만 내보낸다.
+    (열 너비는 행보다 먼저 써야 해서 값 길이만 먼저 한 번 계산)
 
-            reg_option_value = goodsCd
+    반환: 쓴 주문 행 수 (헤더 제외)
+    """
+    # 1) 열 너비 (값 길이만 계산)
+    max_lens = [visual_len(h) for h in ORDERS_HEADERS]
+    for block in _iter_order_blocks(coupang_orders, godo_grouped_orders):
+        for _, values, _, _ in block:
+            for i, v in enumerate(values):
+                vlen = visual_len(v)
+                if vlen > max_lens[i]:
+                    max_lens[i] = vlen
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("주문내역")
+    ws.sheet_view.zoomScale = 75
+    for i, header in enumerate(ORDERS_HEADERS):
+        ws.column_dimensions[get_column_letter(i + 1)].width = _orders_column_width(
+            header, max_lens[i]
+        )
 
-            # 세트 총 금액
-            set_total = price * (qty or 1)
-            for add in s["children"]:
-                add_qty = _to_int(add.get('goodsCnt', 1), 1)
-                add_price = _to_float(add.get('goodsPrice', 0.0), 0.0)
-                set_total += add_price * add_qty
-            total_price_str = f"{int(set_total):,}원"
+    def append_row(values, cells_values, kind, block_first=True, block_last=True):
+        vlens = [visual_len(v) for v in values]
+        row = []
+        for value, style in zip(cells_values, _orders_row_styles(vlens, kind, block_first, block_last)):
+            cell = WriteOnlyCell(ws, value=value)
+            _apply_style(cell, *style)
+            row.append(cell)
+
+        height = _orders_row_height(kind, vlens)
+        if height is not None:
+            ws.row_dimensions[row_no].height = height
+        ws.append(row)
 
-            order_memo = (
-                grp.get("orderMemo", "")
-                or grp.get("orderInfo", {}).get("orderMemo", "")
-            )
+    # 2) 헤더
+    row_no = 1
+    append_row(ORDERS_HEADERS, ORDERS_HEADERS, "header")
 
-            ws.append([
-                "고도몰",
-                grp["orderedAt"] if first_parent else "",
-                total_price_str,
-                "",   # 체크 열
-                grp["receiver"]["name"] if first_parent else "",
-                product_info_parent,
-                (qty or 1),
-                reg_option_value,
-                order_memo if first_parent else ""
-            ])
-            current_row += 1
-            first_parent = False
-
-            # 부모 셀 스타일링 (6열)
-            prow = current_row - 1
-            pcell = ws.cell(row=prow, column=6)
-
-            if option_info and RICH_TEXT_AVAILABLE:
-                pcell.value = CellRichText(
-                    TextBlock(
-                        text=product_name,
-                        font=InlineFont(b=True)
-                    ),
-                    TextBlock(
-                        text="\n" + option_info,
-                        font=InlineFont(
-                            i=True,
-                            
-                        )
-                    ),
-                )
-            else:
-                pcell.value = product_info_parent
-                pcell.font = Font(bold=True)
+    # 3) 주문 행
+    for block in _iter_order_blocks(coupang_orders, godo_grouped_orders):
+        block_start = row_no + 1
+        block_end = row_no + len(block)
 
-            pcell.alignment = Alignment(
-                horizontal='left',
-                vertical='center',
-                wrap_text=True
-            )
-            pcell.fill = PatternFill(
-                start_color="FFF7F7F7",
-                end_color="FFF7F7F7",
-                fill_type="solid"
-            )
+        for kind, values, product_name, option_info in block:
+            row_no += 1
+            cells_values = list(values)
+            if row_no != block_start:
+                cells_values[4] = None    # 병합되는 수취인 칸
+            if kind == "parent_rich":
+                cells_values[5] = _godo_parent_rich_text(product_name, option_info)
+            append_row(values, cells_values, kind, row_no == block_start, row_no == block_end)
 
-            ws.row_dimensions[prow].height = 65
-
-            # 자식(추가옵션) 행
-            for add in s["children"]:
-                add_name = (add.get('goodsNm') or add.get('goodsNmStandard') or '').strip()
-                add_qty = _to_int(add.get('goodsCnt', 1), 1)
-                ws.append(["", "", "", "", "", f"+ {add_name}", add_qty, "", ""])
-                current_row += 1
-                crow = current_row - 1
-                ccell = ws.cell(row=crow, column=6)
-                ccell.font = Font(italic=True)
-                ccell.alignment = Alignment(
-                    horizontal='left',
-                    vertical='center',
-                    indent=1
-                )
+        if block_end > block_start:
+            ws.merged_cells.add(f"E{block_start}:E{block_end}")
 
-        apply_border_block(ws, block_start, current_row - 1, 1, 9)
-        merge_receiver_name(ws, block_start, current_row - 1)
-        apply_thick_bottom(ws, block_start, current_row - 1, 1, 9)
+    if row_no >= 2:
+        # A2 ~ I{마지막 행}까지 적용
+        ws.conditional_formatting.add(f"A2:I{row_no}", _orders_check_rule())
 
+    wb.save(path)
+    return row_no - 1
 
 
 # ─────────────────────────────────────────────────────────
@@ -783,6 +876,8 @@ def create_label_workbook(
     godo_base_specs_path: str | None = None,
     godo_goods_all_path: str | None = None,
     godo_add_goods_map_path: str | None = None,  # ← 지금은 사용하지 않지만, 시그니처 유지
+    godo_base_specs: dict[str, tuple[str, str]] | None = None,
+    use_template: bool = True,
 ) -> tuple[openpyxl.Workbook, Worksheet]:
     """
     라벨 출력용 엑셀 워크북 생성.
@@ -799,7 +894,11 @@ def create_label_workbook(
       - goodsCnt(수량) 만큼 행 반복
       - 모델명 셀: "모델명\\noptionInfo"
       - 옵션 셀: children[*].goodsNm 을 줄바꿈으로 표시
-      - 기본 RAM/SSD: godo_base_specs_map + godo_goods_all.json
+      - 기본 RAM/SSD: godo_base_specs ({goodsNo: (ram, ssd)})
+        없으면 godo.prefetch_goods_base_specs() 로 한 번에 미리 조회
+
+    서식(헤더, 열 너비, 확대 비율, 데이터 행 서식)은 라벨출력 템플릿
+    (DATA_DIR/templates → resources/templates)이 있으면 그대로 쓰고, 없으면 코드 기본값.
     """
     keyskin_models = [
         "그램 17",
@@ -808,21 +907,27 @@ def create_label_workbook(
         "키보드 키스킨",
     ]
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "라벨"
-
-    headers = ["플랫폼", "이름", "모델명", "램", "SSD", "옵션"]
-    ws.append(headers)
-    for cell in ws[1]:
-        cell.fill = PatternFill(
-            start_color="D8E4BC",
-            end_color="D8E4BC",
-            fill_type="solid",
-        )
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    # 고도몰 기본 사양/상품 정보 로드
+    wb = templates.open_template(templates.LABEL_TEMPLATE) if use_template else None
+    if wb is not None:
+        ws = wb.active
+        # 2행 = 데이터 행 서식 예시 → 열마다 셀 서식을 복사해 두고 비운다
+        row_styles = [copy(cell._style) for cell in ws[2]] if ws.max_row >= 2 else None
+        if ws.max_row >= 2:
+            ws.delete_rows(2, ws.max_row - 1)
+    else:
+        row_styles = None
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "라벨"
+
+        headers = ["플랫폼", "이름", "모델명", "램", "SSD", "옵션"]
+        ws.append(headers)
+        for cell in ws[1]:
+            _apply_style(cell, fill=header_fill, alignment=ALIGN_CENTER)
+
+    # 고도몰 기본 사양 미리 조회 (goodsNo 중복 제거 + 병렬 호출)
+    if godo_base_specs is None:
+        godo_base_specs = prefetch_goods_base_specs(godo_grouped_orders)
     missing_base_spec_ids: set[str] = set()
 
     # 1) 쿠팡 라벨
@@ -871,9 +976,9 @@ def create_label_workbook(
 
             model_name = (parent.get("goodsCd") or "").strip()
 
-            # ✅ 기본 RAM/SSD는 json 파일을 전혀 보지 않고, goodsNo 기준으로 API에서 바로 조회
+            # ✅ 기본 RAM/SSD는 미리 조회해 둔 맵에서 goodsNo 기준으로 꺼내 쓴다
             goods_no = str(parent.get("goodsNo") or "").strip()
-            base_ram, base_ssd = fetch_goods_base_specs(goods_no)
+            base_ram, base_ssd = godo_base_specs.get(goods_no, ("", ""))
 
             if not (base_ram or base_ssd):
                 key = goods_no or model_name
@@ -925,32 +1030,21 @@ def create_label_workbook(
                 )
 
     # 서식 설정
-    for row in ws.iter_rows(min_row=2):
-        for cell in row:
-            if cell.column_letter in ("C", "F"):
-                cell.alignment = Alignment(
-                    horizontal="center",
-                    vertical="center",
-                    wrap_text=True,
-                )
-            else:
-                cell.alignment = Alignment(
-                    horizontal="center",
-                    vertical="center",
-                )
-
-    width_map = {
-        "A": 10,
-        "B": 18,
-        "C": 45,
-        "D": 12,
-        "E": 12,
-        "F": 30,
-    }
-    for col, w in width_map.items():
-        ws.column_dimensions[col].width = w
-
-    ws.sheet_view.zoomScale = 90
+    style_label_rows(ws, row_styles)
+
+    if row_styles is None:
+        width_map = {
+            "A": 10,
+            "B": 18,
+            "C": 45,
+            "D": 12,
+            "E": 12,
+            "F": 30,
+        }
+        for col, w in width_map.items():
+            ws.column_dimensions[col].width = w
+
+        ws.sheet_view.zoomScale = 90
 
     if missing_base_spec_ids:
         print(
@@ -961,6 +1055,21 @@ def create_label_workbook(
     return wb, ws
 
 
+def style_label_rows(ws, row_styles=None):
+    """
+    라벨 시트 데이터 행(2행~) 서식.
+    row_styles(템플릿 예시 행의 열별 셀 서식)가 있으면 그대로 복사, 없으면 기본 정렬.
+    """
+    for row in ws.iter_rows(min_row=2):
+        for cell in row:
+            if row_styles is not None and cell.column <= len(row_styles):
+                cell._style = copy(row_styles[cell.column - 1])
+            elif cell.column_letter in ("C", "F"):
+                _apply_style(cell, alignment=ALIGN_CENTER_WRAP)
+            else:
+                _apply_style(cell, alignment=ALIGN_CENTER)
+
+
 # ─────────────────────────────────────────────────────────
 # 대한통운 송장등록 엑셀
 # ─────────────────────────────────────────────────────────
@@ -969,73 +1078,27 @@ def create_waybill_workbook(coupang_orders):
     대한통운 송장등록용 엑셀 워크북 생성.
     - 시트명: '판매 주문수집'
     - 열 구조: 기존 단일 파일 버전의 first_col1 과 동일
+
+    파일로 저장만 할 때는 openpyxl 을 쓰지 않는 waybill.write_waybill_xlsx 가 더 빠르다.
     """
     wb = openpyxl.Workbook()
     ws = wb.active
-    ws.title = "판매 주문수집"
+    ws.title = SHEET_TITLE
     ws.sheet_view.zoomScale = 75
 
-    header = [
-        '예약구분', '집하예정일', '받는분성명', '받는분전화번호', '받는분기타연락처',
-        '받는분우편번호', '받는분주소(전체, 분할)', '운송장번호', '고객주문번호',
-        '품목명', '박스수량', '박스타입', '기본운임', '배송메세지1',
-        '배송메세지2', '품목명', '운임구분'
-    ]
-    ws.append(header)
-
-    header_font = Font(bold=True)
-    header_align = Alignment(horizontal="center", vertical="center")
+    ws.append(WAYBILL_HEADER)
     for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_align
-
-    today_str = date.today().strftime('%Y%m%d')
+        _apply_style(cell, font=FONT_BOLD, fill=header_fill, alignment=ALIGN_CENTER)
 
-    for od in coupang_orders:
-        name = od.get("name", "")
-        phone = od.get("phone", "")
-        addr1 = od.get("addr1", "")
-        addr2 = od.get("addr2", "")
-        zipcode = od.get("zipcode", "")
-        address = f"{addr1} {addr2}".strip()
-
-        box_cnt = get_box_count_from_items(od.get("items", []))
-        platform_name = "쿠팡"
-
-        row = [
-            "일반",
-            today_str,
-            name,
-            phone,
-            "",
-            zipcode,
-            address,
-            "",
-            "",
-            "",
-            box_cnt,
-            "",
-            "",
-            "",
-            platform_name,
-            "",
-            "신용"
-        ]
+    rows = list(waybill_rows(coupang_orders))
+    for row in rows:
         ws.append(row)
 
-    center_align = Alignment(horizontal="center", vertical="center")
-    for row in ws.iter_rows():
+    for row in ws.iter_rows(min_row=2):
         for cell in row:
-            cell.alignment = center_align
-
-    for column_cells in ws.columns:
-        max_len = 0
-        col_letter = column_cells[0].column_letter
-        for cell in column_cells:
-            val = str(cell.value) if cell.value is not None else ""
-            if len(val) > max_len:
-                max_len = len(val)
-        ws.column_dimensions[col_letter].width = max_len * 1.3 + 2
+            _apply_style(cell, alignment=ALIGN_CENTER)
+
+    for i, width in enumerate(column_widths(rows), start=1):
+        ws.column_dimensions[get_column_letter(i)].width = width
 
     return wb, ws
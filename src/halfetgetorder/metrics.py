@@ -0,0 +1,196 @@
+"""
+외부 API 호출 지표 (client.request 가 호출마다 기록).
+
+- 호출 한 건: 엔드포인트, 상태코드, 소요 시간, 보낸/받은 바이트, 재시도 횟수,
+  속도 제한(ratelimit)으로 기다린 시간
+- 엔드포인트별로 모아서 응답 시간 히스토그램(ms 구간)과 합계를 유지한다.
+- 실행이 끝나면 take() 로 이번 실행분을 꺼내 DATA_DIR/api_metrics.jsonl 에 한 줄씩 쌓는다.
+  (최근 MAX_HISTORY 줄만 유지)
+
+    python -m halfetgetorder.metrics [--last 50]    # 쌓인 기록을 엔드포인트별로 합쳐서 출력
+
+타임아웃 / 동시 호출 수를 정할 때 p95, 최대 응답 시간과 재시도 비율을 보면 된다.
+"""
+import argparse
+import bisect
+import json
+import os
+import threading
+from datetime import datetime
+
+from . import config
+
+HISTORY_FILE = "api_metrics.jsonl"
+MAX_HISTORY = 1000
+
+# 응답 시간 히스토그램 구간 상한 (ms). 마지막 칸은 그 이상 전부.
+BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+_lock = threading.Lock()
+_endpoints: dict[str, dict] = {}
+
+
+def _empty() -> dict:
+    return {
+        "calls": 0,
+        "errors": 0,          # 예외(타임아웃/연결 오류) 또는 4xx/5xx 로 끝난 호출
+        "retries": 0,
+        "throttled": 0,       # 속도 제한 때문에 기다린 호출 수
+        "ms_throttled": 0.0,  # 기다린 시간 합계 (ms_total 에는 포함하지 않음)
+        "status": {},
+        "ms_total": 0.0,
+        "ms_max": 0.0,
+        "bytes_out": 0,
+        "bytes_in": 0,
+        "histogram": [0] * (len(BUCKETS_MS) + 1),
+    }
+
+
+def record(
+    endpoint: str,
+    status: int | None,
+    seconds: float,
+    bytes_out: int = 0,
+    bytes_in: int = 0,
+    retries: int = 0,
+    throttled: float = 0.0,
+) -> None:
+    """호출 한 건 기록. status 가 None 이면 응답을 못 받은 호출(예외). throttled: 속도 제한 대기 초."""
+    ms = seconds * 1000
+    with _lock:
+        st = _endpoints.get(endpoint)
+        if st is None:
+            st = _endpoints[endpoint] = _empty()
+        st["calls"] += 1
+        st["retries"] += retries
+        if throttled > 0:
+            st["throttled"] += 1
+            st["ms_throttled"] += throttled * 1000
+        key = str(status) if status is not None else "error"
+        st["status"][key] = st["status"].get(key, 0) + 1
+        if status is None or status >= 400:
+            st["errors"] += 1
+        st["ms_total"] += ms
+        st["ms_max"] = max(st["ms_max"], ms)
+        st["bytes_out"] += bytes_out
+        st["bytes_in"] += bytes_in
+        st["histogram"][bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+
+def take() -> dict[str, dict]:
+    """지금까지 모인 지표를 꺼내고 비운다 (실행 단위로 끊어 쓰기)."""
+    global _endpoints
+    with _lock:
+        out, _endpoints = _endpoints, {}
+    return out
+
+
+def percentile(st: dict, q: float) -> float:
+    """히스토그램으로 추정한 q 분위 응답 시간(ms, 구간 상한값)."""
+    total = sum(st["histogram"])
+    if not total:
+        return 0.0
+    need = q * total
+    seen = 0
+    for i, n in enumerate(st["histogram"]):
+        seen += n
+        if seen >= need:
+            return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else st["ms_max"]
+    return st["ms_max"]
+
+
+def merge(into: dict, st: dict) -> dict:
+    """엔드포인트 지표 st 를 into 에 더한다."""
+    for key in ("calls", "errors", "retries", "throttled", "ms_throttled", "ms_total", "bytes_out", "bytes_in"):
+        into[key] += st.get(key, 0)
+    into["ms_max"] = max(into["ms_max"], st.get("ms_max", 0.0))
+    for code, n in (st.get("status") or {}).items():
+        into["status"][code] = into["status"].get(code, 0) + n
+    for i, n in enumerate(st.get("histogram") or []):
+        if i < len(into["histogram"]):
+            into["histogram"][i] += n
+    return into
+
+
+def summary_lines(endpoints: dict[str, dict]) -> list[str]:
+    lines = []
+    for name, st in sorted(endpoints.items()):
+        avg = st["ms_total"] / st["calls"] if st["calls"] else 0.0
+        lines.append(
+            f"{name}: {st['calls']}회"
+            f" / 평균 {avg:.0f}ms, p50≤{percentile(st, 0.5):.0f}ms, p95≤{percentile(st, 0.95):.0f}ms,"
+            f" 최대 {st['ms_max']:.0f}ms"
+            f" / 재시도 {st['retries']} / 오류 {st['errors']}"
+            f" / 수신 {st['bytes_in'] / 1024:.1f}KB"
+            + (f" / 속도 제한 대기 {st['throttled']}회 {st['ms_throttled'] / 1000:.1f}초" if st.get("throttled") else "")
+        )
+    return lines
+
+
+def append_history(endpoints: dict[str, dict], started_at: datetime | None = None) -> None:
+    """이번 실행 지표를 기록 파일에 한 줄 추가 (실패해도 실행에는 영향 없음)."""
+    if not endpoints:
+        return
+    line = json.dumps({
+        "ts": (started_at or datetime.now()).isoformat(timespec="seconds"),
+        "buckets_ms": BUCKETS_MS,
+        "endpoints": endpoints,
+    }, ensure_ascii=False)
+    try:
+        path = os.path.join(config.data_dir(), HISTORY_FILE)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        _trim(path)
+    except OSError as e:
+        print("⚠️ API 호출 지표 저장 실패:", e)
+
+
+def _trim(path: str) -> None:
+    """MAX_HISTORY 줄을 조금 넘으면 최근 MAX_HISTORY 줄만 남긴다 (매번 다시 쓰지 않도록 여유를 둠)."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    if len(lines) <= MAX_HISTORY + MAX_HISTORY // 10:
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(lines[-MAX_HISTORY:])
+    os.replace(tmp, path)
+
+
+def load_history(last: int | None = None) -> list[dict]:
+    path = os.path.join(config.DATA_DIR, HISTORY_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    return rows[-last:] if last else rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API 호출 지표 요약")
+    parser.add_argument("--last", type=int, default=None, help="최근 N번 실행만 합산")
+    args = parser.parse_args(argv)
+
+    rows = load_history(args.last)
+    if not rows:
+        print("ℹ️ 저장된 API 호출 지표가 없습니다:", os.path.join(config.DATA_DIR, HISTORY_FILE))
+        return
+
+    total: dict[str, dict] = {}
+    for row in rows:
+        if tuple(row.get("buckets_ms") or ()) != BUCKETS_MS:
+            continue    # 구간이 바뀌기 전 기록은 합치지 않는다
+        for name, st in row["endpoints"].items():
+            merge(total.setdefault(name, _empty()), st)
+
+    print(f"[INFO] {rows[0]['ts']} ~ {rows[-1]['ts']} ({len(rows)}회 실행)")
+    for line in summary_lines(total):
+        print("   " + line)
+    print("   응답 시간 분포(ms): " + " / ".join(
+        f"≤{b}" for b in BUCKETS_MS) + f" / >{BUCKETS_MS[-1]}")
+    for name, st in sorted(total.items()):
+        print(f"   {name}: " + " / ".join(str(n) for n in st["histogram"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+로컬 주문 저장소 (DATA_DIR/orders.db, SQLite).
+
+- 채널 + 주문키(쿠팡 shipmentBoxId/orderId, 고도몰 orderNo) 기준으로 주문을 upsert 한다.
+  - 쿠팡: 렌탈 제외된 발주서(od) 그대로, 라인 = orderItems
+  - 고도몰: group_sets() 결과(grp), 라인 = sets (parent + children)
+- 주문 헤더와 라인을 나눠 저장하고, 읽을 때 원래 dict 모양으로 다시 합친다.
+- 채널마다 마지막으로 저장한 시각(synced_at)을 남겨 두고,
+  load_orders() 는 그 시각에 함께 저장된 주문(= 마지막 조회 결과)만 돌려준다.
+- 저장할 때마다 마지막 조회 결과에 없고 주문일시가 조회 기간(sync.WINDOW_DAYS)을 벗어난 주문은 지운다.
+  (매 실행마다 DB 가 계속 커지지 않도록)
+
+엑셀 재생성, 라벨 재출력, 중간에 죽은 실행 복구를 API 호출 없이 할 수 있게 하려는 용도.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+from . import config
+
+# 채널별 주문 키 / 주문일시 / 라인 필드
+ORDER_KEYS = {
+    # 쿠팡 발주서는 배송(shipmentBox) 단위라 orderId 가 겹칠 수 있음
+    "coupang": lambda od: str(od.get("shipmentBoxId") or od.get("orderId") or ""),
+    "godo": lambda grp: str(grp.get("orderNo") or ""),
+}
+ORDER_DATES = {
+    "coupang": lambda od: str(od.get("orderedAt") or od.get("orderDate") or ""),
+    "godo": lambda grp: str(grp.get("orderedAt") or ""),
+}
+LINE_FIELDS = {
+    "coupang": "orderItems",
+    "godo": "sets",
+}
+
+_lock = threading.Lock()
+
+
+def _db_path() -> str:
+    return os.path.join(config.data_dir(), "orders.db")
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_db_path(), timeout=10)
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        CREATE TABLE IF NOT EXISTS orders (
+            channel     TEXT NOT NULL,
+            order_key   TEXT NOT NULL,
+            ordered_at  TEXT NOT NULL,
+            payload     TEXT NOT NULL,
+            seq         INTEGER NOT NULL,
+            first_seen  REAL NOT NULL,
+            last_seen   REAL NOT NULL,
+            PRIMARY KEY (channel, order_key)
+        );
+        CREATE TABLE IF NOT EXISTS order_lines (
+            channel     TEXT NOT NULL,
+            order_key   TEXT NOT NULL,
+            line_no     INTEGER NOT NULL,
+            payload     TEXT NOT NULL,
+            PRIMARY KEY (channel, order_key, line_no)
+        );
+        CREATE TABLE IF NOT EXISTS syncs (
+            channel     TEXT PRIMARY KEY,
+            synced_at   REAL NOT NULL
+        );
+        """
+    )
+    return conn
+
+
+def order_key(channel: str, order: dict) -> str:
+    """주문키. 키 필드가 비어 있으면 내용 해시로 대신한다."""
+    key = ORDER_KEYS[channel](order)
+    if key:
+        return key
+    raw = json.dumps(order, ensure_ascii=False, sort_keys=True)
+    return "#" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def save_orders(channel: str, orders: list[dict], synced_at: float | None = None) -> None:
+    """
+    이번 조회 결과 전체를 upsert 하고, 이 묶음을 채널의 '현재 주문'으로 표시한다.
+    이번 묶음에 없고 조회 기간보다 오래된 주문은 같은 트랜잭션에서 지운다.
+    """
+    from .sync import WINDOW_DAYS
+
+    synced_at = synced_at or time.time()
+    cutoff = str(date.fromtimestamp(synced_at) - timedelta(days=WINDOW_DAYS))
+    line_field = LINE_FIELDS[channel]
+    date_of = ORDER_DATES[channel]
+
+    with _lock:
+        conn = _connect()
+        try:
+            with conn:
+                for seq, od in enumerate(orders):
+                    key = order_key(channel, od)
+                    header = {k: v for k, v in od.items() if k != line_field}
+                    conn.execute(
+                        """
+                        INSERT INTO orders
+                            (channel, order_key, ordered_at, payload, seq, first_seen, last_seen)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (channel, order_key) DO UPDATE SET
+                            ordered_at = excluded.ordered_at,
+                            payload    = excluded.payload,
+                            seq        = excluded.seq,
+                            last_seen  = excluded.last_seen
+                        """,
+                        (
+                            channel, key, date_of(od),
+                            json.dumps(header, ensure_ascii=False),
+                            seq, synced_at, synced_at,
+                        ),
+                    )
+                    conn.execute(
+                        "DELETE FROM order_lines WHERE channel = ? AND order_key = ?",
+                        (channel, key),
+                    )
+                    conn.executemany(
+                        """
+                        INSERT INTO order_lines (channel, order_key, line_no, payload)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        [
+                            (channel, key, no, json.dumps(line, ensure_ascii=False))
+                            for no, line in enumerate(od.get(line_field) or [])
+                        ],
+                    )
+                conn.execute(
+                    "INSERT OR REPLACE INTO syncs (channel, synced_at) VALUES (?, ?)",
+                    (channel, synced_at),
+                )
+                stale = "channel = ? AND last_seen < ? AND ordered_at < ?"
+                conn.execute(
+                    f"""
+                    DELETE FROM order_lines WHERE channel = ? AND order_key IN
+                        (SELECT order_key FROM orders WHERE {stale})
+                    """,
+                    (channel, channel, synced_at, cutoff),
+                )
+                conn.execute(f"DELETE FROM orders WHERE {stale}", (channel, synced_at, cutoff))
+        finally:
+            conn.close()
+
+
+def load_orders(channel: str) -> list[dict]:
+    """
+    마지막으로 저장한 조회 결과를 저장했던 순서 그대로 반환한다. (없으면 빈 리스트)
+    """
+    line_field = LINE_FIELDS[channel]
+
+    with _lock:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT synced_at FROM syncs WHERE channel = ?", (channel,)
+            ).fetchone()
+            if row is None:
+                return []
+
+            headers = conn.execute(
+                """
+                SELECT order_key, payload FROM orders
+                WHERE channel = ? AND last_seen = ?
+                ORDER BY seq
+                """,
+                (channel, row[0]),
+            ).fetchall()
+
+            lines: dict[str, list] = {}
+            for key, payload in conn.execute(
+                """
+                SELECT l.order_key, l.payload FROM order_lines l
+                JOIN orders o ON o.channel = l.channel AND o.order_key = l.order_key
+                WHERE l.channel = ? AND o.last_seen = ?
+                ORDER BY l.order_key, l.line_no
+                """,
+                (channel, row[0]),
+            ):
+                lines.setdefault(key, []).append(json.loads(payload))
+        finally:
+            conn.close()
+
+    orders = []
+    for key, payload in headers:
+        od = json.loads(payload)
+        od[line_field] = lines.get(key, [])
+        orders.append(od)
+    return orders
+
+
+
+def has_orders(channel: str) -> bool:
+    """채널에 저장된 조회 결과가 있는지."""
+    with _lock:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM syncs WHERE channel = ?", (channel,)
+            ).fetchone()
+        finally:
+            conn.close()
+    return row is not None
@@ -0,0 +1,135 @@
+"""
+실행 프로파일링 (cProfile + tracemalloc).
+
+    python -m halfetgetorder --profile      (exe 도 같은 옵션, 또는 .env 에 PROFILE=1)
+
+- 실행 전체를 cProfile 로 감싸서 DATA_DIR/profiles/profile_YYYYMMDD_HHMMSS.pstats 로 저장
+  (snakeviz, python -m pstats 등으로 열어 볼 수 있음)
+- cProfile 은 부른 스레드만 기록하므로 실행 중에 새로 뜨는 스레드(채널 조회, 기본 사양 prefetch 등)
+  마다 threading.setprofile 로 따로 프로파일러를 붙이고, 저장할 때 하나의 통계로 합친다.
+- tracemalloc 으로 메모리 최대 사용량과 할당 위치 상위 N개를 같은 이름의 .txt 요약에 기록
+- 프로파일링 중에는 엑셀 생성을 프로세스 풀 대신 이 프로세스에서 차례대로 해서
+  라벨/주문수집 생성 시간과 메모리도 같이 잡히게 한다.
+
+옵션을 켜지 않으면 이 모듈은 import 되지 않는다 (기본 실행에는 부담 없음).
+"""
+import cProfile
+import gc
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from datetime import datetime
+
+from . import config
+
+TRACE_FRAMES = 10   # 할당 위치마다 기록할 호출 스택 깊이
+
+# tracemalloc 요약에서 뺄 항목 (import 과정 / tracemalloc 자체)
+_IGNORE = (
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_checkpoints: list | None = None
+_thread_profilers: list[cProfile.Profile] = []
+_thread_lock = threading.Lock()
+
+
+def _start_thread_profiler(frame, event, arg):
+    """
+    threading.setprofile 훅: 새 스레드에서 처음 한 번 불려서 그 스레드 전용 프로파일러를 켠다.
+    (enable() 이 이 스레드의 프로파일 함수를 바꾸므로 이 훅은 다시 불리지 않는다)
+    """
+    profiler = cProfile.Profile()
+    with _thread_lock:
+        _thread_profilers.append(profiler)
+    profiler.enable()
+
+
+def checkpoint(label: str) -> None:
+    """
+    지금 살아 있는 할당을 스냅샷으로 남긴다 (요약에 단계별로 출력).
+    프로파일링 중이 아니면 아무것도 하지 않는다.
+    """
+    if _checkpoints is None or not tracemalloc.is_tracing():
+        return
+    # 필터링은 느리므로 요약을 쓸 때 (프로파일러가 멈춘 뒤) 한다
+    _checkpoints.append((label, tracemalloc.take_snapshot()))
+
+
+def run(fn, *args, top: int = 30, **kwargs):
+    """fn(*args, **kwargs) 를 프로파일링하면서 실행하고 결과를 DATA_DIR/profiles 에 저장한다."""
+    global _checkpoints
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base = os.path.join(config.data_dir(), "profiles", f"profile_{stamp}")
+
+    _checkpoints = []
+    _thread_profilers.clear()
+    tracemalloc.start(TRACE_FRAMES)
+    profiler = cProfile.Profile()
+    threading.setprofile(_start_thread_profiler)
+    try:
+        return profiler.runcall(fn, *args, **kwargs)
+    finally:
+        threading.setprofile(None)
+        gc.collect()   # 순환 참조로 남은 워크북까지 정리한 뒤 남은 것만 본다
+        checkpoint("종료 시")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        checkpoints, _checkpoints = _checkpoints, None
+        _save(base, _merge(profiler), peak, checkpoints, top)
+
+
+def _merge(profiler) -> pstats.Stats:
+    """메인 스레드와 작업 스레드 프로파일을 하나로 합친다."""
+    stats = pstats.Stats(profiler)
+    with _thread_lock:
+        thread_profilers, _thread_profilers[:] = list(_thread_profilers), []
+    for p in thread_profilers:
+        p.disable()
+        p.create_stats()
+        if p.stats:
+            stats.add(p)
+    return stats
+
+
+def _save(base, stats, peak, checkpoints, top):
+    try:
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        stats.dump_stats(base + ".pstats")
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(_summary(stats, peak, checkpoints, top))
+    except OSError as e:
+        print("⚠️ 프로파일 결과 저장 실패:", e)
+        return
+
+    print("=================================================================")
+    print(f"ℹ️ 프로파일 저장: {base}.pstats")
+    print(f"ℹ️ 요약(시간 상위 {top}개 / 메모리 최대 {peak / 1024 / 1024:.1f}MB): {base}.txt")
+
+
+def _summary(stats, peak, checkpoints, top) -> str:
+    out = io.StringIO()
+    out.write(f"메모리 최대 사용량 (tracemalloc): {peak / 1024 / 1024:.1f} MB\n\n")
+
+    out.write("※ 작업 스레드 프로파일을 합친 값이라 시간은 스레드별 시간의 합 (실제 경과 시간보다 클 수 있음)\n\n")
+    stats.stream = out
+    stats.strip_dirs()   # .pstats 는 이미 저장했으므로 요약에서만 경로를 줄인다
+    for sort_key, title in (("cumulative", "누적 시간"), ("tottime", "자체 시간")):
+        out.write(f"── 함수별 {title} 상위 {top}개 " + "─" * 40 + "\n")
+        stats.sort_stats(sort_key).print_stats(top)
+
+    for label, snapshot in checkpoints:
+        traces = snapshot.filter_traces(_IGNORE).statistics("lineno")
+        total = sum(s.size for s in traces)
+        out.write(f"── 메모리 할당 위치 상위 {top}개 ({label}, 전체 {total / 1024 / 1024:.1f} MB) " + "─" * 20 + "\n")
+        for s in traces[:top]:
+            frame = s.traceback[0]
+            out.write(f"{s.size / 1024:>10.1f} KB {s.count:>8}개  {frame.filename}:{frame.lineno}\n")
+        out.write("\n")
+    return out.getvalue()
@@ -0,0 +1,170 @@
+"""
+외부 API 호출 속도 제한 (엔드포인트별 토큰 버킷, 여러 프로세스가 함께 사용).
+
+- DATA_DIR/rate_limits.db (SQLite) 에 엔드포인트별 남은 토큰과 갱신 시각을 저장한다.
+  → exe 를 두 개 띄우거나 --watch 와 수동 실행이 겹쳐도 합쳐서 한도를 넘지 않는다.
+- 토큰은 초당 rate 개씩 차고 최대 burst 개까지 쌓인다. 호출 한 번에 한 개를 쓰고,
+  모자라면 찰 때까지 기다린다. (client.request 가 재시도를 포함해 매 시도 전에 acquire)
+- 429(Too Many Requests) 를 받으면 penalize() 로 버킷을 비워서 모든 프로세스가 같이 쉰다.
+
+기본값은 '제한 없음' 이다. 쿠팡/고도몰 모두 엔드포인트별 초당 한도를 문서로 공개하지 않아서
+근거 없는 값으로 평소 실행을 느리게 만들지 않도록 했다. (429 를 받으면 Retry-After 만큼은 기다림)
+한도를 안내받았거나 429 가 자주 나면 .env 의 RATE_LIMITS 로 엔드포인트별로 켠다.
+적지 않은 엔드포인트는 제한하지 않는다.
+
+    RATE_LIMITS=Goods_Search.php=10/20,ordersheets=5       (초당 개수/최대 burst, burst 생략 시 = 초당 개수)
+    RATE_LIMITS=off                                         (제한 끄기, 비워 둔 것과 같음)
+
+DB 를 쓸 수 없으면 경고만 한 번 출력하고 제한 없이 호출한다 (실행은 막지 않음).
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from . import config
+
+_local = threading.local()
+_limits: dict[str, tuple[float, float]] | None = None
+_disabled = False
+
+
+def _parse(text: str) -> dict[str, tuple[float, float]]:
+    """RATE_LIMITS 값 → {엔드포인트(client._endpoint 이름): (초당 호출 수, 최대 burst)}"""
+    limits: dict[str, tuple[float, float]] = {}
+    for part in text.split(","):
+        name, _, spec = part.strip().partition("=")
+        if not name or not spec:
+            continue
+        rate, _, burst = spec.partition("/")
+        try:
+            rate = float(rate)
+            burst = float(burst) if burst else rate
+        except ValueError:
+            print(f"⚠️ RATE_LIMITS 항목을 읽을 수 없습니다: {part.strip()}")
+            continue
+        if rate <= 0:
+            limits.pop(name.strip(), None)     # 0 이면 그 엔드포인트는 제한 없음
+        else:
+            limits[name.strip()] = (rate, max(1.0, burst))
+    return limits
+
+
+def limits() -> dict[str, tuple[float, float]]:
+    global _limits
+    if _limits is None:
+        text = config.RATE_LIMITS
+        _limits = {} if text.lower() in ("off", "0", "no", "false") else _parse(text)
+    return _limits
+
+
+def _conn() -> sqlite3.Connection:
+    """스레드마다 연결 하나를 열어 재사용한다 (트랜잭션은 직접 BEGIN IMMEDIATE)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(
+            os.path.join(config.data_dir(), "rate_limits.db"), timeout=10, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS buckets (
+                endpoint TEXT PRIMARY KEY,
+                tokens   REAL NOT NULL,
+                updated  REAL NOT NULL
+            )
+            """
+        )
+        _local.conn = conn
+    return conn
+
+
+def _take(conn, endpoint: str, rate: float, burst: float) -> float:
+    """
+    토큰 하나를 쓴다. 반환: 0 이면 성공, 아니면 토큰이 찰 때까지 기다릴 초.
+    (읽고-계산하고-쓰기를 BEGIN IMMEDIATE 안에서 해서 다른 프로세스와 겹치지 않게)
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        now = time.time()
+        row = conn.execute(
+            "SELECT tokens, updated FROM buckets WHERE endpoint = ?", (endpoint,)
+        ).fetchone()
+        if row is None:
+            tokens = burst
+        else:
+            # 시계가 뒤로 가도 토큰이 줄지 않도록
+            tokens = min(burst, row[0] + max(0.0, now - row[1]) * rate)
+
+        wait = 0.0
+        if tokens >= 1.0:
+            tokens -= 1.0
+        else:
+            wait = (1.0 - tokens) / rate
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (endpoint, tokens, updated) VALUES (?, ?, ?)",
+            (endpoint, tokens, now),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return wait
+
+
+def _warn_once(e: Exception) -> None:
+    global _disabled
+    if not _disabled:
+        _disabled = True
+        print("⚠️ 호출 속도 제한 DB 를 쓸 수 없어 제한 없이 호출합니다:", e)
+
+
+def acquire(endpoint: str) -> float:
+    """
+    endpoint 호출 한 번 전에 부른다. 토큰이 없으면 생길 때까지 기다린다.
+    반환: 기다린 초 (제한 없는 엔드포인트면 0)
+    """
+    limit = limits().get(endpoint)
+    if limit is None or _disabled:
+        return 0.0
+    rate, burst = limit
+
+    waited = 0.0
+    while True:
+        try:
+            wait = _take(_conn(), endpoint, rate, burst)
+        except sqlite3.Error as e:
+            _warn_once(e)
+            return waited
+        if not wait:
+            return waited
+        time.sleep(wait)
+        waited += wait
+
+
+def penalize(endpoint: str, seconds: float) -> bool:
+    """
+    서버가 한도 초과(429)를 알렸을 때: 앞으로 seconds 동안 이 엔드포인트 토큰이 생기지 않게 한다.
+    반환: 버킷에 반영했으면 True (다음 acquire 가 대신 기다려 준다), 제한 없는 엔드포인트면 False
+    """
+    limit = limits().get(endpoint)
+    if limit is None or _disabled:
+        return False
+    rate, _ = limit
+    try:
+        conn = _conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (endpoint, tokens, updated) VALUES (?, ?, ?)",
+                (endpoint, -seconds * rate, time.time()),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    except sqlite3.Error as e:
+        _warn_once(e)
+        return False
+    return True
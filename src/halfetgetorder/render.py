@@ -0,0 +1,255 @@
+"""
+주문수집 / 대한통운 송장등록 / 라벨출력 엑셀 생성 단계.
+
+세 파일은 주문 조회가 끝나면 서로 상관이 없으므로 프로세스 풀에서 동시에 만들고 저장한다.
+(openpyxl 셀 생성/저장은 CPU 작업이라 스레드로는 GIL 때문에 빨라지지 않음)
+
+- 파일마다 걸린 시간을 출력하고, 하나가 실패해도 나머지 파일은 계속 만든다.
+- 라벨은 고도몰 기본 RAM/SSD 조회(메인 프로세스)가 끝나는 대로 바로 작업을 넘긴다.
+- .env 의 RENDER_WORKERS=1 이거나 CPU 코어가 하나면 프로세스 풀 없이 이 프로세스에서 차례대로 만든다.
+"""
+import os
+import time
+
+from . import config, coupang, templates, waybill
+
+ORDERS = "주문수집"
+WAYBILL = "대한통운 송장등록"
+LABEL = "라벨출력"
+
+
+# ─────────────────────────────────────────────────────────
+# 워커 프로세스에서 실행되는 작업 (인자/반환값은 pickle 가능해야 함)
+# ─────────────────────────────────────────────────────────
+def _lap(stages, name, start):
+    """stages[name] 에 start 이후 걸린 시간을 기록하고 지금 시각을 반환."""
+    now = time.perf_counter()
+    stages[name] = now - start
+    return now
+
+
+def render_orders(path, coupang_orders, godo_grouped_orders):
+    """
+    주문수집 엑셀 (쿠팡 + 고도몰).
+    직원이 수정한 서식 템플릿이 있으면 템플릿으로, 없으면 write-only 스트리밍으로 저장.
+    """
+    stages = {}
+    t = time.perf_counter()
+    # openpyxl 은 필요한 작업에서만 import
+    from .io_excel import create_orders_workbook, save_orders_workbook
+    t = _lap(stages, "import", t)
+    if templates.template_path(templates.ORDERS_TEMPLATE):
+        wb, ws = create_orders_workbook(coupang_orders, godo_grouped_orders)
+        t = _lap(stages, "생성", t)
+        wb.save(path)
+        _lap(stages, "저장", t)
+        return path, {"stages": stages, "counts": {"주문수집 행": ws.max_row - 1}}
+
+    rows = save_orders_workbook(
+        path,
+        coupang_orders=coupang_orders,
+        godo_grouped_orders=godo_grouped_orders,
+    )
+    _lap(stages, "생성+저장", t)
+    return path, {"stages": stages, "counts": {"주문수집 행": rows}}
+
+
+def render_waybill(path, coupang_orders):
+    """대한통운 송장등록 엑셀 (쿠팡 주문만). 쿠팡 주문이 없으면 path 자리에 None."""
+    stages = {}
+    t = time.perf_counter()
+    # 이미 파싱/필터된 주문 객체를 그대로 정규화 (JSON 다시 만들지 않음)
+    norm_cp_orders = coupang.normalize_coupang_orders(coupang_orders)
+    t = _lap(stages, "정규화", t)
+    if not norm_cp_orders:
+        return None, {"stages": stages}
+
+    # 단순한 표라 openpyxl 없이 직접 쓴다
+    rows = waybill.write_waybill_xlsx(path, norm_cp_orders)
+    t = _lap(stages, "생성+저장", t)
+    if config.WAYBILL_CSV:
+        waybill.write_waybill_csv(os.path.splitext(path)[0] + ".csv", norm_cp_orders)
+        _lap(stages, "csv", t)
+    return path, {"stages": stages, "counts": {"송장등록 행": rows}}
+
+
+def render_label(path, coupang_orders, godo_grouped_orders, godo_base_specs):
+    """라벨출력 엑셀."""
+    stages = {}
+    t = time.perf_counter()
+    from .io_excel import create_label_workbook
+    t = _lap(stages, "import", t)
+    label_wb, label_ws = create_label_workbook(
+        coupang_orders=coupang_orders,      # 쿠팡 주문 리스트(렌탈 제외)
+        godo_grouped_orders=godo_grouped_orders,   # 고도몰 grouped_orders 리스트
+        godo_add_goods_map_path=os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),  # 프로젝트 루트
+            "godo_add_goods_all.json",
+        ),
+        godo_base_specs=godo_base_specs,
+    )
+    t = _lap(stages, "생성", t)
+    label_wb.save(path)
+    _lap(stages, "저장", t)
+    return path, {"stages": stages, "counts": {"라벨 행": label_ws.max_row - 1}}
+
+
+def _timed(fn, *args):
+    """작업을 실행하고 (결과, 걸린 시간, 예외) 를 반환. 예외는 올리지 않는다."""
+    start = time.perf_counter()
+    try:
+        result, error = fn(*args), None
+    except Exception as e:
+        result, error = None, e
+    return result, time.perf_counter() - start, error
+
+
+# ─────────────────────────────────────────────────────────
+# 메인 프로세스
+# ─────────────────────────────────────────────────────────
+def _report(name, result, elapsed, error):
+    if error is not None:
+        print(f"⚠️ {name} 엑셀 생성 중 오류:", error)
+    elif result is None:
+        print("ℹ️ 쿠팡 주문이 없어 대한통운 송장등록 파일은 생성하지 않습니다.")
+    else:
+        print(f"✅ {name} 엑셀 저장 완료: {result} ({elapsed:.2f}초)")
+
+
+def worker_count(max_workers=None) -> int:
+    """엑셀 생성에 쓸 프로세스 수 (파일이 3개라 최대 3). 코어가 하나뿐이면 프로세스를 띄워 봐야 느려지기만 한다."""
+    return min(max_workers or config.RENDER_WORKERS, 3, os.cpu_count() or 1)
+
+
+def open_pool(max_workers=None):
+    """
+    여러 번 재사용할 엑셀 생성용 프로세스 풀 (--watch 용, 워커가 openpyxl 을 한 번만 import).
+    프로세스를 한 개만 쓰거나 풀을 만들 수 없으면 None.
+    """
+    workers = worker_count(max_workers)
+    if workers <= 1:
+        return None
+    # 프로세스 풀 모듈은 실제로 풀을 쓸 때만 import
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError) as e:
+        print("⚠️ 엑셀 생성용 프로세스를 만들 수 없어 차례대로 생성합니다:", e)
+        return None
+
+
+def pool_broken(pool) -> bool:
+    """워커 프로세스가 죽어서 더 이상 쓸 수 없는 풀인지 (공개 API 가 없어 내부 플래그를 본다)."""
+    return pool is not None and bool(getattr(pool, "_broken", False))
+
+
+def render_outputs(filtered_orders, grouped, base_specs_future, today, max_workers=None, pool=None):
+    """
+    세 엑셀을 만들고 저장한다.
+
+    - filtered_orders: 렌탈 제외된 쿠팡 주문 리스트
+    - grouped: 고도몰 세트 구조 리스트
+    - base_specs_future: 고도몰 기본 RAM/SSD 미리 조회 결과(Future)
+    - max_workers: 프로세스 수 (None 이면 RENDER_WORKERS, 1 이면 이 프로세스에서 차례대로)
+    - pool: open_pool() 로 만들어 둔 풀 (주면 닫지 않고 그대로 둔다)
+
+    반환: {이름: {"path", "seconds", "error", "stages", "counts"}}
+      (stages: 생성/저장 등 세부 단계별 초, counts: 쓴 행 수)
+    """
+    data_dir = config.data_dir()
+    paths = {
+        ORDERS: os.path.join(data_dir, f"주문수집_{today}.xlsx"),
+        WAYBILL: os.path.join(data_dir, f"대한통운 송장등록_{today}.xlsx"),
+        LABEL: os.path.join(data_dir, f"라벨출력_{today}.xlsx"),
+    }
+    jobs = {
+        ORDERS: (render_orders, paths[ORDERS], filtered_orders, grouped),
+        WAYBILL: (render_waybill, paths[WAYBILL], filtered_orders),
+    }
+
+    def label_job():
+        try:
+            godo_base_specs = base_specs_future.result()
+        except Exception as e:
+            print("⚠️ 고도몰 기본 RAM/SSD 미리 조회 중 오류:", e)
+            godo_base_specs = {}
+        return (render_label, paths[LABEL], filtered_orders, grouped, godo_base_specs)
+
+    print("=================================================================")
+    print("[INFO] 주문수집 / 송장등록 / 라벨출력 엑셀파일을 생성하는 중입니다...")
+    print("[INFO] 약 10~30초 정도 소요되니, 반응이 없다면 Enter키를 한번 눌러주세요.")
+
+    workers = worker_count(max_workers)
+
+    started = time.perf_counter()
+    if workers > 1 and pool is not None:
+        results = _collect(pool, jobs, label_job)
+    elif workers > 1:
+        results = _render_in_pool(jobs, label_job, workers)
+    else:
+        results = _render_inline(jobs, label_job)
+    total = time.perf_counter() - started
+
+    summary = " / ".join(
+        f"{name} {r['seconds']:.2f}초" + (" (실패)" if r["error"] else "")
+        for name, r in results.items()
+    )
+    print(f"[INFO] 엑셀 생성 시간: {summary} → 전체 {total:.2f}초")
+    return results
+
+
+def _result(name, result, elapsed, error):
+    path, info = result if result is not None else (None, {})
+    _report(name, path, elapsed, error)
+    return {
+        "path": path,
+        "seconds": elapsed,
+        "error": repr(error) if error else None,
+        "stages": info.get("stages") or {},
+        "counts": info.get("counts") or {},
+    }
+
+
+def _render_inline(jobs, label_job):
+    results = {name: _result(name, *_timed(*job)) for name, job in jobs.items()}
+    results[LABEL] = _result(LABEL, *_timed(*label_job()))
+    return results
+
+
+def _render_in_pool(jobs, label_job, workers):
+    pool = open_pool(workers)
+    if pool is None:
+        return _render_inline(jobs, label_job)
+
+    with pool:
+        return _collect(pool, jobs, label_job)
+
+
+def _collect(pool, jobs, label_job):
+    from concurrent.futures.process import BrokenProcessPool
+
+    def submit(job):
+        try:
+            return pool.submit(_timed, *job)
+        except BrokenProcessPool:
+            return None
+
+    futures = {name: submit(job) for name, job in jobs.items()}
+    # 라벨은 기본 사양 조회가 끝나야 시작할 수 있음 (그동안 나머지 두 파일은 이미 진행 중)
+    jobs = dict(jobs, **{LABEL: label_job()})
+    futures[LABEL] = submit(jobs[LABEL])
+
+    results = {}
+    for name, future in futures.items():
+        try:
+            if future is None:
+                raise BrokenProcessPool("process pool is not usable")
+            results[name] = _result(name, *future.result())
+        except BrokenProcessPool as e:
+            # 워커 프로세스가 죽은 경우: 이 파일은 이 프로세스에서 다시 만든다
+            print(f"⚠️ {name} 엑셀 생성 프로세스가 비정상 종료되어 다시 생성합니다:", e)
+            results[name] = _result(name, *_timed(*jobs[name]))
+        except Exception as e:
+            results[name] = _result(name, None, 0.0, e)
+    return results
@@ -0,0 +1,134 @@
+"""
+실행 한 번의 단계별 소요 시간 / 건수 기록.
+
+- 단계 시간: with report.stage("쿠팡 조회"): ...  (같은 이름으로 여러 번 재면 합산)
+- 건수:     report.count("쿠팡 주문", n)
+- 실행이 끝나면 DATA_DIR/runs/run_YYYYMMDD_HHMMSS.json 으로 저장하고 요약 표를 출력한다.
+  (오래된 보고서는 MAX_REPORTS 개만 남기고 지운다)
+
+조회는 채널별 스레드에서 동시에 돌기 때문에 기록은 lock 으로 보호한다.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .utils import visual_len
+from . import config, metrics
+
+MAX_REPORTS = 200
+
+
+class RunReport:
+    def __init__(self, mode: str = "api"):
+        self.mode = mode
+        self.started_at = datetime.now()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.outputs: dict[str, dict] = {}
+        self.api: dict[str, dict] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def add_output(self, name: str, result: dict) -> None:
+        """render.render_outputs 결과 한 건 (path / seconds / error / stages / counts)."""
+        with self._lock:
+            self.outputs[name] = result
+            for key, n in (result.get("counts") or {}).items():
+                self.counts[key] = self.counts.get(key, 0) + n
+
+    def set_api(self, endpoints: dict[str, dict]) -> None:
+        """metrics.take() 결과 (엔드포인트별 호출 지표)."""
+        with self._lock:
+            self.api = endpoints
+            for name, st in endpoints.items():
+                self.counts[f"API {name}"] = st["calls"]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "total_seconds": round(time.perf_counter() - self._t0, 3),
+                "stages": {k: round(v, 3) for k, v in self.stages.items()},
+                "counts": dict(self.counts),
+                "outputs": {
+                    name: {
+                        "path": r.get("path"),
+                        "seconds": round(r.get("seconds") or 0.0, 3),
+                        "error": r.get("error"),
+                        "stages": {k: round(v, 3) for k, v in (r.get("stages") or {}).items()},
+                    }
+                    for name, r in self.outputs.items()
+                },
+                "api": self.api,
+            }
+
+    def save(self) -> str | None:
+        """보고서를 JSON 으로 저장하고 경로를 반환 (실패하면 None)."""
+        data = self.to_dict()
+        try:
+            report_dir = os.path.join(config.data_dir(), "runs")
+            path = os.path.join(report_dir, self.started_at.strftime("run_%Y%m%d_%H%M%S.json"))
+            os.makedirs(report_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            _prune(report_dir)
+        except OSError as e:
+            print("⚠️ 실행 보고서 저장 실패:", e)
+            return None
+        return path
+
+    def print_summary(self) -> None:
+        data = self.to_dict()
+        print("=================================================================")
+        print(f"[INFO] 단계별 소요 시간 (전체 {data['total_seconds']:.2f}초)")
+        for name, seconds in data["stages"].items():
+            print(f"   {_pad(name)}{seconds:>8.2f}초")
+        for name, r in data["outputs"].items():
+            parts = ", ".join(f"{k} {v:.2f}초" for k, v in r["stages"].items())
+            status = " (실패)" if r["error"] else ""
+            print(f"   {_pad(name + ' 엑셀')}{r['seconds']:>8.2f}초{status}" + (f"  [{parts}]" if parts else ""))
+        if data["counts"]:
+            print("[INFO] " + " / ".join(f"{k} {v:,}" for k, v in data["counts"].items()))
+        if data["api"]:
+            print("[INFO] API 호출")
+            for line in metrics.summary_lines(data["api"]):
+                print("   " + line)
+
+
+def _pad(text: str, width: int = 24) -> str:
+    """한글 폭(2칸)을 고려해 왼쪽 정렬."""
+    return text + " " * max(0, width - visual_len(text))
+
+
+def _prune(directory: str) -> None:
+    """run_*.json 을 최근 MAX_REPORTS 개만 남긴다."""
+    reports = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith("run_") and name.endswith(".json")
+    )
+    for name in reports[:-MAX_REPORTS]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
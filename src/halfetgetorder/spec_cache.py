@@ -0,0 +1,136 @@
+"""
+고도몰 상품 기본 RAM/SSD 사양 캐시.
+
+- DATA_DIR/godo_specs_cache.db (SQLite) 에 goodsNo → (ram, ssd) 를 저장한다.
+- 항목마다 저장 시각을 기록해 TTL 이 지나면 다시 조회하도록 한다.
+- shortDescription 이 없는 상품도 '없음'으로 저장해 두고(네거티브 캐시)
+  더 짧은 TTL 동안은 API 를 다시 부르지 않는다.
+- 항목 수가 MAX_ENTRIES 를 넘으면 가장 오래 사용하지 않은 항목부터 지운다(LRU).
+  사용 시각(accessed_at)은 TOUCH_INTERVAL_SECONDS 보다 오래됐을 때만 갱신한다.
+  (읽기가 대부분인 캐시라 조회마다 쓰기 트랜잭션을 만들지 않도록. LRU 순서는 그 정도 오차면 충분)
+- 프로세스 안에서는 연결 하나를 잠금과 함께 같이 쓴다. (prefetch 워커 스레드마다 연결을 열면
+  실행/감시 주기마다 스레드가 바뀌면서 닫히지 않은 연결과 파일 핸들이 쌓이므로)
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from . import config
+
+TTL_SECONDS = 24 * 60 * 60           # 사양이 있는 상품: 하루
+NEGATIVE_TTL_SECONDS = 3 * 60 * 60   # shortDescription 이 없는 상품: 3시간
+MAX_ENTRIES = 5000
+TOUCH_INTERVAL_SECONDS = 60 * 60     # 사용 시각 갱신 간격
+
+_lock = threading.Lock()
+_db: tuple[str, sqlite3.Connection] | None = None    # (DB 경로, 연결)
+
+
+def _conn() -> sqlite3.Connection:
+    """공용 연결. 반드시 _lock 을 잡고 호출/사용한다. (DATA_DIR 이 바뀌면 새로 연다)"""
+    global _db
+    path = os.path.join(config.data_dir(), "godo_specs_cache.db")
+    if _db is not None and _db[0] == path:
+        return _db[1]
+
+    if _db is not None:
+        _db[1].close()
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS goods_specs (
+            goods_no    TEXT PRIMARY KEY,
+            ram         TEXT NOT NULL,
+            ssd         TEXT NOT NULL,
+            found       INTEGER NOT NULL,
+            fetched_at  REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        """
+    )
+    conn.commit()
+    _db = (path, conn)
+    return conn
+
+
+def get(goods_no: str, allow_stale: bool = False) -> tuple[str, str] | None:
+    """
+    캐시에서 (ram, ssd) 를 꺼낸다.
+    없거나 TTL 이 지났으면 None (→ API 조회 필요).
+    allow_stale=True 면 TTL 이 지난 항목도 그대로 반환 (오프라인 재생성용).
+    """
+    now = time.time()
+    try:
+        with _lock:
+            conn = _conn()
+            row = conn.execute(
+                """
+                SELECT ram, ssd, found, fetched_at, accessed_at FROM goods_specs
+                WHERE goods_no = ?
+                """,
+                (goods_no,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            ram, ssd, found, fetched_at, accessed_at = row
+            ttl = TTL_SECONDS if found else NEGATIVE_TTL_SECONDS
+            if now - fetched_at > ttl and not allow_stale:
+                return None
+
+            if now - accessed_at > TOUCH_INTERVAL_SECONDS:
+                conn.execute(
+                    "UPDATE goods_specs SET accessed_at = ? WHERE goods_no = ?",
+                    (now, goods_no),
+                )
+                conn.commit()
+        return ram, ssd
+    except sqlite3.Error as e:
+        print(f"⚠️ 기본 사양 캐시 읽기 오류(goodsNo={goods_no}): {e}")
+        return None
+
+
+def put(goods_no: str, ram: str, ssd: str) -> None:
+    """
+    조회 결과를 저장한다. ram/ssd 가 둘 다 비어 있으면 네거티브 캐시로 저장.
+    """
+    now = time.time()
+    found = 1 if (ram or ssd) else 0
+    try:
+        with _lock:
+            conn = _conn()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO goods_specs
+                    (goods_no, ram, ssd, found, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (goods_no, ram, ssd, found, now, now),
+            )
+            # LRU: 최대 개수를 넘으면 가장 오래 안 쓴 항목부터 삭제
+            conn.execute(
+                """
+                DELETE FROM goods_specs WHERE goods_no IN (
+                    SELECT goods_no FROM goods_specs
+                    ORDER BY accessed_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (MAX_ENTRIES,),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ 기본 사양 캐시 저장 오류(goodsNo={goods_no}): {e}")
+
+
+def clear() -> None:
+    """캐시 전체 삭제."""
+    try:
+        with _lock:
+            conn = _conn()
+            conn.execute("DELETE FROM goods_specs")
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ 기본 사양 캐시 삭제 오류: {e}")
@@ -0,0 +1,138 @@
+"""
+채널별 증분 주문 동기화.
+
+- DATA_DIR/sync_state.json 에 채널별 마지막 동기화 시각(high-water mark)을 저장한다.
+- 증분 모드(.env 의 INCREMENTAL_SYNC=1)에서는 마지막 동기화 시각 - OVERLAP 이후 주문만 받아서
+  로컬 주문 저장소(order_store)의 이전 결과에 주문키 기준으로 합친다.
+- API 조회 기간이 날짜 단위라서, 실제로는 '마지막 동기화 날짜'부터 다시 받는다.
+- 출고 등으로 상태가 바뀌면 주문이 목록(INSTRUCT / g1)에서 빠진다.
+  다시 조회한 기간 안에 있는데 이번에 오지 않은 이전 주문은 합칠 때 뺀다.
+  (조회가 끝까지 성공했을 때만 → 못 받은 페이지의 주문을 빠진 것으로 오해하지 않도록)
+- 조회 기간보다 앞선 날짜의 주문이 빠진 것은 FULL_SYNC_INTERVAL 마다 한 번 전체 기간(WINDOW_DAYS)을
+  새로 받을 때 맞춘다. (증분 조회 기간을 넓히면 매번 거의 7일치를 다시 받게 되므로)
+"""
+import json
+import os
+from datetime import datetime, timedelta
+
+from . import config, order_store
+
+WINDOW_DAYS = 7
+OVERLAP = timedelta(minutes=30)
+FULL_SYNC_INTERVAL = timedelta(hours=6)
+
+
+def _state_path() -> str:
+    return os.path.join(config.data_dir(), "sync_state.json")
+
+
+def _load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        print(f"⚠️ 동기화 파일({path})을 읽는 중 오류: {e}")
+        return default
+
+
+def _save_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def plan_window(channel: str, now: datetime | None = None) -> tuple[str, str, bool]:
+    """
+    이번 실행의 조회 기간을 정한다.
+
+    반환: (created_from, created_to, full)
+      - full=True 면 전체 기간(오늘-WINDOW_DAYS ~ 오늘)을 새로 받는다.
+    """
+    now = now or datetime.now()
+    created_to = str(now.date())
+    full_from = str(now.date() - timedelta(days=WINDOW_DAYS))
+
+    if not config.INCREMENTAL_SYNC:
+        return full_from, created_to, True
+
+    state = _load_json(_state_path(), {}).get(channel) or {}
+    try:
+        last_sync = datetime.fromisoformat(state["last_sync"])
+        last_full = datetime.fromisoformat(state["last_full_sync"])
+    except (KeyError, TypeError, ValueError):
+        return full_from, created_to, True
+
+    if now - last_full >= FULL_SYNC_INTERVAL or not order_store.has_orders(channel):
+        return full_from, created_to, True
+
+    created_from = str((last_sync - OVERLAP).date())
+    return max(created_from, full_from), created_to, False
+
+
+def merge_orders(
+    channel: str,
+    orders: list,
+    full: bool,
+    now: datetime | None = None,
+    created_from: str | None = None,
+) -> list:
+    """
+    이번에 받은 주문을 저장소의 이전 결과에 합쳐서 반환한다.
+
+    - full=True 이거나 증분 모드가 아니면 이번 결과를 그대로 반환
+    - 증분이면 같은 주문키는 새 내용으로 바꾸고, 새 주문은 뒤에 붙이며,
+      조회 기간(WINDOW_DAYS)보다 오래된 주문은 뺀다.
+    - created_from(이번 조회 시작일)을 주면, 그 날짜 이후(또는 주문일시가 없는) 이전 주문 중
+      이번에 오지 않은 주문은 목록에서 빠진 것(출고 등)으로 보고 뺀다.
+      조회가 중간에 끊겼으면 None 을 넘겨서 이전 주문을 그대로 둔다.
+    """
+    if not config.INCREMENTAL_SYNC or full:
+        return orders
+
+    now = now or datetime.now()
+    oldest = str(now.date() - timedelta(days=WINDOW_DAYS))
+    date_of = order_store.ORDER_DATES[channel]
+
+    fetched = {order_store.order_key(channel, od) for od in orders}
+    previous = [
+        od for od in order_store.load_orders(channel)
+        if created_from is None
+        or order_store.order_key(channel, od) in fetched
+        or (date_of(od) and date_of(od)[:10] < created_from)
+    ]
+
+    merged = []
+    index: dict[str, int] = {}
+    for od in previous + list(orders):
+        key = order_store.order_key(channel, od)
+        if key in index:
+            merged[index[key]] = od
+            continue
+        index[key] = len(merged)
+        merged.append(od)
+
+    return [od for od in merged if date_of(od)[:10] >= oldest or not date_of(od)]
+
+
+def mark_synced(channel: str, started_at: datetime, full: bool) -> None:
+    """
+    조회가 끝까지 성공했을 때만 호출해서 high-water mark 를 올린다.
+    (started_at: 조회를 시작한 시각 → 조회 중에 들어온 주문을 놓치지 않도록)
+    """
+    if not config.INCREMENTAL_SYNC:
+        return
+
+    state = _load_json(_state_path(), {})
+    entry = dict(state.get(channel) or {})
+    entry["last_sync"] = started_at.isoformat()
+    if full:
+        entry["last_full_sync"] = started_at.isoformat()
+    state[channel] = entry
+
+    try:
+        _save_json(_state_path(), state)
+    except Exception as e:
+        print(f"⚠️ {channel} 마지막 동기화 시각 저장 실패: {e}")
@@ -0,0 +1,140 @@
+"""
+엑셀 서식 템플릿 (미리 서식을 지정해 둔 xlsx).
+
+- 찾는 순서
+    1) DATA_DIR/templates/<파일>   : 직원이 엑셀에서 직접 수정한 서식 (코드 수정 없이 반영)
+    2) 패키지 resources/templates/<파일> : 기본 서식 (라벨출력만 포함)
+- 주문수집 기본 서식은 패키지에 넣지 않는다. 템플릿으로 시작하면 write-only 스트리밍 저장을 쓸 수 없어서,
+  직원이 DATA_DIR/templates 에 주문수집 템플릿을 둔 경우에만 템플릿을 쓰고 그 외에는 코드 기본 서식으로 스트리밍한다.
+- 한 번 읽은(load_workbook) 템플릿 Workbook 을 메모리에 캐시해 두고, 쓸 때마다 복사해서 준다.
+  (파일 수정 시각이 바뀌면 다시 읽음)
+  라벨 템플릿 기준 load_workbook 약 6ms → 복사 약 2ms. (코드로 서식 만들기는 약 1.5ms 라
+  템플릿이 더 빠르지는 않다. 직원이 코드 수정 없이 서식을 바꾸게 하려는 용도이고, 다시 읽는 비용만 줄인다)
+
+기본 서식 템플릿을 DATA_DIR/templates 에 만들기 (수정용):
+    cd src
+    python -m halfetgetorder.templates      (README 실행 방법과 같이 src 에서)
+"""
+import copy
+import os
+import threading
+
+from . import config
+from .config import resource_path
+
+ORDERS_TEMPLATE = "orders_template.xlsx"
+LABEL_TEMPLATE = "label_template.xlsx"
+
+
+def user_template_dir() -> str:
+    """직원이 수정한 템플릿을 두는 폴더 (DATA_DIR/templates)."""
+    return os.path.join(config.DATA_DIR, "templates")
+
+
+_lock = threading.Lock()
+_cache: dict[str, tuple[float, "openpyxl.Workbook"]] = {}
+
+
+def template_path(name: str) -> str | None:
+    """사용할 템플릿 파일 경로. 없으면 None."""
+    candidates = [
+        os.path.join(user_template_dir(), name),
+        resource_path(os.path.join("templates", name)),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _load_cached(path: str) -> "openpyxl.Workbook":
+    """path 의 템플릿 Workbook (캐시 원본 → 고치지 말고 copy 해서 쓸 것)."""
+    import openpyxl   # 송장등록처럼 openpyxl 을 안 쓰는 작업에서는 import 하지 않도록
+
+    mtime = os.path.getmtime(path)
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    wb = openpyxl.load_workbook(path)
+    with _lock:
+        _cache[path] = (mtime, wb)
+    return wb
+
+
+def _copy_workbook(wb) -> "openpyxl.Workbook":
+    """
+    Workbook deepcopy. openpyxl 객체를 그냥 deepcopy 하면 두 군데가 깨져서 직접 맞춘다.
+    - 서식 목록(IndexedList): 내부 색인이 먼저 복사돼 항목이 비어 버림
+      → 새 IndexedList 로 먼저 복사해 memo 에 넣어 둔다 (셀의 서식 번호가 맞도록 순서 유지)
+    - 행/열 크기(DimensionHolder): default_factory 가 빠짐 → 복사된 시트 것으로 다시 연결
+    """
+    from openpyxl.utils.indexed_list import IndexedList
+
+    memo: dict = {}
+    for value in vars(wb).values():
+        if isinstance(value, IndexedList):
+            memo[id(value)] = IndexedList(copy.deepcopy(list(value), memo))
+    new_wb = copy.deepcopy(wb, memo)
+    for ws in new_wb.worksheets:
+        ws.row_dimensions.default_factory = ws._add_row
+        ws.column_dimensions.default_factory = ws._add_column
+    return new_wb
+
+
+def open_template(name: str) -> "openpyxl.Workbook | None":
+    """
+    템플릿으로 새 Workbook 을 연다. 템플릿이 없거나 읽을 수 없으면 None (→ 코드 기본 서식 사용).
+    """
+    path = template_path(name)
+    if path is None:
+        return None
+
+    try:
+        return _copy_workbook(_load_cached(path))
+    except Exception as e:
+        print(f"⚠️ 엑셀 서식 템플릿({path})을 읽지 못해 기본 서식을 사용합니다: {e}")
+        return None
+
+
+def write_default_templates(directory: str | None = None) -> list[str]:
+    """
+    코드의 기본 서식으로 직원 수정용 템플릿 파일을 만든다.
+    (라벨출력은 resources/templates 갱신에도 사용. 주문수집 템플릿은 DATA_DIR/templates 에 둘 때만 쓰인다)
+
+    - 주문수집: 1행 헤더, 2행 기본(쿠팡) 행, 3행 고도몰 부모행, 4행 추가옵션 행 서식 예시
+    - 라벨출력: 1행 헤더, 2행 데이터 행 서식 예시
+    - directory 를 안 주면 DATA_DIR/templates
+    """
+    from . import io_excel
+
+    directory = directory or user_template_dir()
+    os.makedirs(directory, exist_ok=True)
+    written = []
+
+    wb, ws = io_excel.create_orders_sheet(use_template=False)
+    io_excel.append_coupang_block(ws, [{}])
+    io_excel.append_godo_sets(ws, [{
+        "orderedAt": "", "receiver": {"name": ""},
+        "sets": [{"parent": {"goodsNm": "(고도몰 부모행 서식)"}, "children": [{"goodsNm": "(추가옵션 행 서식)"}]}],
+    }])
+    ws.cell(row=2, column=6).value = "(기본 행 서식)"
+    io_excel.finalize_orders_sheet(ws)
+    path = os.path.join(directory, ORDERS_TEMPLATE)
+    wb.save(path)
+    written.append(path)
+
+    wb, ws = io_excel.create_label_workbook([], [], godo_base_specs={}, use_template=False)
+    ws.append(["(데이터 행 서식)", "", "", "", "", ""])
+    io_excel.style_label_rows(ws)
+    path = os.path.join(directory, LABEL_TEMPLATE)
+    wb.save(path)
+    written.append(path)
+
+    return written
+
+
+if __name__ == "__main__":
+    for p in write_default_templates():
+        print(f"✅ 템플릿 생성: {p}")
@@ -1,6 +1,7 @@
 
 import unicodedata, math
 from datetime import datetime
+from functools import lru_cache
 
 def first_non_empty(*vals):
     for v in vals:
@@ -39,14 +40,66 @@ def _fmt_dt(s):
     except Exception:
         return s
 
+# ─────────────────────────────────────────────────────────
+# 엑셀 열 너비용 글자 폭 계산
+#   - ASCII 문자열은 바로 len()
+#   - 그 외는 BMP(U+0000~U+FFFF) 글자 폭 표를 한 번 만들어 두고 표에서 찾는다
+#     (한글/CJK 는 아래 범위로 바로 채우고, 나머지만 unicodedata 로 계산)
+#   - 같은 문자열(상품명, 옵션명 등)은 결과를 캐시
+# ─────────────────────────────────────────────────────────
+_WIDE_RANGES = (
+    (0x1100, 0x115F),   # 한글 자모 (초성)
+    (0x2E80, 0x303E),   # CJK 부수 / 기호·구두점
+    (0x3041, 0x33FF),   # 히라가나, 가타카나, 한글 호환 자모, CJK 호환
+    (0x3400, 0x4DBF),   # CJK 통합 한자 확장 A
+    (0x4E00, 0x9FFF),   # CJK 통합 한자
+    (0xA960, 0xA97C),   # 한글 자모 확장 A
+    (0xAC00, 0xD7A3),   # 한글 음절
+    (0xF900, 0xFAFF),   # CJK 호환 한자
+    (0xFF01, 0xFF60),   # 전각 ASCII
+    (0xFFE0, 0xFFE6),   # 전각 기호
+)
+
+_extra_width: bytearray | None = None   # 글자마다 len() 에 더할 폭 (0 또는 1)
+
+
+def _char_extra_width(ch):
+    return 1 if unicodedata.east_asian_width(ch) in ('W', 'F', 'A') else 0
+
+
+def _bmp_extra_width() -> bytearray:
+    global _extra_width
+    if _extra_width is None:
+        table = bytearray(0x10000)
+        for lo, hi in _WIDE_RANGES:
+            table[lo:hi + 1] = b"\x01" * (hi - lo + 1)
+        for cp in range(0x80, 0x10000):
+            if not table[cp]:
+                table[cp] = _char_extra_width(chr(cp))
+        _extra_width = table
+    return _extra_width
+
+
+@lru_cache(maxsize=8192)
+def _visual_len_str(s: str) -> int:
+    if s.isascii():
+        return len(s)
+    if max(s) <= '\uffff':
+        return len(s) + sum(map(_bmp_extra_width().__getitem__, map(ord, s)))
+    return len(s) + sum(map(_char_extra_width, s))
+
+
 def visual_len(s):
+    """
+    엑셀에서 보이는 글자 폭 (한글/한자/전각 등 동아시아 넓은 글자는 2, 나머지 1).
+    """
     if s is None:
         return 0
-    total = 0
-    for ch in str(s):
-        ea = unicodedata.east_asian_width(ch)
-        total += 2 if ea in ('W','F','A') else 1
-    return total
+    if not isinstance(s, str):
+        s = str(s)
+    if s.isascii():
+        return len(s)
+    return _visual_len_str(s)
 
 def get_box_count_from_items(items):
     if not items:
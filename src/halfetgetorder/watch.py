@@ -0,0 +1,123 @@
+"""
+감시(watch) 모드: 창을 띄워 둔 채 쿠팡/고도몰 주문을 주기적으로 다시 조회한다.
+
+    python -m halfetgetorder --watch [--interval 50]      (exe 도 같은 옵션, 또는 .env 에 WATCH=1)
+
+- 한 프로세스에서 계속 돌기 때문에 HTTP 커넥션(client 세션), 기본 사양 조회 스레드와
+  스레드별 캐시 DB 연결, 엑셀 생성용 워커 프로세스를 매번 새로 만들지 않는다.
+- 조회 간격은 interval 초 ± JITTER_RATIO (조회 시작 시각 기준, 최소 MIN_INTERVAL_SECONDS)
+- 받은 주문 목록의 지문(fingerprint)이 마지막으로 엑셀을 만들 때와 같으면 다시 만들지 않는다.
+  (날짜가 바뀌었거나 지난번 생성이 실패했으면 다시 만든다)
+- 한 채널이라도 조회에 실패하면 이번 결과로 엑셀을 덮어쓰지 않고 다음 조회를 기다린다.
+- 실행 보고서는 엑셀을 다시 만들 때만 저장하고, 그 사이 조회의 API 지표는 다음 보고서에 합쳐진다.
+- 증분 동기화(.env 의 INCREMENTAL_SYNC=1)와 같이 쓰면 매번 7일치를 다 받지 않는다.
+- Ctrl+C 로 끝낸다.
+"""
+import hashlib
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from . import app, config, metrics, render
+from .run_report import RunReport
+
+MIN_INTERVAL_SECONDS = 30   # 고도몰 API 보호용 최소 조회 간격
+JITTER_RATIO = 0.2          # 조회 간격을 ±20% 안에서 흔든다
+PREFETCH_WORKERS = 8        # 기본 사양(Goods_Search) 동시 조회 수
+
+CHANNEL_NAMES = {"coupang": "쿠팡", "godo": "고도몰"}
+
+
+def fingerprint(filtered_orders, grouped) -> str:
+    """주문 목록 지문. 순서까지 같아야 같은 값 (엑셀 행 순서도 그대로여야 하므로)."""
+    data = json.dumps([filtered_orders, grouped], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def next_delay(interval: float) -> float:
+    return interval * random.uniform(1 - JITTER_RATIO, 1 + JITTER_RATIO)
+
+
+def run(interval: int, max_cycles: int | None = None, profile: bool = False) -> None:
+    """
+    interval 초마다 주문을 조회하고 바뀌었을 때만 엑셀을 다시 만든다.
+    max_cycles 를 주면 그만큼 조회한 뒤 끝낸다 (측정/테스트용).
+    """
+    interval = max(MIN_INTERVAL_SECONDS, int(interval))
+    print("=================================================================")
+    print(f"[INFO] 감시 모드: 약 {interval}초마다 주문을 다시 조회합니다. (끝내려면 Ctrl+C)")
+    if not config.INCREMENTAL_SYNC:
+        print("ℹ️ .env 에 INCREMENTAL_SYNC=1 을 넣으면 매번 7일치를 다 받지 않고 바뀐 날짜만 받습니다.")
+
+    prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+    goods_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="goods")
+    # 프로파일링 중에는 app 과 같이 이 프로세스에서 차례대로 만든다
+    render_pool = None if profile else render.open_pool()
+
+    last = None    # 마지막으로 엑셀을 만든 (날짜, 지문)
+    cycle = 0
+    try:
+        while True:
+            cycle += 1
+            started = time.monotonic()
+            if render.pool_broken(render_pool):
+                render_pool.shutdown(wait=False)
+                render_pool = render.open_pool()
+
+            try:
+                last = _cycle(last, prefetch_pool, goods_pool, render_pool, profile)
+            except Exception as e:
+                # 예상하지 못한 오류로 감시가 멈추지 않도록 (다음 조회에서 다시 만든다)
+                print("❌ 주문 조회/엑셀 생성 중 오류:", repr(e))
+                last = None
+
+            if max_cycles and cycle >= max_cycles:
+                break
+            wait = max(1.0, next_delay(interval) - (time.monotonic() - started))
+            time.sleep(wait)
+    except KeyboardInterrupt:
+        print("ℹ️ 감시 모드를 끝냅니다.")
+    finally:
+        metrics.append_history(metrics.take())
+        goods_pool.shutdown(wait=False)
+        prefetch_pool.shutdown(wait=False)
+        if render_pool is not None:
+            render_pool.shutdown(wait=False)
+
+
+def _cycle(last, prefetch_pool, goods_pool, render_pool, profile):
+    """조회 한 번. 반환: 이번에 엑셀을 만들었으면 새 (날짜, 지문), 아니면 last 그대로."""
+    report = RunReport(mode="watch")
+    now = datetime.now()
+    stamp = now.strftime("%H:%M:%S")
+
+    complete = {}
+    with report.stage("주문 조회(전체)"):
+        filtered_orders, grouped, godo_ok = app._fetch_all_channels(report, complete)
+    if godo_ok:
+        app._save_last_run(now)
+
+    if not all(complete.values()):
+        failed = ", ".join(CHANNEL_NAMES[name] for name, ok in complete.items() if not ok)
+        print(f"⚠️ [{stamp}] {failed} 주문을 끝까지 받지 못해 이번에는 엑셀을 다시 만들지 않습니다.")
+        return last
+
+    key = (app._today(), fingerprint(filtered_orders, grouped))
+    if key == last:
+        print(
+            f"ℹ️ [{stamp}] 주문 변경 없음 (쿠팡 {len(filtered_orders)}건 / 고도몰 {len(grouped)}건,"
+            f" 조회 {report.stages['주문 조회(전체)']:.1f}초)"
+        )
+        return last
+
+    print(f"[INFO] [{stamp}] 주문이 바뀌어 엑셀을 다시 만듭니다.")
+    base_specs_future = app._start_prefetch(report, grouped, pool=prefetch_pool, executor=goods_pool)
+    results = app._render_outputs(report, filtered_orders, grouped, base_specs_future, profile, pool=render_pool)
+    app._finish(report)
+
+    # 파일이 열려 있어 저장하지 못한 경우 등은 다음 조회에서 다시 만든다
+    if any(r["error"] for r in results.values()):
+        return None
+    return key
@@ -0,0 +1,245 @@
+"""
+대한통운 송장등록 파일 (xlsx / csv).
+
+열 17개짜리 단순한 표라서 openpyxl 없이 zipfile 로 SpreadsheetML 을 직접 쓴다.
+- styles.xml 은 고정 (0: 기본, 1: 헤더 = 굵게 + 배경색 + 가운데, 2: 본문 = 가운데)
+- 시트 XML 은 행마다 바로 zip 에 흘려 쓴다 (행 수만큼 메모리를 쓰지 않음)
+- 열 너비는 io_excel.create_waybill_workbook 과 같은 규칙 (글자 수 * 1.3 + 2)
+"""
+import csv
+import re
+import zipfile
+from datetime import date
+
+from .utils import get_box_count_from_items
+
+SHEET_TITLE = "판매 주문수집"
+
+WAYBILL_HEADER = [
+    '예약구분', '집하예정일', '받는분성명', '받는분전화번호', '받는분기타연락처',
+    '받는분우편번호', '받는분주소(전체, 분할)', '운송장번호', '고객주문번호',
+    '품목명', '박스수량', '박스타입', '기본운임', '배송메세지1',
+    '배송메세지2', '품목명', '운임구분'
+]
+
+ZOOM_SCALE = 75
+
+# 스타일 인덱스 (styles.xml 의 cellXfs 순서)
+STYLE_HEADER = 1
+STYLE_BODY = 2
+
+_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _escape(text: str) -> str:
+    """XML 텍스트 이스케이프 (xml.sax.saxutils.escape 와 같음, import 비용 없이)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<workbook xmlns="{_NS}" xmlns:r="{_REL_NS}">'
+    '<bookViews><workbookView activeTab="0"/></bookViews>'
+    f'<sheets><sheet name="{_escape(SHEET_TITLE)}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<styleSheet xmlns="{_NS}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><color theme="1"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b val="1"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00D8E4BC"/><bgColor rgb="00D8E4BC"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+# XML 1.0 에 넣을 수 없는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def waybill_rows(coupang_orders, today_str: str | None = None):
+    """
+    정규화된 쿠팡 주문(coupang.normalize_coupang_orders 결과) → 송장등록 행을 yield.
+    """
+    today_str = today_str or date.today().strftime('%Y%m%d')
+
+    for od in coupang_orders:
+        name = od.get("name", "")
+        phone = od.get("phone", "")
+        addr1 = od.get("addr1", "")
+        addr2 = od.get("addr2", "")
+        zipcode = od.get("zipcode", "")
+        address = f"{addr1} {addr2}".strip()
+
+        box_cnt = get_box_count_from_items(od.get("items", []))
+        platform_name = "쿠팡"
+
+        yield [
+            "일반",
+            today_str,
+            name,
+            phone,
+            "",
+            zipcode,
+            address,
+            "",
+            "",
+            "",
+            box_cnt,
+            "",
+            "",
+            "",
+            platform_name,
+            "",
+            "신용"
+        ]
+
+
+def column_widths(rows) -> list[float]:
+    """열 너비: 열에서 가장 긴 값의 글자 수 * 1.3 + 2 (헤더 포함)."""
+    max_lens = [len(h) for h in WAYBILL_HEADER]
+    for row in rows:
+        for i, v in enumerate(row):
+            n = len(str(v)) if v is not None else 0
+            if n > max_lens[i]:
+                max_lens[i] = n
+    return [n * 1.3 + 2 for n in max_lens]
+
+
+def _col_letter(idx: int) -> str:
+    """1 → A, 27 → AA"""
+    letters = ""
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+_COLS = [_col_letter(i) for i in range(1, len(WAYBILL_HEADER) + 1)]
+
+
+def _cell_xml(ref: str, value, style: int) -> str:
+    if value is None or value == "":
+        return f'<c r="{ref}" s="{style}"/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}" s="{style}"><v>{value}</v></c>'
+
+    text = _ILLEGAL_XML_CHARS.sub("", str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t{space}>{_escape(text)}</t></is></c>'
+
+
+def _row_xml(row_no: int, values, style: int) -> str:
+    cells = "".join(
+        _cell_xml(f"{col}{row_no}", v, style) for col, v in zip(_COLS, values)
+    )
+    return f'<row r="{row_no}">{cells}</row>'
+
+
+def write_waybill_xlsx(path: str, coupang_orders, today_str: str | None = None) -> int:
+    """
+    대한통운 송장등록 xlsx 를 쓴다. 반환: 주문 행 수.
+
+    열 너비(<cols>)가 시트 데이터보다 앞에 와야 해서 행 값은 한 번 리스트로 만든다.
+    (주문 한 건 = 17칸짜리 행 하나라 부담 없음)
+    """
+    rows = list(waybill_rows(coupang_orders, today_str))
+    widths = column_widths(rows)
+    last_ref = f"{_COLS[-1]}{len(rows) + 1}"
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", _STYLES)
+
+        with zf.open("xl/worksheets/sheet1.xml", "w") as f:
+            f.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<worksheet xmlns="{_NS}" xmlns:r="{_REL_NS}">'
+                f'<dimension ref="A1:{last_ref}"/>'
+                f'<sheetViews><sheetView zoomScale="{ZOOM_SCALE}" workbookViewId="0"/></sheetViews>'
+                '<sheetFormatPr defaultRowHeight="15"/>'
+                '<cols>'
+                + "".join(
+                    f'<col min="{i}" max="{i}" width="{w:.16g}" customWidth="1"/>'
+                    for i, w in enumerate(widths, start=1)
+                )
+                + '</cols><sheetData>'
+                + _row_xml(1, WAYBILL_HEADER, STYLE_HEADER)
+            ).encode("utf-8"))
+
+            for row_no, values in enumerate(rows, start=2):
+                f.write(_row_xml(row_no, values, STYLE_BODY).encode("utf-8"))
+
+            f.write(b'</sheetData></worksheet>')
+
+    return len(rows)
+
+
+def write_waybill_csv(
+    path: str,
+    coupang_orders,
+    today_str: str | None = None,
+    encoding: str = "utf-8-sig",
+) -> int:
+    """
+    대한통운 송장등록 csv 를 쓴다. 반환: 주문 행 수.
+    (기본 utf-8-sig: 엑셀에서 열어도 한글이 깨지지 않음. 필요하면 encoding="cp949")
+    """
+    count = 0
+    with open(path, "w", encoding=encoding, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(WAYBILL_HEADER)
+        for row in waybill_rows(coupang_orders, today_str):
+            writer.writerow(row)
+            count += 1
+    return count
@@ -0,0 +1,52 @@
+"""
+pytest 공용 설정.
+
+- src (halfetgetorder) 와 프로젝트 루트 (benchmarks.synthetic 가짜 데이터) 를 import 경로에 넣는다.
+- data_dir 픽스처: DATA_DIR 을 테스트마다 임시 폴더로 바꿔서 바탕화면 폴더를 건드리지 않는다.
+
+    python -m pytest test
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "src"), ROOT]
+
+from halfetgetorder import config  # noqa: E402
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATA_DIR", str(tmp_path), raising=False)
+    monkeypatch.setattr(config, "_data_dir_ready", False)
+    return tmp_path
+
+
+def _snapshot(ws) -> dict:
+    """시트 비교용: 셀 값/서식, 병합 범위, 행 높이, 열 너비."""
+    cells = {}
+    for row in ws.iter_rows():
+        for c in row:
+            if c.value is None and not c.has_style:
+                continue
+            cells[c.coordinate] = (
+                c.value,
+                (c.font.b, c.font.sz, (c.font.color.type, c.font.color.value) if c.font.color else None),
+                c.fill.fgColor.rgb if c.fill.fill_type else None,
+                tuple(getattr(c.border, side).style for side in ("left", "right", "top", "bottom")),
+                (c.alignment.horizontal, c.alignment.vertical, bool(c.alignment.wrap_text)),
+                c.number_format,
+            )
+    return {
+        "cells": cells,
+        "merged": sorted(str(r) for r in ws.merged_cells.ranges),
+        "heights": {r: d.height for r, d in ws.row_dimensions.items() if d.height is not None},
+        "widths": {k: d.width for k, d in ws.column_dimensions.items() if d.width},
+    }
+
+
+@pytest.fixture
+def sheet_snapshot():
+    return _snapshot
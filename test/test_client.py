@@ -0,0 +1,140 @@
+"""client.request: 5xx / 429 재시도, 백오프, 지표 기록."""
+import io
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from halfetgetorder import client, metrics, ratelimit  # noqa: E402
+
+URL = "https://api.example.com/v2/orders/ordersheets"
+
+
+def _response(status: int, headers: dict | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp.raw = io.BytesIO(b"")
+    resp._content = b""
+    resp.request = requests.Request("GET", URL).prepare()
+    return resp
+
+
+class FakeSession:
+    """응답/예외를 순서대로 돌려주는 세션."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    """FakeSession 을 끼우고 time.sleep 은 기록만 한다. 반환: (세션 설치 함수, sleep 기록)"""
+    sleeps = []
+    monkeypatch.setattr(client.time, "sleep", sleeps.append)
+    monkeypatch.setattr(ratelimit, "_limits", {})
+    metrics.take()
+
+    def install(*outcomes):
+        session = FakeSession(outcomes)
+        monkeypatch.setattr(client, "get_session", lambda: session)
+        return session
+
+    return install, sleeps
+
+
+def test_success_without_retry(fake):
+    install, sleeps = fake
+    session = install(_response(200))
+    assert client.request("GET", URL).status_code == 200
+    assert session.calls == 1 and sleeps == []
+
+
+def test_retries_5xx_with_backoff(fake):
+    install, sleeps = fake
+    session = install(_response(503), _response(502), _response(200))
+
+    assert client.request("GET", URL).status_code == 200
+    assert session.calls == 3
+    assert len(sleeps) == 2
+    assert all(0 <= s <= min(client.BACKOFF_MAX, client.BACKOFF_BASE * 2 ** i) for i, s in enumerate(sleeps))
+
+    stats = metrics.take()["ordersheets"]
+    assert stats["calls"] == 1 and stats["retries"] == 2
+
+
+def test_returns_last_5xx_when_retries_run_out(fake):
+    install, _ = fake
+    session = install(*[_response(500)] * (client.MAX_RETRIES + 1))
+    assert client.request("GET", URL).status_code == 500
+    assert session.calls == client.MAX_RETRIES + 1
+
+
+def test_429_waits_retry_after(fake):
+    install, sleeps = fake
+    session = install(_response(429, {"Retry-After": "2"}), _response(200))
+    assert client.request("GET", URL).status_code == 200
+    assert session.calls == 2 and sleeps == [2.0]
+
+
+def test_429_retry_after_is_capped(fake):
+    install, sleeps = fake
+    install(_response(429, {"Retry-After": "3600"}), _response(200))
+    client.request("GET", URL)
+    assert sleeps == [client.RETRY_AFTER_MAX]
+
+
+def test_other_request_errors_are_not_retried(fake):
+    install, _ = fake
+    session = install(requests.exceptions.InvalidURL("bad"))
+    with pytest.raises(requests.exceptions.InvalidURL):
+        client.request("GET", URL)
+    assert session.calls == 1
+
+
+def _refused() -> requests.ConnectionError:
+    reason = client.urllib3.exceptions.NewConnectionError(None, "connection refused")
+    return requests.ConnectionError(client.urllib3.exceptions.MaxRetryError(None, URL, reason))
+
+
+def test_post_retries_connect_errors_and_5xx(fake):
+    install, _ = fake
+    session = install(_refused(), requests.ConnectTimeout("connect"), _response(503), _response(200))
+    assert client.request("POST", URL).status_code == 200
+    assert session.calls == 4
+
+
+@pytest.mark.parametrize("error", [
+    requests.ReadTimeout("read"),
+    requests.ConnectionError("connection reset by peer"),
+])
+def test_post_is_not_replayed_after_it_may_have_arrived(fake, error):
+    install, _ = fake
+    session = install(error, _response(200))
+    with pytest.raises(type(error)):
+        client.request("POST", URL)
+    assert session.calls == 1
+
+
+def test_get_read_timeout_retried_once(fake):
+    install, _ = fake
+    session = install(*[requests.ReadTimeout("read")] * (client.MAX_RETRIES + 1))
+    with pytest.raises(requests.ReadTimeout):
+        client.request("GET", URL)
+    assert session.calls == client.READ_TIMEOUT_RETRIES + 1
+    assert metrics.take()["ordersheets"]["status"] == {"error": 1}
+
+
+def test_get_connection_reset_retried(fake):
+    install, _ = fake
+    session = install(requests.ConnectionError("reset"), _response(200))
+    assert client.request("GET", URL).status_code == 200
+    assert session.calls == 2
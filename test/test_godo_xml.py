@@ -0,0 +1,92 @@
+"""godo_xml 스트리밍 파서가 기존 xmltodict + godo.group_sets 결과와 같은지."""
+import re
+
+import pytest
+
+from benchmarks import synthetic
+from halfetgetorder import godo, godo_xml
+
+xmltodict = pytest.importorskip("xmltodict")
+
+
+def _baseline(xml: str) -> list:
+    return godo.group_sets(xmltodict.parse(xml))
+
+
+def _streamed(source) -> list:
+    return list(godo.iter_grouped_orders([list(godo_xml.iter_order_page(source))]))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_order_page_matches_xmltodict(seed):
+    orders = synthetic.godo_orders(60, seed=seed, catalog=synthetic.goods_catalog())
+    xml = synthetic.godo_order_search_xml(orders)
+    assert _streamed(xml) == _baseline(xml)
+
+
+def test_order_page_strips_padded_text():
+    # xmltodict 처럼 CDATA/텍스트 앞뒤 공백을 지워야 주문키와 셀 값이 같다
+    orders = synthetic.godo_orders(20, catalog=synthetic.goods_catalog())
+    xml = re.sub(
+        r"<!\[CDATA\[(.*?)\]\]>",
+        lambda m: f"<![CDATA[  {m.group(1)} \n]]>",
+        synthetic.godo_order_search_xml(orders),
+        flags=re.S,
+    )
+
+    header = {}
+    streamed = list(godo.iter_grouped_orders([list(godo_xml.iter_order_page(xml, header))]))
+    assert streamed == _baseline(xml)
+    assert streamed == _streamed(synthetic.godo_order_search_xml(orders))
+    assert header["total"] == "20"
+
+
+def test_order_page_chunked_feed():
+    xml = synthetic.godo_order_search_xml(synthetic.godo_orders(40, catalog=synthetic.goods_catalog()))
+    data = xml.encode("utf-8")
+    chunks = [data[i:i + 97] for i in range(0, len(data), 97)]
+    assert _streamed(chunks) == _streamed(xml)
+
+
+def test_order_page_header():
+    orders = synthetic.godo_orders(250, catalog=synthetic.goods_catalog())
+    header = {}
+    page = list(godo_xml.iter_order_page(synthetic.godo_order_search_xml(orders, page=2), header))
+
+    assert len(page) == 100
+    assert header["total"] == "250"
+    assert header["max_page"] == "3"
+    assert header["now_page"] == "2"
+
+
+def test_short_description_found():
+    goods = synthetic.goods_catalog()[3]
+    xml = synthetic.godo_goods_search_xml(goods)
+    assert godo_xml.find_short_description(xml, goods["goodsNo"]) == (True, goods["shortDescription"])
+
+
+def test_short_description_empty():
+    assert godo_xml.find_short_description(synthetic.godo_goods_search_xml(None), "1") == (False, "")
+
+
+def test_short_description_falls_back_to_first():
+    xml = (
+        "<data><return>"
+        "<goods_data><goodsNo>1</goodsNo><shortDescription>first</shortDescription></goods_data>"
+        "<goods_data><goodsNo>2</goodsNo><shortDescription>second</shortDescription></goods_data>"
+        "</return></data>"
+    )
+    assert godo_xml.find_short_description(xml, "9") == (True, "first")
+    assert godo_xml.find_short_description(xml, "2") == (True, "second")
+
+
+def test_short_description_ignores_nested_goods_no():
+    # 옵션 데이터 안의 goodsNo 가 먼저 끝나도 바깥 상품 레코드로 판단해야 한다
+    xml = (
+        "<data><return>"
+        "<goods_data><goodsNo>1</goodsNo><shortDescription>wrong</shortDescription>"
+        "<optionData><goods_data><goodsNo>2</goodsNo></goods_data></optionData></goods_data>"
+        "<goods_data><goodsNo>2</goodsNo><shortDescription>right</shortDescription></goods_data>"
+        "</return></data>"
+    )
+    assert godo_xml.find_short_description(xml, "2") == (True, "right")
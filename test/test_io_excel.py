@@ -0,0 +1,68 @@
+"""io_excel: 공용 스타일 캐시, write-only 주문수집 저장이 기존 워크북 생성과 같은지."""
+import gc
+from copy import copy
+
+import openpyxl
+import pytest
+from openpyxl.styles import DEFAULT_FONT, Font
+
+from benchmarks import synthetic
+from halfetgetorder import godo, io_excel
+
+
+def test_style_cache_with_transient_style_objects():
+    # 워크북에 이미 있는 서식과 같은 Font 는 등록되지 않고 버려져서 id 가 재사용될 수 있다
+    ws = openpyxl.Workbook().active
+    for row in range(1, 30):
+        io_excel._apply_style(ws.cell(row=row, column=1), font=copy(DEFAULT_FONT))
+        gc.collect()
+        cell = ws.cell(row=row, column=2)
+        io_excel._apply_style(cell, font=Font(sz=row + 8))
+        gc.collect()
+        assert cell.font.sz == row + 8
+
+
+def test_style_cache_shares_equal_styles():
+    wb = openpyxl.Workbook()
+    a, b = wb.active["A1"], wb.active["A2"]
+    io_excel._apply_style(a, font=Font(b=True), alignment=io_excel.ALIGN_CENTER)
+    io_excel._apply_style(b, font=Font(b=True), alignment=io_excel.ALIGN_CENTER)
+    assert a._style == b._style
+    assert a.font.b and b.alignment.horizontal == "center"
+
+
+def _orders_data(n=40):
+    catalog = synthetic.goods_catalog()
+    page = {"data": {"return": {"order_data": synthetic.godo_orders(n, catalog=catalog)}}}
+    return synthetic.coupang_orders(n, seed=3), godo.group_sets(page)
+
+
+def _reload(path):
+    return openpyxl.load_workbook(path, rich_text=True).active
+
+
+@pytest.mark.parametrize("coupang_only", [False, True])
+def test_write_only_orders_matches_create_orders_workbook(tmp_path, sheet_snapshot, coupang_only):
+    cp, gd = _orders_data()
+    if coupang_only:
+        gd = []
+
+    streamed = tmp_path / "streamed.xlsx"
+    rows = io_excel.save_orders_workbook(str(streamed), coupang_orders=cp, godo_grouped_orders=gd)
+    built = tmp_path / "built.xlsx"
+    wb, ws = io_excel.create_orders_workbook(cp, gd)
+    wb.save(built)
+
+    expected, actual = _reload(built), _reload(streamed)
+    assert rows == ws.max_row - 1
+    assert sheet_snapshot(actual) == sheet_snapshot(expected)
+    assert actual.sheet_view.zoomScale == expected.sheet_view.zoomScale
+    assert [str(cf.sqref) for cf in actual.conditional_formatting] == [
+        str(cf.sqref) for cf in expected.conditional_formatting
+    ]
+
+
+def test_write_only_orders_empty(tmp_path):
+    path = tmp_path / "empty.xlsx"
+    assert io_excel.save_orders_workbook(str(path), coupang_orders=[], godo_grouped_orders=[]) == 0
+    assert [c.value for c in _reload(path)[1]] == io_excel.ORDERS_HEADERS
@@ -0,0 +1,99 @@
+"""order_store 저장/불러오기 왕복, 그리고 조회 실패 시 저장소를 덮어쓰지 않는지."""
+from datetime import datetime
+
+import pytest
+
+from benchmarks import synthetic
+from halfetgetorder import app, config, coupang, godo, order_store
+from halfetgetorder.run_report import RunReport
+
+
+@pytest.fixture
+def full_sync(monkeypatch):
+    monkeypatch.setattr(config, "INCREMENTAL_SYNC", False, raising=False)
+
+
+def test_coupang_round_trip(data_dir):
+    orders = synthetic.coupang_orders(30, seed=3)
+    order_store.save_orders("coupang", orders)
+    assert order_store.load_orders("coupang") == orders
+
+
+def test_godo_round_trip(data_dir):
+    catalog = synthetic.goods_catalog()
+    grouped = godo.group_sets({"data": {"return": {"order_data": synthetic.godo_orders(30, catalog=catalog)}}})
+    order_store.save_orders("godo", grouped)
+    assert order_store.load_orders("godo") == grouped
+
+
+def test_load_returns_only_last_batch(data_dir):
+    orders = synthetic.coupang_orders(10, seed=3)
+    order_store.save_orders("coupang", orders, synced_at=1.0)
+    order_store.save_orders("coupang", orders[5:], synced_at=2.0)
+
+    assert order_store.load_orders("coupang") == orders[5:]
+
+
+def test_empty_store(data_dir):
+    assert not order_store.has_orders("godo")
+    assert order_store.load_orders("godo") == []
+
+
+def test_first_page_failure_keeps_store(data_dir, full_sync, monkeypatch):
+    stored = synthetic.coupang_orders(30, seed=3)
+    order_store.save_orders("coupang", stored)
+    monkeypatch.setattr(coupang, "_request_ordersheets", lambda *a, **k: None)
+
+    status = {}
+    with pytest.raises(RuntimeError):
+        app._fetch_coupang_orders(RunReport(), status)
+
+    assert not status["complete"]
+    assert order_store.load_orders("coupang") == stored
+
+
+def test_partial_fetch_keeps_store(data_dir, full_sync, monkeypatch):
+    stored = synthetic.coupang_orders(30, seed=3)
+    order_store.save_orders("coupang", stored)
+    pages = iter([{"data": synthetic.coupang_orders(5, seed=4), "nextToken": "5"}, None])
+    monkeypatch.setattr(coupang, "_request_ordersheets", lambda *a, **k: next(pages))
+
+    status = {}
+    app._fetch_coupang_orders(RunReport(), status)
+
+    assert not status["complete"]
+    assert order_store.load_orders("coupang") == stored
+
+
+def test_complete_fetch_replaces_store(data_dir, full_sync, monkeypatch):
+    order_store.save_orders("coupang", synthetic.coupang_orders(30, seed=3))
+    fresh = [od for od in synthetic.coupang_orders(5, seed=4) if not app._is_rental_order(od)]
+    monkeypatch.setattr(coupang, "_request_ordersheets", lambda *a, **k: {"data": fresh, "nextToken": ""})
+
+    status = {}
+    assert app._fetch_coupang_orders(RunReport(), status) == fresh
+    assert status["complete"]
+    assert order_store.load_orders("coupang") == fresh
+
+
+def _row_counts() -> tuple[int, int]:
+    conn = order_store._connect()
+    try:
+        return tuple(conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ("orders", "order_lines"))
+    finally:
+        conn.close()
+
+
+def test_save_prunes_old_orders_outside_batch(data_dir):
+    now = datetime(2026, 10, 18, 12)
+    recent, old = synthetic.coupang_orders(2, seed=3)
+    recent = dict(recent, shipmentBoxId="recent", orderedAt="2026-10-17T10:00:00")
+    old = dict(old, shipmentBoxId="old", orderedAt="2026-10-01T10:00:00")
+    lines = len(recent["orderItems"])
+
+    order_store.save_orders("coupang", [recent, old], synced_at=now.timestamp() - 60)
+    order_store.save_orders("coupang", [], synced_at=now.timestamp())
+
+    # 'old' 는 조회 기간 밖이라 지우고, 'recent' 는 기간 안이라 남긴다 (현재 묶음은 아님)
+    assert order_store.load_orders("coupang") == []
+    assert _row_counts() == (1, lines)
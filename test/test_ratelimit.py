@@ -0,0 +1,71 @@
+"""ratelimit: RATE_LIMITS 파싱과 토큰 버킷 계산."""
+import pytest
+
+from halfetgetorder import ratelimit
+
+
+@pytest.fixture
+def conn(data_dir, monkeypatch):
+    monkeypatch.setattr(ratelimit, "_local", ratelimit.threading.local())
+    conn = ratelimit._conn()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(ratelimit.time, "time", lambda: now[0])
+    return now
+
+
+def test_parse():
+    assert ratelimit._parse("Goods_Search.php=10/20, ordersheets=5") == {
+        "Goods_Search.php": (10.0, 20.0),
+        "ordersheets": (5.0, 5.0),
+    }
+    assert ratelimit._parse("a=0,b=x,c=2/0.5") == {"c": (2.0, 1.0)}
+
+
+def test_default_is_unlimited(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limits", None)
+    monkeypatch.setattr(ratelimit.config, "RATE_LIMITS", "", raising=False)
+    assert ratelimit.limits() == {}
+    assert ratelimit.acquire("ordersheets") == 0.0
+
+
+def test_take_spends_burst_then_waits(conn, clock):
+    assert [ratelimit._take(conn, "ep", 2.0, 3.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert ratelimit._take(conn, "ep", 2.0, 3.0) == pytest.approx(0.5)
+
+
+def test_take_refills_at_rate_up_to_burst(conn, clock):
+    for _ in range(3):
+        ratelimit._take(conn, "ep", 2.0, 3.0)
+
+    clock[0] += 0.5     # 토큰 1개
+    assert ratelimit._take(conn, "ep", 2.0, 3.0) == 0.0
+    assert ratelimit._take(conn, "ep", 2.0, 3.0) == pytest.approx(0.5)
+
+    clock[0] += 60      # 오래 쉬어도 burst 까지만
+    assert [ratelimit._take(conn, "ep", 2.0, 3.0) for _ in range(4)][-1] == pytest.approx(0.5)
+
+
+def test_take_ignores_clock_going_back(conn, clock):
+    ratelimit._take(conn, "ep", 1.0, 1.0)
+    clock[0] -= 100
+    assert ratelimit._take(conn, "ep", 1.0, 1.0) == pytest.approx(1.0)
+
+
+def test_endpoints_have_separate_buckets(conn, clock):
+    assert ratelimit._take(conn, "a", 1.0, 1.0) == 0.0
+    assert ratelimit._take(conn, "b", 1.0, 1.0) == 0.0
+    assert ratelimit._take(conn, "a", 1.0, 1.0) == pytest.approx(1.0)
+
+
+def test_penalize_empties_bucket(conn, clock, monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limits", {"ep": (2.0, 3.0)})
+    assert ratelimit.penalize("ep", 5.0)
+    # 5초 동안 토큰이 안 생기고 그 뒤 1개가 찰 때까지 0.5초
+    assert ratelimit._take(conn, "ep", 2.0, 3.0) == pytest.approx(5.5)
+    assert not ratelimit.penalize("other", 5.0)
@@ -0,0 +1,62 @@
+"""고도몰 기본 사양 캐시: TTL, 네거티브 캐시, 스레드 간 연결 공유."""
+from concurrent.futures import ThreadPoolExecutor
+
+from halfetgetorder import spec_cache
+
+
+def test_round_trip(data_dir):
+    spec_cache.put("1001", "DDR4 16G", "SSD 512G")
+    assert spec_cache.get("1001") == ("DDR4 16G", "SSD 512G")
+    assert spec_cache.get("9999") is None
+
+
+def test_ttl(data_dir, monkeypatch):
+    spec_cache.put("1001", "DDR4 16G", "SSD 512G")
+    spec_cache.put("1002", "", "")    # 네거티브 캐시
+    later = spec_cache.time.time() + spec_cache.NEGATIVE_TTL_SECONDS + 1
+    monkeypatch.setattr(spec_cache.time, "time", lambda: later)
+
+    assert spec_cache.get("1001") == ("DDR4 16G", "SSD 512G")
+    assert spec_cache.get("1002") is None
+    assert spec_cache.get("1002", allow_stale=True) == ("", "")
+
+
+def test_worker_threads_share_one_connection(data_dir):
+    spec_cache.put("1001", "DDR4 16G", "SSD 512G")
+    conn = spec_cache._db[1]
+
+    # 실행/감시 주기마다 새 스레드 풀을 만들어도 연결이 늘지 않는다
+    for _ in range(3):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(spec_cache.get, ["1001"] * 20))
+        assert results == [("DDR4 16G", "SSD 512G")] * 20
+        assert spec_cache._db[1] is conn
+
+
+def test_reopens_for_new_data_dir(data_dir, tmp_path_factory, monkeypatch):
+    spec_cache.put("1001", "DDR4 16G", "SSD 512G")
+    monkeypatch.setattr(spec_cache.config, "DATA_DIR", str(tmp_path_factory.mktemp("other")))
+    monkeypatch.setattr(spec_cache.config, "_data_dir_ready", False)
+    assert spec_cache.get("1001") is None
+
+
+def _accessed_at(goods_no):
+    return spec_cache._db[1].execute(
+        "SELECT accessed_at FROM goods_specs WHERE goods_no = ?", (goods_no,)
+    ).fetchone()[0]
+
+
+def test_hits_touch_lru_only_after_interval(data_dir, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(spec_cache.time, "time", lambda: now[0])
+    spec_cache.put("1001", "DDR4 16G", "SSD 512G")
+    changes = spec_cache._db[1].total_changes
+
+    now[0] += 60
+    assert spec_cache.get("1001") == ("DDR4 16G", "SSD 512G")
+    assert spec_cache._db[1].total_changes == changes    # 쓰기 없음
+    assert _accessed_at("1001") == 1_000_000.0
+
+    now[0] += spec_cache.TOUCH_INTERVAL_SECONDS
+    spec_cache.get("1001")
+    assert _accessed_at("1001") == now[0]
@@ -0,0 +1,70 @@
+"""증분 동기화: 조회 구간 계산과 저장된 주문과의 병합."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from halfetgetorder import app, config, coupang, order_store, sync
+from halfetgetorder.run_report import RunReport
+
+NOW = datetime(2026, 10, 18, 12)
+
+
+def _order(box_id: str, days_ago: int) -> dict:
+    ordered_at = (NOW - timedelta(days=days_ago)).strftime("%Y-%m-%dT10:00:00")
+    return {"shipmentBoxId": box_id, "orderedAt": ordered_at, "orderItems": []}
+
+
+@pytest.fixture
+def incremental(data_dir, monkeypatch):
+    monkeypatch.setattr(config, "INCREMENTAL_SYNC", True, raising=False)
+
+
+@pytest.fixture
+def synced(incremental):
+    """A(3일 전), B(오늘) 가 저장된 상태에서 1시간 전에 전체 동기화를 마친 것으로."""
+    order_store.save_orders("coupang", [_order("A", 3), _order("B", 0)])
+    sync.mark_synced("coupang", NOW - timedelta(hours=1), True)
+
+
+def test_first_sync_is_full(incremental):
+    _, _, full = sync.plan_window("coupang", NOW)
+    assert full
+
+
+def test_window_starts_at_last_sync(synced):
+    # 저장소에 오래된 주문(A)이 있어도 조회 기간을 넓히지 않는다
+    created_from, created_to, full = sync.plan_window("coupang", NOW)
+    assert not full
+    assert (created_from, created_to) == (str(NOW.date()), str(NOW.date()))
+
+
+def test_full_sync_after_interval(synced):
+    _, _, full = sync.plan_window("coupang", NOW + sync.FULL_SYNC_INTERVAL)
+    assert full
+
+
+def test_merge_drops_orders_missing_from_window(synced):
+    created_from, _, full = sync.plan_window("coupang", NOW)
+
+    # B 는 발송되어 목록에서 빠졌다 → 병합 결과에도 없어야 한다
+    # A 는 조회 기간 앞이라 다음 전체 동기화까지 남는다
+    merged = sync.merge_orders("coupang", [_order("C", 0)], full, NOW, created_from)
+    assert [od["shipmentBoxId"] for od in merged] == ["A", "C"]
+
+
+def test_merge_without_created_from_keeps_previous(synced):
+    merged = sync.merge_orders("coupang", [_order("C", 0)], False, NOW, None)
+    assert [od["shipmentBoxId"] for od in merged] == ["A", "B", "C"]
+
+
+def test_partial_fetch_keeps_unfetched_orders(synced, monkeypatch):
+    monkeypatch.setattr(app, "datetime", type("FixedNow", (datetime,), {"now": classmethod(lambda cls: NOW)}))
+    pages = iter([{"data": [_order("C", 0)], "nextToken": "1"}, None])
+    monkeypatch.setattr(coupang, "_request_ordersheets", lambda *a, **k: next(pages))
+
+    status = {}
+    orders = app._fetch_coupang_orders(RunReport(), status)
+
+    # 두 번째 페이지를 못 받았으니 B 가 빠졌는지 알 수 없다 → 그대로 둔다
+    assert not status["complete"]
+    assert [od["shipmentBoxId"] for od in orders] == ["A", "B", "C"]
@@ -0,0 +1,58 @@
+"""엑셀 서식 템플릿: 캐시한 Workbook 을 복사해서 쓰는지, 기본 템플릿 결과가 코드 기본 서식과 같은지."""
+import os
+
+from benchmarks import synthetic
+from halfetgetorder import io_excel, templates
+
+
+def _label(use_template: bool):
+    catalog = synthetic.goods_catalog()
+    return io_excel.create_label_workbook(
+        synthetic.coupang_orders(20, seed=3),
+        [],
+        godo_base_specs=synthetic.base_specs_map(catalog),
+        use_template=use_template,
+    )
+
+
+def test_open_template_returns_independent_copies(data_dir):
+    first = templates.open_template(templates.LABEL_TEMPLATE)
+    first.active["A1"] = "changed"
+    second = templates.open_template(templates.LABEL_TEMPLATE)
+
+    assert second is not first
+    assert second.active["A1"].value == "플랫폼"
+
+
+def test_label_template_matches_code_defaults(data_dir, sheet_snapshot):
+    _, from_template = _label(use_template=True)
+    _, from_code = _label(use_template=False)
+    assert sheet_snapshot(from_template) == sheet_snapshot(from_code)
+
+
+def test_orders_template_only_from_data_dir(data_dir, sheet_snapshot):
+    assert templates.template_path(templates.ORDERS_TEMPLATE) is None
+
+    templates.write_default_templates()
+    assert templates.template_path(templates.ORDERS_TEMPLATE) == os.path.join(
+        data_dir, "templates", templates.ORDERS_TEMPLATE
+    )
+
+    cp = synthetic.coupang_orders(10, seed=3)
+    _, from_template = io_excel.create_orders_workbook(cp, [])
+    os.remove(templates.template_path(templates.ORDERS_TEMPLATE))
+    _, from_code = io_excel.create_orders_workbook(cp, [])
+    assert sheet_snapshot(from_template) == sheet_snapshot(from_code)
+
+
+def test_template_reloaded_when_file_changes(data_dir):
+    templates.write_default_templates()
+    path = templates.template_path(templates.LABEL_TEMPLATE)
+    assert templates.open_template(templates.LABEL_TEMPLATE).active["A1"].value == "플랫폼"
+
+    wb = templates.open_template(templates.LABEL_TEMPLATE)
+    wb.active["A1"] = "구분"
+    wb.save(path)
+    os.utime(path, (os.path.getatime(path), os.path.getmtime(path) + 10))
+
+    assert templates.open_template(templates.LABEL_TEMPLATE).active["A1"].value == "구분"
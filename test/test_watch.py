@@ -0,0 +1,93 @@
+"""watch: 주문 지문, 바뀌었을 때만 / 끝까지 받았을 때만 엑셀을 다시 만드는지."""
+import pytest
+
+from benchmarks import synthetic
+from halfetgetorder import app, watch
+
+
+class Channels:
+    """app 조회/렌더링 자리에 끼우는 가짜. 조회 결과와 채널별 완료 여부를 바꿔 가며 쓴다."""
+
+    def __init__(self, monkeypatch):
+        self.orders = synthetic.coupang_orders(5, seed=3)
+        self.grouped = [{"orderNo": "1", "sets": []}]
+        self.complete = {"coupang": True, "godo": True}
+        self.render_error = None
+        self.renders = 0
+        self.saved_last_run = 0
+
+        monkeypatch.setattr(app, "_fetch_all_channels", self.fetch)
+        monkeypatch.setattr(app, "_save_last_run", lambda now: self._count("saved_last_run"))
+        monkeypatch.setattr(app, "_start_prefetch", lambda *a, **k: None)
+        monkeypatch.setattr(app, "_render_outputs", self.render)
+        monkeypatch.setattr(app, "_finish", lambda report: None)
+        monkeypatch.setattr(app, "_today", lambda: "20261018")
+
+    def _count(self, name):
+        setattr(self, name, getattr(self, name) + 1)
+
+    def fetch(self, report, complete):
+        complete.update(self.complete)
+        return list(self.orders), list(self.grouped), self.complete["godo"]
+
+    def render(self, *args, **kwargs):
+        self.renders += 1
+        return {"주문수집": {"error": self.render_error}}
+
+    def cycle(self, last):
+        return watch._cycle(last, None, None, None, False)
+
+
+@pytest.fixture
+def channels(monkeypatch):
+    return Channels(monkeypatch)
+
+
+def test_fingerprint():
+    orders = synthetic.coupang_orders(5, seed=3)
+    grouped = [{"orderNo": "1"}, {"orderNo": "2"}]
+
+    assert watch.fingerprint(orders, grouped) == watch.fingerprint([dict(od) for od in orders], list(grouped))
+    # 엑셀 행 순서가 바뀌므로 순서가 달라도 다른 지문
+    assert watch.fingerprint(orders, grouped) != watch.fingerprint(orders, grouped[::-1])
+    assert watch.fingerprint(orders, grouped) != watch.fingerprint(orders[1:], grouped)
+
+
+def test_renders_only_when_orders_change(channels):
+    last = channels.cycle(None)
+    assert channels.renders == 1
+    assert last == ("20261018", watch.fingerprint(channels.orders, channels.grouped))
+
+    assert channels.cycle(last) == last
+    assert channels.renders == 1
+
+    channels.orders = channels.orders[1:]
+    assert channels.cycle(last) != last
+    assert channels.renders == 2
+
+
+def test_new_day_renders_again(channels, monkeypatch):
+    last = channels.cycle(None)
+    monkeypatch.setattr(app, "_today", lambda: "20261019")
+    assert channels.cycle(last) == ("20261019", last[1])
+    assert channels.renders == 2
+
+
+@pytest.mark.parametrize("failed", ["coupang", "godo"])
+def test_incomplete_fetch_keeps_previous_files(channels, failed):
+    last = channels.cycle(None)
+    channels.orders = []
+    channels.complete[failed] = False
+
+    assert channels.cycle(last) == last
+    assert channels.renders == 1
+    # 실행 간격 제한용 마지막 실행 시각은 고도몰을 끝까지 받았을 때만
+    assert channels.saved_last_run == (1 if failed == "godo" else 2)
+
+
+def test_render_error_retries_next_cycle(channels):
+    channels.render_error = "PermissionError"
+    assert channels.cycle(None) is None
+    channels.render_error = None
+    assert channels.cycle(None) is not None
+    assert channels.renders == 2
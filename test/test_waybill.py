@@ -0,0 +1,43 @@
+"""waybill: openpyxl 없이 쓴 송장등록 xlsx 가 io_excel.create_waybill_workbook 결과와 같은지."""
+import openpyxl
+import pytest
+
+from benchmarks import synthetic
+from halfetgetorder import coupang, io_excel, waybill
+
+
+def _orders(n=30):
+    return coupang.normalize_coupang_orders(synthetic.coupang_orders(n, seed=3))
+
+
+@pytest.fixture
+def fixed_today(monkeypatch):
+    """create_waybill_workbook 은 오늘 날짜를 쓰므로 write_waybill_xlsx 와 같은 날짜로 고정."""
+    rows = waybill.waybill_rows
+    monkeypatch.setattr(io_excel, "waybill_rows", lambda orders: rows(orders, "20261018"))
+
+
+@pytest.mark.parametrize("n", [0, 1, 30])
+def test_matches_openpyxl_workbook(tmp_path, sheet_snapshot, fixed_today, n):
+    orders = _orders(n)
+    direct = tmp_path / "direct.xlsx"
+    assert waybill.write_waybill_xlsx(str(direct), orders, today_str="20261018") == n
+    built = tmp_path / "built.xlsx"
+    io_excel.create_waybill_workbook(orders)[0].save(built)
+
+    expected = openpyxl.load_workbook(built).active
+    actual = openpyxl.load_workbook(direct).active
+    assert actual.title == expected.title == waybill.SHEET_TITLE
+    assert actual.sheet_view.zoomScale == expected.sheet_view.zoomScale
+    assert sheet_snapshot(actual) == sheet_snapshot(expected)
+
+
+def test_escapes_text_and_drops_illegal_characters(tmp_path):
+    od = dict(_orders(1)[0], name=" 홍&<길동>\x01 ", addr1="서울 \"강남\"", addr2="")
+    path = tmp_path / "w.xlsx"
+    waybill.write_waybill_xlsx(str(path), [od], today_str="20261018")
+
+    row = [c.value for c in openpyxl.load_workbook(path).active[2]]
+    assert row[1] == "20261018"
+    assert row[2] == " 홍&<길동> "
+    assert row[6] == '서울 "강남"'